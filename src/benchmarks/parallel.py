@@ -0,0 +1,81 @@
+"""
+Parallel search scaling benchmark: nodes/second and time to depth by worker count.
+
+Searches a fixed set of positions to a fixed depth with 1, 2, ... N workers
+(``game.parallel.ParallelSearcher``), each with a fresh shared table, and reports
+total nodes per second and the speed-up in time to depth over one worker.
+Run from the `src` directory: `python -m benchmarks.parallel --workers 8 --depth 6`.
+"""
+
+import argparse
+import multiprocessing
+import time
+
+from game import state
+from game.parallel import ParallelSearcher
+from game.records import self_play
+
+
+def positions(count, plies=2, seed=0):
+    """
+    Args:
+        count (int): Number of positions
+        plies (int): Moves into each self-play game
+        seed (int): Random seed
+
+    Returns:
+        list: (board, side) positions from random games, still running
+    """
+    found = []
+    for moves in self_play(count * 4, seed=seed):
+        board, side = 0, 0
+        for move in moves[:plies]:
+            board, _ = state.apply_move(board, side, move)
+            side = 1 - side
+        if len(moves) > plies and len(found) < count:
+            found.append((board, side))
+    return found
+
+
+def run(workers, targets, depth, capacity):
+    """
+    Search every target position with a number of workers.
+
+    Returns:
+        tuple: (seconds to depth, summed over the positions; total nodes)
+    """
+    elapsed, nodes = 0.0, 0
+    with ParallelSearcher(workers, capacity) as searcher:
+        for board, side in targets:
+            start = time.perf_counter()
+            result = searcher.search(board, side, depth)
+            elapsed += time.perf_counter() - start
+            nodes += result.nodes
+    return elapsed, nodes
+
+
+def main(argv=None):
+    """Print a scaling table from one worker up to the requested count."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count(),
+                        help='largest worker count')
+    parser.add_argument('--depth', type=int, default=6, help='search depth')
+    parser.add_argument('--positions', type=int, default=4, help='positions searched')
+    parser.add_argument('--table-size', type=int, default=1 << 20,
+                        help='shared transposition table entries')
+    args = parser.parse_args(argv)
+
+    targets = positions(args.positions)
+    print(f"{len(targets)} positions to depth {args.depth}, "
+          f"{multiprocessing.cpu_count()} CPUs")
+    print(f"{'workers':>8}{'time':>10}{'nodes':>12}{'nodes/s':>12}{'speed-up':>10}")
+    baseline = None
+    for workers in range(1, args.workers + 1):
+        elapsed, nodes = run(workers, targets, args.depth, args.table_size)
+        baseline = baseline or elapsed
+        print(f"{workers:>8}{elapsed:>9.2f}s{nodes:>12}{nodes / elapsed:>12.0f}"
+              f"{baseline / elapsed:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Frame-time benchmark: replay a recorded input session as fast as possible.
+
+Record a session with `python gobblet.py --record session.jsonl`, then run from the
+`src` directory: `python -m benchmarks.replay session.jsonl`. Every recorded frame
+is replayed through the same event handling and drawing code as the game, under
+SDL's dummy video driver and without the 60 fps cap, and per-frame times are
+reported as percentiles.
+"""
+
+import argparse
+import os
+import time
+
+# Headless: set before pygame is imported
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+# pylint: disable=wrong-import-position
+import pygame
+from game.game import Game
+from ui.recording import read_recording
+from ui.session import GameSession
+# pylint: enable=wrong-import-position
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def replay(frames, size, repeat=1):
+    """
+    Replay recorded frames, timing each one.
+
+    Hints and the computer player are left out, since they depend on background
+    search timing; everything the recorded input touches is replayed.
+
+    Args:
+        frames (list): Frames of pygame events, from ui.recording.read_recording
+        size (tuple): Window (width, height)
+        repeat (int): Times to replay the whole session, each with a fresh game
+
+    Returns:
+        list: Seconds per frame
+    """
+    pygame.init()   # pylint: disable=no-member
+    screen = pygame.display.set_mode(size)
+    times = []
+    for _ in range(repeat):
+        session = GameSession(screen, Game())
+        for events in frames:
+            start = time.perf_counter()
+            for event in events:
+                session.handle_event(event)
+            session.draw()
+            pygame.display.flip()
+            times.append(time.perf_counter() - start)
+    pygame.quit()   # pylint: disable=no-member
+    return times
+
+
+def summarize(times):
+    """
+    Args:
+        times (list): Seconds per frame
+
+    Returns:
+        dict: Frame count, mean and percentile frame times in milliseconds, and FPS
+    """
+    ordered = sorted(times)
+    total = sum(ordered)
+    summary = {'frames': len(ordered), 'mean_ms': total / len(ordered) * 1e3}
+    for pct in PERCENTILES:
+        summary[f'p{pct}_ms'] = ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] * 1e3
+    summary['max_ms'] = ordered[-1] * 1e3
+    summary['fps'] = len(ordered) / total if total > 0 else 0.0
+    return summary
+
+
+def main(argv=None):
+    """Replay a recording and print frame-time statistics."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('recording', help='file written by `gobblet.py --record`')
+    parser.add_argument('--repeat', type=int, default=5, help='times to replay the session')
+    args = parser.parse_args(argv)
+
+    header, frames = read_recording(args.recording)
+    if not frames:
+        parser.error(f"{args.recording} has no frames")
+    summary = summarize(replay(frames, tuple(header['size']), args.repeat))
+    print(f"{summary['frames']} frames, {summary['fps']:.0f} fps")
+    for name, value in summary.items():
+        if name.endswith('_ms'):
+            print(f"  {name[:-3]:<5}{value:8.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
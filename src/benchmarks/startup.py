@@ -0,0 +1,90 @@
+"""
+Startup-time benchmark: fresh interpreter, import, first move.
+
+Measures what a batch worker (headless) or a player (GUI) pays before the first move
+is made, each in a new Python process so nothing is cached between runs.
+Run from the `src` directory: `python -m benchmarks.startup`.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEADLESS = """
+import sys, time
+start = time.perf_counter()
+from game.game import Game
+game = Game()
+game.make_move(piece_idx=0, to_pos=(1, 1))
+print(time.perf_counter() - start, 'pygame' in sys.modules)
+"""
+
+GUI = """
+import sys, time
+start = time.perf_counter()
+import gobblet
+import pygame
+from ui.constants import WHITE
+from ui.renderer import Renderer
+pygame.init()
+screen = pygame.display.set_mode((gobblet.WINDOW_WIDTH, gobblet.WINDOW_HEIGHT))
+renderer = Renderer(screen)
+game = gobblet.Game()
+game.make_move(piece_idx=0, to_pos=(1, 1))
+screen.fill(WHITE)
+renderer.draw_board()
+renderer.draw_board_pieces(game.board)
+pygame.display.flip()
+print(time.perf_counter() - start, 'pygame' in sys.modules)
+pygame.quit()
+"""
+
+
+def run_once(snippet):
+    """
+    Run a snippet in a fresh interpreter.
+
+    Args:
+        snippet (str): Python source printing "<seconds> <pygame loaded>"
+
+    Returns:
+        tuple: (wall seconds including interpreter startup, in-process seconds,
+            whether pygame was imported)
+    """
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy',
+               PYGAME_HIDE_SUPPORT_PROMPT='1')
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, '-c', snippet], cwd=SRC_DIR, env=env,
+        check=True, capture_output=True, text=True
+    ).stdout.split()
+    wall = time.perf_counter() - start
+    return wall, float(output[0]), output[1] == 'True'
+
+
+def main(argv=None):
+    """Run both modes and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='processes per mode')
+    args = parser.parse_args(argv)
+
+    print(f"{'mode':<10}{'wall median':>14}{'wall min':>12}{'import+move':>14}  pygame")
+    for mode, snippet in (('headless', HEADLESS), ('gui', GUI)):
+        runs = [run_once(snippet) for _ in range(args.runs)]
+        walls = [run[0] for run in runs]
+        inner = [run[1] for run in runs]
+        print(
+            f"{mode:<10}{statistics.median(walls) * 1e3:>11.1f} ms"
+            f"{min(walls) * 1e3:>9.1f} ms"
+            f"{statistics.median(inner) * 1e3:>11.1f} ms"
+            f"  {'yes' if runs[0][2] else 'no'}"
+        )
+
+
+if __name__ == '__main__':
+    main()
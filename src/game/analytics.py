@@ -0,0 +1,213 @@
+"""
+Streaming statistics over game archives.
+
+Games flow through a generator pipeline (read, replay, accumulate) so memory stays
+constant however large an archive is; archive shards are summarised in parallel
+processes and the partial summaries merged. Run from `src`:
+`python -m game.analytics ARCHIVE [ARCHIVE ...] --workers 4`.
+"""
+
+import argparse
+import heapq
+import json
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from . import state
+from .records import read_games, replay
+
+OPENING_PLIES = 2
+TOP_OPENINGS = 10
+
+
+class Summary:      # pylint: disable=too-many-instance-attributes
+    """Mergeable running totals for a stream of games."""
+
+    def __init__(self):
+        self.games = 0
+        self.plies = 0
+        self.wins = [0, 0]          # by player index
+        self.first_player_wins = 0
+        self.unfinished = 0
+        self.exposure_losses = 0    # games ended by a move exposing the opponent's line
+        self.gobbles = [0, 0, 0]    # by size of the gobbling piece
+        self.openings = Counter()   # first OPENING_PLIES moves, canonicalised by symmetry
+
+    def add(self, moves):
+        """
+        Account for one game.
+
+        Args:
+            moves (list): Encoded moves
+        """
+        self.games += 1
+        self.plies += len(moves)
+        winner = 0
+        side = 0
+        move = None
+        for board, side, move, winner in replay(moves):
+            src, dst = divmod(move, state.CELLS)
+            cell = (board >> (state.CELL_BITS * dst)) & state.CELL_MASK
+            if state.TOP_SIZE[cell] >= 0:
+                size = (src - state.SUPPLY_BASE if src >= state.SUPPLY_BASE
+                        else state.TOP_SIZE[(board >> (state.CELL_BITS * src)) & state.CELL_MASK])
+                self.gobbles[size] += 1
+
+        if winner:
+            self.wins[winner - 1] += 1
+            if winner == 1:
+                self.first_player_wins += 1
+            if winner != side + 1 and move // state.CELLS < state.SUPPLY_BASE:
+                self.exposure_losses += 1
+        else:
+            self.unfinished += 1
+        if len(moves) >= OPENING_PLIES:
+            self.openings[canonical_opening(moves[:OPENING_PLIES])] += 1
+
+    def merge(self, other):
+        """
+        Add another summary's totals into this one.
+
+        Args:
+            other (Summary): Summary of a disjoint set of games
+        """
+        self.games += other.games
+        self.plies += other.plies
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.first_player_wins += other.first_player_wins
+        self.unfinished += other.unfinished
+        self.exposure_losses += other.exposure_losses
+        self.gobbles = [a + b for a, b in zip(self.gobbles, other.gobbles)]
+        self.openings.update(other.openings)
+
+    def report(self):
+        """
+        Returns:
+            dict: Rates, averages and the most common openings
+        """
+        finished = self.games - self.unfinished
+        per_finished = (lambda count: round(count / finished, 4)) if finished else (lambda _: 0.0)
+        top = heapq.nlargest(TOP_OPENINGS, self.openings.items(), key=lambda item: item[1])
+        return {
+            'games': self.games,
+            'first_player_win_rate': per_finished(self.first_player_wins),
+            'wins': {state.COLORS[idx]: count for idx, count in enumerate(self.wins)},
+            'unfinished': self.unfinished,
+            'average_length': round(self.plies / self.games, 2) if self.games else 0.0,
+            'exposure_losses': self.exposure_losses,
+            'exposure_loss_rate': per_finished(self.exposure_losses),
+            'gobbles_per_game': {
+                name: round(count / self.games, 3) if self.games else 0.0
+                for name, count in zip(('small', 'medium', 'large'), self.gobbles)
+            },
+            'top_openings': [
+                {'moves': describe_opening(opening), 'games': count} for opening, count in top
+            ],
+        }
+
+
+def _inverse(perm):
+    """Map old cell -> new cell for a SYMMETRIES permutation (new cell -> old cell)."""
+    forward = [0] * state.CELLS
+    for new, old in enumerate(perm):
+        forward[old] = new
+    return forward
+
+
+_FORWARD = tuple(_inverse(perm) for perm in state.SYMMETRIES)
+
+
+def canonical_opening(moves):
+    """
+    Identify an opening up to rotation and reflection.
+
+    Args:
+        moves (list): The first few encoded moves
+
+    Returns:
+        tuple: The smallest image of the move sequence over the board symmetries
+    """
+    images = []
+    for forward in _FORWARD:
+        image = []
+        for move in moves:
+            src, dst = divmod(move, state.CELLS)
+            src = src if src >= state.SUPPLY_BASE else forward[src]
+            image.append(state.encode_move(src, forward[dst]))
+        images.append(tuple(image))
+    return min(images)
+
+
+def describe_opening(opening):
+    """
+    Args:
+        opening (tuple): Encoded moves
+
+    Returns:
+        str: Readable moves, in state.move_name notation
+    """
+    return ' '.join(state.move_name(move) for move in opening)
+
+
+def summarize(games):
+    """
+    Summarise a stream of games.
+
+    Args:
+        games (iterable): Move lists
+
+    Returns:
+        Summary: Totals for the stream
+    """
+    summary = Summary()
+    for moves in games:
+        summary.add(moves)
+    return summary
+
+
+def summarize_archive(path):
+    """
+    Summarise one archive file; the unit of work for the process pool.
+
+    Args:
+        path (str): Archive file
+
+    Returns:
+        Summary: Totals for the archive
+    """
+    return summarize(read_games(path))
+
+
+def analyze(paths, workers=None):
+    """
+    Summarise archive shards in parallel and merge the results.
+
+    Args:
+        paths (list): Archive files
+        workers (int, optional): Worker processes; 1 runs everything in this process
+
+    Returns:
+        Summary: Totals over all archives
+    """
+    total = Summary()
+    if workers == 1 or len(paths) <= 1:
+        for path in paths:
+            total.merge(summarize_archive(path))
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for summary in pool.map(summarize_archive, paths):
+            total.merge(summary)
+    return total
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Summarise recorded games.')
+    parser.add_argument('archives', nargs='+', help='game archives (.txt or .txt.gz)')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+    print(json.dumps(analyze(args.archives, args.workers).report(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,9 +2,13 @@
 This module contains the Board class, which represents the 3x3 game board for Gobblet Jr.
 """
 
+from .instrument import timed
+
 class Board:
     """Represents the 3x3 game board for Gobblet Jr."""
 
+    __slots__ = ('grid',)
+
     def __init__(self):
         """Initialize an empty 3x3 board."""
         self.grid = [[None for _ in range(3)] for _ in range(3)]
@@ -68,6 +72,7 @@ class Board:
 
         return False
 
+    @timed('Board.check_winner')
     def check_winner(self):
         """
         Check if there's a winner.
@@ -0,0 +1,317 @@
+"""
+Position datasets in memory-mapped NumPy shards.
+
+Positions are streamed out of games (self-play or archives, see ``game.records``),
+deduplicated by canonical position key, encoded as fixed-width feature vectors with
+an outcome label, and written to ``.npy`` shards through ``numpy.memmap``. Readers
+map the shards too, so training jobs can walk hundreds of millions of positions
+without loading them into RAM or rebuilding ``Game`` objects.
+
+Each shard ``positions-NNNNN`` is three files with the same row count:
+``.features.npy`` (rows, FEATURES) uint8, ``.labels.npy`` (rows,) int8 outcome for the
+side to move (+1 win, -1 loss, 0 unfinished) and ``.keys.npy`` (rows,) int64
+canonical position keys.
+"""
+
+import argparse
+import glob
+import os
+
+import numpy as np
+
+from . import state
+from .records import read_games, replay, self_play
+from .vecenv import observations, OBS_PLANES
+
+FEATURES = OBS_PLANES * state.CELLS
+SHARD_PREFIX = 'positions-'
+COLUMNS = (('features', np.uint8, (FEATURES,)), ('labels', np.int8, ()), ('keys', np.int64, ()))
+
+# Positions remembered for deduplication, about 68 bytes each (some 285 MB in all)
+MAX_SEEN = 1 << 22
+
+_CELL_SHIFTS = np.arange(state.CELLS, dtype=np.int64) * state.CELL_BITS
+
+
+def encode_features(boards, sides):
+    """
+    Encode positions as feature vectors.
+
+    Args:
+        boards (array-like): Packed boards
+        sides (array-like): Player index to move for each board
+
+    Returns:
+        ndarray: (N, FEATURES) uint8, the flattened vecenv observation planes
+    """
+    boards = np.asarray(boards, dtype=np.int64)
+    cells = ((boards[:, None] >> _CELL_SHIFTS) & state.CELL_MASK).astype(np.uint8)
+    obs = observations(cells, np.asarray(sides, dtype=np.int8))
+    return obs.astype(np.uint8).reshape(len(boards), FEATURES)
+
+
+def _shard_path(directory, index, column):
+    """File name of one column of one shard."""
+    return os.path.join(directory, f'{SHARD_PREFIX}{index:05d}.{column}.npy')
+
+
+class ShardWriter:
+    """Appends rows to memory-mapped shards, starting a new shard when one fills up."""
+
+    def __init__(self, directory, shard_size=1 << 20):
+        """
+        Args:
+            directory (str): Output directory, created if missing
+            shard_size (int): Rows per shard
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.shard_size = shard_size
+        self.shard_index = len(glob.glob(os.path.join(directory, SHARD_PREFIX + '*.keys.npy')))
+        self.rows = 0
+        self._arrays = None
+
+    def _open_shard(self):
+        """Allocate the next shard at full size."""
+        self._arrays = {
+            column: np.lib.format.open_memmap(
+                _shard_path(self.directory, self.shard_index, column),
+                mode='w+', dtype=dtype, shape=(self.shard_size,) + shape
+            )
+            for column, dtype, shape in COLUMNS
+        }
+        self.rows = 0
+
+    def _close_shard(self):
+        """Flush the current shard, trimming it to the rows actually written."""
+        arrays, self._arrays = self._arrays, None
+        for column, dtype, shape in COLUMNS:
+            # Taken out of the dict so `del full` drops the last reference to the map,
+            # which Windows requires before the file is replaced or removed
+            full = arrays.pop(column)
+            path = _shard_path(self.directory, self.shard_index, column)
+            if self.rows == self.shard_size:
+                full.flush()
+            elif self.rows:
+                trimmed = np.lib.format.open_memmap(
+                    path + '.tmp', mode='w+', dtype=dtype, shape=(self.rows,) + shape
+                )
+                trimmed[:] = full[:self.rows]
+                trimmed.flush()
+                del trimmed
+                del full
+                os.replace(path + '.tmp', path)
+            else:
+                del full
+                os.remove(path)
+        if self.rows:
+            self.shard_index += 1
+
+    def append(self, features, labels, keys):
+        """
+        Append rows.
+
+        Args:
+            features (ndarray): (N, FEATURES) uint8
+            labels (ndarray): (N,) int8
+            keys (ndarray): (N,) int64
+        """
+        start = 0
+        while start < len(keys):
+            if self._arrays is None:
+                self._open_shard()
+            count = min(len(keys) - start, self.shard_size - self.rows)
+            end = self.rows + count
+            self._arrays['features'][self.rows:end] = features[start:start + count]
+            self._arrays['labels'][self.rows:end] = labels[start:start + count]
+            self._arrays['keys'][self.rows:end] = keys[start:start + count]
+            self.rows = end
+            start += count
+            if self.rows == self.shard_size:
+                self._close_shard()
+
+    def close(self):
+        """Finish the last shard."""
+        if self._arrays is not None:
+            self._close_shard()
+
+
+def labelled_positions(games, dedupe=True, totals=None, max_seen=MAX_SEEN):
+    """
+    Every position where a move was made, labelled with the final result for the
+    player to move there.
+
+    With dedupe, a position keeps the label of the first game that reached it; later
+    games through it do not change it. Export with dedupe=False to keep one row per
+    occurrence and average the labels by key instead. Only the first max_seen
+    distinct positions are remembered, which bounds memory on huge exports: past
+    that, positions not yet remembered may be yielded more than once.
+
+    Args:
+        games (iterable): Move lists, e.g. from records.read_games or records.self_play
+        dedupe (bool): Skip positions seen before, up to rotation and reflection
+        totals (dict, optional): 'games' and 'positions' counters to update
+        max_seen (int): Most positions remembered for dedupe
+
+    Yields:
+        tuple: (board, side, label, canonical key), label being +1 win, -1 loss or
+            0 unfinished for the side to move
+    """
+    seen = set()
+    totals = totals if totals is not None else {'games': 0, 'positions': 0}
+    for moves in games:
+        totals['games'] += 1
+        positions = []
+        winner = 0
+        for board, side, _, winner in replay(moves):
+            positions.append((board, side))
+        for board, side in positions:
+            totals['positions'] += 1
+            key = state.canonical_key(board, side)
+            if dedupe:
+                if key in seen:
+                    continue
+                if len(seen) < max_seen:
+                    seen.add(key)
+            yield board, side, 0 if not winner else (1 if winner == side + 1 else -1), key
+
+
+def export_positions(games, directory, shard_size=1 << 20, dedupe=True, batch_size=4096):
+    """
+    Write the positions of a stream of games to memory-mapped shards.
+
+    Every position where a move was made is kept, labelled with the final result for
+    the player to move there. With dedupe, only the first occurrence of a position
+    (up to rotation and reflection) is written, with that game's label; see
+    labelled_positions for the memory bound.
+
+    Args:
+        games (iterable): Move lists, e.g. from records.read_games or records.self_play
+        directory (str): Output directory
+        shard_size (int): Rows per shard
+        dedupe (bool): Skip positions already written
+        batch_size (int): Positions encoded per NumPy call
+
+    Returns:
+        dict: Counts of games, positions seen and rows written
+    """
+    writer = ShardWriter(directory, shard_size)
+    batch = []      # (board, side, label, key) rows
+    totals = {'games': 0, 'positions': 0, 'written': 0}
+
+    def flush():
+        """Encode and write the buffered positions."""
+        if batch:
+            boards, sides, labels, keys = zip(*batch)
+            writer.append(
+                encode_features(boards, sides),
+                np.array(labels, dtype=np.int8),
+                np.array(keys, dtype=np.int64),
+            )
+            totals['written'] += len(batch)
+            batch.clear()
+
+    for row in labelled_positions(games, dedupe, totals):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+    writer.close()
+    return totals
+
+
+class PositionDataset:
+    """Read-only, memory-mapped view over the shards in a directory."""
+
+    def __init__(self, directory):
+        """
+        Args:
+            directory (str): Directory written by export_positions
+        """
+        paths = sorted(glob.glob(os.path.join(directory, SHARD_PREFIX + '*.keys.npy')))
+        self.shards = []
+        for keys_path in paths:
+            base = keys_path[:-len('.keys.npy')]
+            self.shards.append({
+                column: np.load(f'{base}.{column}.npy', mmap_mode='r')
+                for column, _, _ in COLUMNS
+            })
+        self._offsets = np.cumsum([0] + [len(shard['keys']) for shard in self.shards])
+
+    def __len__(self):
+        """Total rows across all shards."""
+        return int(self._offsets[-1])
+
+    def __getitem__(self, index):
+        """
+        Args:
+            index (int): Row number across all shards
+
+        Returns:
+            tuple: (features, label)
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        shard = int(np.searchsorted(self._offsets, index, side='right')) - 1
+        row = index - self._offsets[shard]
+        return self.shards[shard]['features'][row], int(self.shards[shard]['labels'][row])
+
+    def batches(self, batch_size, shuffle=False, seed=None):
+        """
+        Iterate over the rows in batches, touching only the pages each batch needs.
+
+        Shuffling permutes the order of batch-sized blocks and the rows within each
+        block, which keeps reads sequential within a block.
+
+        Args:
+            batch_size (int): Rows per batch (the last batch of a shard may be shorter)
+            shuffle (bool): Visit blocks and rows in random order
+            seed (int, optional): Random seed for shuffling
+
+        Yields:
+            tuple: (features (B, FEATURES) uint8, labels (B,) int8)
+        """
+        rng = np.random.default_rng(seed)
+        blocks = [
+            (shard, start)
+            for shard in range(len(self.shards))
+            for start in range(0, len(self.shards[shard]['keys']), batch_size)
+        ]
+        if shuffle:
+            rng.shuffle(blocks)
+        for shard, start in blocks:
+            features = np.asarray(self.shards[shard]['features'][start:start + batch_size])
+            labels = np.asarray(self.shards[shard]['labels'][start:start + batch_size])
+            if shuffle:
+                order = rng.permutation(len(labels))
+                features, labels = features[order], labels[order]
+            yield features, labels
+
+
+def main(argv=None):
+    """Command line entry point: `python -m game.dataset OUT_DIR ...` from `src`."""
+    parser = argparse.ArgumentParser(description='Export positions to memory-mapped shards.')
+    parser.add_argument('out', help='output directory')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--self-play', type=int, metavar='N', help='generate N random games')
+    source.add_argument('--games', nargs='+', metavar='ARCHIVE', help='game archives to read')
+    parser.add_argument('--seed', type=int, help='self-play random seed')
+    parser.add_argument('--shard-size', type=int, default=1 << 20, help='rows per shard')
+    parser.add_argument('--keep-duplicates', action='store_true', help='do not deduplicate')
+    args = parser.parse_args(argv)
+
+    if args.self_play is not None:
+        games = self_play(args.self_play, seed=args.seed)
+    else:
+        games = (moves for path in args.games for moves in read_games(path))
+    totals = export_positions(
+        games, args.out, shard_size=args.shard_size, dedupe=not args.keep_duplicates
+    )
+    print(f"{totals['games']} games, {totals['positions']} positions, "
+          f"{totals['written']} rows written to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,257 @@
+"""
+Resident engine speaking a line-based protocol on stdin/stdout.
+
+Starting Python and importing the package costs far more than a typical search, so
+batch analysis keeps one engine process alive and feeds it positions back to back.
+The searcher and its transposition table live as long as the process, so related
+positions (successive moves of a game, puzzles from one opening) reuse earlier work.
+
+Commands, one per line (replies are a single line each, flushed at once):
+
+    isready                              -> readyok
+    newgame                              -> ok         (clears the table)
+    position start [moves M...]          -> ok
+    position key K [moves M...]          -> ok         (K: position key, see game.state)
+    go [depth D] [movetime MS]           -> bestmove M score S depth D nodes N nps R time MS
+    quit                                    (exits; end of input does too)
+
+A ``go`` with neither limit searches to the default depth within the default move
+time, so a bare ``go`` always returns.
+
+Moves are in ``state.move_name`` notation ('L@1,1', '0,0>2,2') or encoded numbers;
+``bestmove`` replies use the notation, or ``none`` if the game is over. A bad command
+gets ``error <message>``, as does a command that fails unexpectedly, and the engine
+carries on with the next line.
+
+Run from `src`: `python -m game.engine [--depth 6] [--movetime MS] [--table-size N]`.
+``EngineClient`` drives such a process from Python.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from . import state
+from .search import Searcher
+from .ttable import TranspositionTable
+
+DEFAULT_DEPTH = 6
+DEFAULT_MOVETIME = 5.0  # Seconds for 'go' with neither depth nor movetime
+
+
+class Engine:     # pylint: disable=too-many-instance-attributes
+    """Protocol state: the current position and the long-lived searcher."""
+
+    def __init__(self, searcher=None, out=None, default_depth=DEFAULT_DEPTH,
+                 default_movetime=DEFAULT_MOVETIME):
+        """
+        Args:
+            searcher (Searcher, optional): Searcher to keep warm between requests
+            out (file, optional): Where replies are written (stdout by default)
+            default_depth (int): Depth for 'go' without a depth
+            default_movetime (float): Seconds for 'go' with neither depth nor movetime
+        """
+        self.searcher = searcher or Searcher()
+        self.out = out or sys.stdout
+        self.default_depth = default_depth
+        self.default_movetime = default_movetime
+        self.board, self.side, self.winner = 0, 0, 0
+        self._commands = {
+            'isready': self._cmd_isready,
+            'newgame': self._cmd_newgame,
+            'position': self._cmd_position,
+            'go': self._cmd_go,
+        }
+
+    def reply(self, line):
+        """Write one reply line and flush it, so a client can read it immediately."""
+        self.out.write(line + '\n')
+        self.out.flush()
+
+    def handle(self, line):
+        """
+        Execute one command line.
+
+        Args:
+            line (str): Command
+
+        Returns:
+            bool: False once the engine should exit
+        """
+        words = line.split()
+        if not words:
+            return True
+        command, args = words[0], words[1:]
+        if command == 'quit':
+            return False
+        handler = self._commands.get(command)
+        if handler is None:
+            self.reply(f"error unknown command {command!r}")
+            return True
+        try:
+            self.reply(handler(args))
+        except ValueError as error:
+            self.reply(f"error {error}")
+        except Exception as error:     # pylint: disable=broad-exception-caught
+            # A bug or a failing searcher costs one request, not the resident engine
+            self.reply(f"error {command} failed: {type(error).__name__}: {error}")
+        return True
+
+    def run(self, lines):
+        """
+        Execute commands until 'quit' or the end of input.
+
+        Args:
+            lines (iterable): Command lines, e.g. sys.stdin
+        """
+        for line in lines:
+            if not self.handle(line):
+                break
+
+    def _cmd_isready(self, _args):
+        """Answer once every earlier command is done."""
+        return 'readyok'
+
+    def _cmd_newgame(self, _args):
+        """Forget earlier searches."""
+        self.searcher.table.clear()
+        return 'ok'
+
+    def _cmd_position(self, args):
+        """Set the position: 'start' or 'key K', then optionally 'moves ...'."""
+        if args[:1] == ['start']:
+            board, side, rest = 0, 0, args[1:]
+        elif args[:1] == ['key'] and len(args) > 1 and args[1].isdigit():
+            key = int(args[1])
+            if key >> (state.CELLS * state.CELL_BITS + 1):
+                raise ValueError(f"not a position key: {args[1]}")
+            board, side, rest = key >> 1, key & 1, args[2:]
+        else:
+            raise ValueError("expected 'position start' or 'position key K'")
+        if rest and rest[0] != 'moves':
+            raise ValueError(f"expected 'moves', got {rest[0]!r}")
+
+        winner = state.winner_of(state.cells_of(board))
+        for text in rest[1:]:
+            move = state.parse_move(text)
+            if winner or not state.is_legal(board, side, move):
+                raise ValueError(f"illegal move {text}")
+            board, winner = state.apply_move(board, side, move)
+            # As in Game, a move that exposes the opponent's line ends the game at once
+            if not winner or winner == side + 1:
+                side = 1 - side
+        self.board, self.side, self.winner = board, side, winner
+        return 'ok'
+
+    def _cmd_go(self, args):
+        """Search the current position: 'depth D' and/or 'movetime MS'."""
+        options = dict(zip(args[::2], args[1::2]))
+        unknown = set(options) - {'depth', 'movetime'}
+        if unknown or len(args) % 2:
+            raise ValueError("expected 'go [depth D] [movetime MS]'")
+        try:
+            depth = int(options.get('depth', self.default_depth))
+            movetime = float(options['movetime']) / 1000 if 'movetime' in options else None
+        except ValueError:
+            raise ValueError("depth and movetime must be numbers") from None
+        if not options:
+            movetime = self.default_movetime
+
+        if self.winner:
+            return 'bestmove none'
+        result = self.searcher.search(self.board, self.side, depth, movetime)
+        if result.move is None:
+            return 'bestmove none'
+        return (f"bestmove {state.move_name(result.move)} score {result.score} "
+                f"depth {result.depth} nodes {result.nodes} "
+                f"nps {result.nodes_per_second:.0f} time {result.elapsed * 1000:.0f}")
+
+
+class EngineClient:
+    """Runs an engine process and sends it requests."""
+
+    def __init__(self, args=(), python=None):
+        """
+        Args:
+            args (sequence): Extra command line arguments for the engine
+            python (str, optional): Interpreter to run (this one by default)
+        """
+        src = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.process = subprocess.Popen(     # pylint: disable=consider-using-with
+            [python or sys.executable, '-m', 'game.engine', *args], cwd=src,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1
+        )
+
+    def request(self, line):
+        """
+        Args:
+            line (str): Command
+
+        Returns:
+            str: The engine's reply line
+        """
+        self.process.stdin.write(line + '\n')
+        self.process.stdin.flush()
+        return self.process.stdout.readline().rstrip('\n')
+
+    def analyse(self, moves=(), key=None, depth=None, movetime=None):
+        """
+        Set a position and search it.
+
+        Args:
+            moves (sequence): Moves from the start (or from key), encoded or in notation
+            key (int, optional): Position key to start from instead of the start
+            depth (int, optional): Search depth
+            movetime (float, optional): Milliseconds to search for
+
+        Returns:
+            dict: Reply fields, e.g. {'bestmove': 'L@1,1', 'score': 3, ...}, with
+                numbers converted
+
+        Raises:
+            ValueError: If the engine reports an error
+        """
+        position = ['position', 'start' if key is None else f"key {key}"]
+        if moves:
+            position += ['moves', *map(str, moves)]
+        go = ['go']
+        if depth is not None:
+            go += ['depth', str(depth)]
+        if movetime is not None:
+            go += ['movetime', str(movetime)]
+        for line in (' '.join(position), ' '.join(go)):
+            reply = self.request(line)
+            if reply.startswith('error'):
+                raise ValueError(reply[len('error '):])
+        words = reply.split()
+        return {name: value if name == 'bestmove' else float(value) if '.' in value
+                else int(value) for name, value in zip(words[::2], words[1::2])}
+
+    def close(self):
+        """Ask the engine to quit and wait for it."""
+        if self.process.poll() is None:
+            self.process.stdin.write('quit\n')
+            self.process.stdin.close()
+            self.process.wait()
+        self.process.stdout.close()
+
+
+def main(argv=None):
+    """Command line entry point: serve commands from stdin until quit."""
+    parser = argparse.ArgumentParser(description='Resident engine on a stdin/stdout protocol.')
+    parser.add_argument('--depth', type=int, default=DEFAULT_DEPTH,
+                        help="depth for 'go' without a depth")
+    parser.add_argument('--movetime', type=float, default=DEFAULT_MOVETIME * 1000,
+                        help="milliseconds for 'go' with neither depth nor movetime")
+    parser.add_argument('--table-size', type=int, default=1 << 18,
+                        help='transposition table entries')
+    args = parser.parse_args(argv)
+
+    searcher = Searcher(table=TranspositionTable(args.table_size))
+    Engine(searcher, default_depth=args.depth,
+           default_movetime=args.movetime / 1000).run(sys.stdin)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""
+Table-driven static evaluation.
+
+Each cell is first reduced to a class relative to the side to move: empty, or the
+visible piece's owner (mine/theirs) and size, and whether it covers a piece of the
+other colour (a hidden piece that a move would expose). A line's value is then one
+table read indexed by its three cell classes, and each cell adds a value for the
+pieces stacked in it; since a player's supply is whatever is not on the board, the
+supply sizes are priced through the pieces placed. An evaluation is nine cell reads
+and eight line reads.
+
+The tables are built from a weight vector over ``FEATURES``: one weight per line
+pattern (the multiset of three cell classes, so the order of cells in a line does
+not matter), one per piece placed by owner and size, and a tempo bonus for the side
+to move. Weights are in logit units of the side to move winning, as fitted by
+``game.tune``, and scaled to integer scores. The default weights reproduce
+``search.line_score``.
+"""
+
+import json
+from functools import lru_cache
+from itertools import combinations_with_replacement
+
+from . import state
+
+EMPTY_CLASS = 0
+CELL_CLASSES = 13   # Empty, then (mine, theirs) x size x (covers the other colour or not)
+SCALE = 100         # Score points per logit unit
+MAX_SCORE = 800     # Evaluations stay clear of search.MATE_BOUND
+WEIGHTS_VERSION = 1
+
+
+def cell_class(code, side):
+    """
+    Args:
+        code (int): Cell code
+        side (int): Player index the class is relative to
+
+    Returns:
+        int: EMPTY_CLASS, or 1 + 6 * (0 mine / 1 theirs) + 2 * top size + covers
+    """
+    size = state.TOP_SIZE[code]
+    if size < 0:
+        return EMPTY_CLASS
+    theirs = state.OWNER[code] != side + 1
+    covers = any(
+        (code >> (2 * below)) & 3 not in (0, state.OWNER[code]) for below in range(size)
+    )
+    return 1 + 6 * theirs + 2 * size + covers
+
+
+PATTERNS = tuple(combinations_with_replacement(range(CELL_CLASSES), 3))
+_PATTERN_IDS = {pattern: idx for idx, pattern in enumerate(PATTERNS)}
+
+# Feature layout: line patterns, then pieces placed (mine S/M/L, theirs S/M/L), then tempo
+PIECE_FEATURES = len(PATTERNS)
+TEMPO_FEATURE = PIECE_FEATURES + 6
+FEATURES = TEMPO_FEATURE + 1
+
+# (side, code) -> class, and ordered class triple -> pattern id
+CLASSES = tuple(tuple(cell_class(code, side) for code in range(64)) for side in (0, 1))
+LINE_PATTERN = tuple(
+    _PATTERN_IDS[tuple(sorted((a, b, c)))]
+    for a in range(CELL_CLASSES) for b in range(CELL_CLASSES) for c in range(CELL_CLASSES)
+)
+
+
+def placed_pieces(code, side):
+    """
+    Args:
+        code (int): Cell code
+        side (int): Player index the pieces are counted for
+
+    Returns:
+        tuple: Pieces in the cell as (mine S, M, L, theirs S, M, L) counts
+    """
+    return tuple(
+        int((code >> (2 * size)) & 3 == (side + 1 if owner == 0 else 2 - side))
+        for owner in (0, 1) for size in range(3)
+    )
+
+
+def features(board, side):
+    """
+    Feature counts of a position (the reference for game.tune's vectorized version).
+
+    Args:
+        board (int): Packed board
+        side (int): Player index to move
+
+    Returns:
+        list: FEATURES counts
+    """
+    counts = [0] * FEATURES
+    classes = [CLASSES[side][code] for code in state.cells_of(board)]
+    for a, b, c in state.LINES:
+        counts[LINE_PATTERN[(classes[a] * CELL_CLASSES + classes[b]) * CELL_CLASSES
+                            + classes[c]]] += 1
+    for code in state.cells_of(board):
+        for idx, count in enumerate(placed_pieces(code, side)):
+            counts[PIECE_FEATURES + idx] += count
+    counts[TEMPO_FEATURE] = 1
+    return counts
+
+
+def default_weights():
+    """
+    Weights reproducing search.line_score: an open line scores the square of the
+    pieces in it, for or against, in score points.
+
+    Returns:
+        list: FEATURES weights
+    """
+    weights = [0.0] * FEATURES
+    for idx, pattern in enumerate(PATTERNS):
+        mine = sum(1 for cls in pattern if 1 <= cls <= 6)
+        theirs = sum(1 for cls in pattern if cls > 6)
+        if not theirs:
+            weights[idx] = mine * mine / SCALE
+        elif not mine:
+            weights[idx] = -theirs * theirs / SCALE
+    return weights
+
+
+@lru_cache(maxsize=None)
+def default_evaluator():
+    """
+    Returns:
+        TableEvaluator: Shared evaluator with the default weights
+    """
+    return TableEvaluator()
+
+
+class TableEvaluator:
+    """Evaluates positions with precomputed cell and line tables."""
+
+    def __init__(self, weights=None, scale=SCALE):
+        """
+        Args:
+            weights (sequence, optional): FEATURES weights in logit units
+                (default_weights() if None)
+            scale (float): Score points per logit unit
+        """
+        self.weights = list(default_weights() if weights is None else weights)
+        if len(self.weights) != FEATURES:
+            raise ValueError(f"expected {FEATURES} weights, got {len(self.weights)}")
+        self.scale = scale
+        points = [weight * scale for weight in self.weights]
+        # Line value by ordered class triple; class tables already depend on the side
+        self._lines = tuple(round(points[pattern]) for pattern in LINE_PATTERN)
+        # Cell value (pieces placed, so also the supply) by side and code
+        self._cells = tuple(
+            tuple(
+                round(sum(points[PIECE_FEATURES + idx] * count
+                          for idx, count in enumerate(placed_pieces(code, side))))
+                for code in range(64)
+            )
+            for side in (0, 1)
+        )
+        self._tempo = round(points[TEMPO_FEATURE])
+
+    # pylint: disable-next=too-many-locals
+    def __call__(self, board, side):
+        """
+        Args:
+            board (int): Packed board
+            side (int): Player index to score for (the side to move)
+
+        Returns:
+            int: Score from side's point of view, within +-MAX_SCORE
+        """
+        classes, values, lines = CLASSES[side], self._cells[side], self._lines
+        # Unrolled over the cells and state.LINES (rows, columns, diagonals)
+        k0, k1, k2 = board & 63, (board >> 6) & 63, (board >> 12) & 63
+        k3, k4, k5 = (board >> 18) & 63, (board >> 24) & 63, (board >> 30) & 63
+        k6, k7, k8 = (board >> 36) & 63, (board >> 42) & 63, (board >> 48) & 63
+        c0, c1, c2 = classes[k0], classes[k1], classes[k2]
+        c3, c4, c5 = classes[k3], classes[k4], classes[k5]
+        c6, c7, c8 = classes[k6], classes[k7], classes[k8]
+        score = (self._tempo + values[k0] + values[k1] + values[k2] + values[k3] + values[k4]
+                 + values[k5] + values[k6] + values[k7] + values[k8]
+                 + lines[(c0 * 13 + c1) * 13 + c2] + lines[(c3 * 13 + c4) * 13 + c5]
+                 + lines[(c6 * 13 + c7) * 13 + c8] + lines[(c0 * 13 + c3) * 13 + c6]
+                 + lines[(c1 * 13 + c4) * 13 + c7] + lines[(c2 * 13 + c5) * 13 + c8]
+                 + lines[(c0 * 13 + c4) * 13 + c8] + lines[(c2 * 13 + c4) * 13 + c6])
+        return max(-MAX_SCORE, min(MAX_SCORE, score))
+
+    def save(self, path):
+        """Write the weights to a JSON file."""
+        with open(path, 'w', encoding='utf-8') as out:
+            json.dump({'version': WEIGHTS_VERSION, 'scale': self.scale,
+                       'weights': self.weights}, out)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Args:
+            path (str): JSON file written by save or game.tune
+
+        Returns:
+            TableEvaluator: Evaluator with the saved weights
+
+        Raises:
+            ValueError: If the file is from another version or has the wrong size
+        """
+        with open(path, encoding='utf-8') as source:
+            saved = json.load(source)
+        if saved.get('version') != WEIGHTS_VERSION:
+            raise ValueError(f"unsupported weights version {saved.get('version')}")
+        return cls(saved['weights'], saved['scale'])
@@ -0,0 +1,138 @@
+"""
+Memory footprint of games, measured with tracemalloc.
+
+Servers are sized by memory per hosted game, so this reports the bytes allocated per
+``Game`` (fresh, after a number of moves, and after long play with many rewinds),
+per ``moves_history`` entry, per ``Piece`` and per ``Player``. Each figure is the
+traced allocation of many objects divided by their number, not counting the list
+holding them. ``tests/test_footprint.py`` holds these figures under fixed limits.
+
+Run from `src`: `python -m game.footprint [--games 500] [--moves 40]`.
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+
+from . import state
+from .game import Game
+from .piece import Piece, Size
+from .player import Player
+from .records import self_play
+
+
+def allocated_per_object(factory, count):
+    """
+    Average bytes allocated per object that stays alive.
+
+    Args:
+        factory (callable): Creates one object (and may work on it)
+        count (int): Objects to create
+
+    Returns:
+        float: Traced bytes per object, excluding the list that keeps them alive
+    """
+    gc.collect()
+    objects = [None] * count
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for idx in range(count):
+            objects[idx] = factory()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+
+def _playing(lines, actions, rewind_rate=0.0, seed=0):
+    """
+    Factory of Games that play a recorded line, optionally with random rewinds.
+
+    Args:
+        lines (iterable): Move lists, one per Game created
+        actions (int): Moves and rewinds per Game
+        rewind_rate (float): Chance of a rewind instead of the next move
+        seed (int): Random seed for the rewinds
+
+    Returns:
+        callable: Creates the next Game
+    """
+    rng = random.Random(seed)
+    lines = iter(lines)
+
+    def factory():
+        """A fresh Game after its actions; stops early at the end of its line."""
+        game = Game()
+        line = next(lines)
+        ply = 0
+        for _ in range(actions):
+            if ply and rng.random() < rewind_rate:
+                game.rewind()
+                ply -= 1
+            elif ply < len(line) and game.make_move(**state.move_to_kwargs(game, line[ply])):
+                ply += 1
+            else:
+                break
+        return game
+
+    return factory
+
+
+def measure(games=500, moves=40, long_moves=400, rewind_rate=0.3, seed=0):
+    """
+    Measure the footprint figures.
+
+    Args:
+        games (int): Objects measured per figure
+        moves (int): Moves played for the 'game_after_moves' figure
+        long_moves (int): Moves and rewinds for the 'game_after_long_play' figure
+        rewind_rate (float): Chance of a rewind instead of a move in long play
+        seed (int): Random seed
+
+    Returns:
+        dict: Bytes per 'piece', 'player', 'game_fresh', 'game_after_moves',
+            'game_after_long_play', 'game_after_random_play' and 'history_entry'
+    """
+    # Two large pieces shuffled back and forth: a game that never ends, for long play
+    shuffle = [state.encode_move(state.SUPPLY_BASE + Size.LARGE, 0),
+               state.encode_move(state.SUPPLY_BASE + Size.LARGE, 8)]
+    shuffle += [state.encode_move(0, 1), state.encode_move(8, 7),
+                state.encode_move(1, 0), state.encode_move(7, 8)] * (long_moves // 4)
+    endless = [shuffle] * games
+
+    short = allocated_per_object(_playing(endless, moves), games)
+    longer = allocated_per_object(_playing(endless, moves * 4), games)
+    return {
+        'piece': allocated_per_object(lambda: Piece(Size.SMALL, 'red'), games * 10),
+        'player': allocated_per_object(lambda: Player('red'), games),
+        'game_fresh': allocated_per_object(Game, games),
+        'game_after_moves': short,
+        'game_after_long_play': allocated_per_object(
+            _playing(endless, long_moves, rewind_rate, seed), games),
+        'game_after_random_play': allocated_per_object(
+            _playing(self_play(games, seed=seed), moves), games),
+        'history_entry': (longer - short) / (moves * 3),
+    }
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Report memory per game object.')
+    parser.add_argument('--games', type=int, default=500, help='objects per figure')
+    parser.add_argument('--moves', type=int, default=40, help='moves per game')
+    parser.add_argument('--long-moves', type=int, default=400,
+                        help='moves and rewinds in long play')
+    args = parser.parse_args(argv)
+
+    figures = measure(args.games, args.moves, args.long_moves)
+    print(f"Python {sys.version.split()[0]}, {args.games} objects per figure")
+    for name, value in figures.items():
+        print(f"  {name:<24}{value:10.1f} bytes")
+
+
+if __name__ == '__main__':
+    main()
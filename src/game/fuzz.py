@@ -0,0 +1,366 @@
+"""
+Differential fuzzing of alternative engines against the reference Game.
+
+Random games are played on the reference ``Game`` and on an alternative engine in
+lockstep: every action (a move, legal or not, or a rewind) goes to both, and their
+answers and resulting states (packed board, side to move, winner and both supplies)
+must agree. Games are seeded by their index, so any divergence can be replayed; it is
+then shrunk to a short action list that still diverges.
+
+Run from `src`: `python -m game.fuzz --games 1000000 --workers 8 [--engine state]`.
+"""
+
+import argparse
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from . import state
+from .game import Game
+from .history import History
+from .position import Position
+
+REWIND = -1     # Action code for a rewind; moves are encoded moves (0 to NUM_MOVES-1)
+
+
+@dataclass(frozen=True)
+class Divergence:
+    """A game on which an engine disagreed with Game, shrunk to a short repro."""
+    seed: int
+    actions: list
+
+
+class GameEngine:
+    """The reference: Game driven through its public API."""
+
+    def __init__(self):
+        self.game = Game()
+
+    def play(self, move):
+        """Try a move; returns True if it was accepted."""
+        if not 0 <= move < state.NUM_MOVES:
+            return False
+        kwargs = state.move_to_kwargs(self.game, move)
+        return kwargs is not None and self.game.make_move(**kwargs)
+
+    def rewind(self):
+        """Take back a move; returns True if there was one."""
+        return self.game.rewind()
+
+    def legal_moves(self):
+        """Moves to pick random play from (None: use the engine under test)."""
+        return None
+
+    def snapshot(self):
+        """Comparable state: (board, side, winner, red supply, yellow supply)."""
+        board, side = state.encode_game(self.game)
+        winner = state.COLOR_CODES[self.game.winner] if self.game.winner else 0
+        supplies = tuple(
+            tuple(sorted(piece.size for piece in player.get_available_pieces()))
+            for player in self.game.players
+        )
+        return (board, side, winner) + supplies
+
+
+class PositionEngine:
+    """Immutable Position values, with Game's history rules kept in a list."""
+
+    def __init__(self):
+        self.position = Position()
+        self.history = []
+
+    def play(self, move):
+        """Try a move; returns True if it was accepted."""
+        if self.position.winner or not state.is_legal(self.position.board,
+                                                      self.position.side, move):
+            return False
+        child = self.position.play(move)
+        # Like Game, a move that exposes the opponent's line is not recorded
+        if not child.winner or child.winner == self.position.side + 1:
+            self.history.append(self.position)
+        self.position = child
+        return True
+
+    def rewind(self):
+        """Take back a move; returns True if there was one."""
+        if not self.history:
+            return False
+        self.position = self.history.pop()
+        return True
+
+    def legal_moves(self):
+        """Legal moves in the current position."""
+        return self.position.legal_moves()
+
+    def snapshot(self):
+        """Comparable state, see GameEngine.snapshot."""
+        return _state_snapshot(self.position.board, self.position.side, self.position.winner)
+
+
+class StateEngine:
+    """Bare packed ints from game.state, rewound through a compact History."""
+
+    def __init__(self):
+        self.board, self.side, self.winner = 0, 0, 0
+        self.history = History(checkpoint_interval=8)
+
+    def play(self, move):
+        """Try a move; returns True if it was accepted."""
+        if self.winner or not state.is_legal(self.board, self.side, move):
+            return False
+        board, winner = state.apply_move(self.board, self.side, move)
+        if winner and winner != self.side + 1:
+            self.board, self.winner = board, winner
+        else:
+            self.history.append(state.position_key(self.board, self.side), move)
+            self.board, self.winner = board, winner
+            self.side = 1 - self.side
+        return True
+
+    def rewind(self):
+        """Take back a move; returns True if there was one."""
+        if not len(self.history):   # pylint: disable=use-implicit-booleaness-not-len
+            return False
+        key, _ = self.history.pop()
+        self.board, self.side, self.winner = key >> 1, key & 1, 0
+        return True
+
+    def legal_moves(self):
+        """Legal moves in the current position."""
+        return [] if self.winner else state.legal_moves(self.board, self.side)
+
+    def snapshot(self):
+        """Comparable state, see GameEngine.snapshot."""
+        return _state_snapshot(self.board, self.side, self.winner)
+
+
+def _state_snapshot(board, side, winner):
+    """Snapshot of a packed position in GameEngine.snapshot's layout."""
+    supplies = []
+    for player in (0, 1):
+        counts = state.supply_counts(board, player)
+        supplies.append(tuple(size for size in range(3) for _ in range(counts[size])))
+    return (board, side, winner) + tuple(supplies)
+
+
+ENGINES = {'position': PositionEngine, 'state': StateEngine}
+
+
+def _step(subjects, action):
+    """Apply an action to each engine; returns their (accepted, snapshot) outcomes."""
+    return [
+        (subject.rewind() if action == REWIND else subject.play(action), subject.snapshot())
+        for subject in subjects
+    ]
+
+
+def run_actions(actions, engine_factory, reference_factory=GameEngine):
+    """
+    Apply actions to the reference and an engine in lockstep.
+
+    Args:
+        actions (list): Encoded moves and REWIND codes
+        engine_factory (callable): Creates the engine under test
+        reference_factory (callable): Creates the reference engine
+
+    Returns:
+        tuple: (index of the first diverging action, reference outcome, engine outcome),
+            each outcome being (accepted, snapshot); None if they agree throughout
+    """
+    subjects = (reference_factory(), engine_factory())
+    for idx, action in enumerate(actions):
+        outcomes = _step(subjects, action)
+        if outcomes[0] != outcomes[1]:
+            return idx, outcomes[0], outcomes[1]
+    return None
+
+
+def random_game(seed, engine_factory, max_actions=120, rewind_rate=0.1, illegal_rate=0.05):
+    """
+    Play one random game in lockstep.
+
+    Moves are mostly chosen among the engine's legal moves, sometimes among all move
+    codes (so both must reject the same illegal ones), with rewinds mixed in; after the
+    game ends, only rewinds and further (rejected) moves are tried.
+
+    Args:
+        seed (int): Random seed identifying the game
+        engine_factory (callable): Creates the engine under test
+        max_actions (int): Actions per game
+        rewind_rate (float): Probability of a rewind
+        illegal_rate (float): Probability of a move drawn from every move code
+
+    Returns:
+        tuple: (actions played, divergence from run_actions or None)
+    """
+    rng = random.Random(seed)
+    engine = engine_factory()
+    subjects = (GameEngine(), engine)
+    actions = []
+    for _ in range(max_actions):
+        legal = engine.legal_moves()
+        roll = rng.random()
+        if roll < rewind_rate or (not legal and roll < 0.5):
+            action = REWIND
+        elif roll < rewind_rate + illegal_rate or not legal:
+            action = rng.randrange(state.NUM_MOVES)
+        else:
+            action = rng.choice(legal)
+        actions.append(action)
+
+        outcomes = _step(subjects, action)
+        if outcomes[0] != outcomes[1]:
+            return actions, (len(actions) - 1, outcomes[0], outcomes[1])
+    return actions, None
+
+
+def fuzz_range(engine_name, start, count, max_actions=120):
+    """
+    Fuzz a range of seeds; the unit of work for the process pool.
+
+    Returns:
+        tuple: (games played, actions played, (seed, actions) of the first failure or None)
+    """
+    engine_factory = ENGINES[engine_name]
+    total_actions = 0
+    for seed in range(start, start + count):
+        actions, divergence = random_game(seed, engine_factory, max_actions)
+        total_actions += len(actions)
+        if divergence is not None:
+            return seed - start + 1, total_actions, (seed, actions)
+    return count, total_actions, None
+
+
+def minimize(actions, engine_factory):
+    """
+    Shrink a diverging action list to a short one that still diverges.
+
+    First the detours are cut: the actions before the divergence are replaced by the
+    moves the reference game has on record at that point (no rewinds or rejected
+    moves), if that still diverges. Then chunks of actions, from half the list down
+    to single actions, are dropped at every offset while the rest still diverges.
+
+    Args:
+        actions (list): Actions that diverge
+        engine_factory (callable): Creates the engine under test
+
+    Returns:
+        list: A shorter action list that still diverges, ending with the divergence
+    """
+    def fails(candidate):
+        """Divergence index, or None if the candidate agrees."""
+        divergence = run_actions(candidate, engine_factory) if candidate else None
+        return None if divergence is None else divergence[0]
+
+    index = fails(actions)
+    actions = actions[:index + 1]
+    reference = GameEngine()
+    for action in actions[:-1]:
+        _step([reference], action)
+    recorded = reference.game.moves_history.moves() + actions[-1:]
+    index = fails(recorded)
+    if index is not None and index + 1 < len(actions):
+        actions = recorded[:index + 1]
+
+    chunk = max(1, len(actions) // 2)
+    while True:
+        start = 0
+        shrunk = False
+        while start < len(actions):
+            index = fails(actions[:start] + actions[start + chunk:])
+            if index is not None:
+                actions = (actions[:start] + actions[start + chunk:])[:index + 1]
+                shrunk = True
+            else:
+                start += 1
+        if chunk == 1 and not shrunk:
+            return actions
+        chunk = max(1, chunk // 2)
+
+
+def describe(action):
+    """Readable action, e.g. 'L@1,1', '0,0>2,2' or 'rewind'."""
+    return 'rewind' if action == REWIND else state.move_name(action)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def fuzz(engine_name, games, workers=None, seed=0, chunk=500, max_actions=120):
+    """
+    Fuzz an engine over many games in parallel, stopping at the first divergence.
+
+    Args:
+        engine_name (str): Key of ENGINES
+        games (int): Number of games
+        workers (int, optional): Worker processes; 1 fuzzes in this process
+        seed (int): Seed of the first game
+        chunk (int): Games per work unit
+        max_actions (int): Actions per game
+
+    Returns:
+        dict: 'engine', 'games' and 'actions' totals, and 'failure': the first
+            Divergence found, or None
+    """
+    ranges = [(start, min(chunk, seed + games - start))
+              for start in range(seed, seed + games, chunk)]
+    report = {'engine': engine_name, 'games': 0, 'actions': 0, 'failure': None}
+
+    def account(result):
+        """Add a work unit's result; True to stop."""
+        played, actions, failure = result
+        report['games'] += played
+        report['actions'] += actions
+        if failure is not None and report['failure'] is None:
+            failing_seed, failing_actions = failure
+            report['failure'] = Divergence(failing_seed,
+                                           minimize(failing_actions, ENGINES[engine_name]))
+        return report['failure'] is not None
+
+    if workers == 1:
+        for start, count in ranges:
+            if account(fuzz_range(engine_name, start, count, max_actions)):
+                break
+        return report
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(fuzz_range, engine_name, start, count, max_actions)
+                   for start, count in ranges]
+        for future in futures:
+            if account(future.result()):
+                for pending in futures:
+                    pending.cancel()
+                break
+    return report
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Fuzz an engine against Game.')
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='state')
+    parser.add_argument('--games', type=int, default=100000, help='random games to play')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game')
+    parser.add_argument('--max-actions', type=int, default=120, help='actions per game')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    report = fuzz(args.engine, args.games, args.workers, args.seed,
+                  max_actions=args.max_actions)
+    elapsed = time.perf_counter() - start
+    print(f"{report['engine']}: {report['games']} games, {report['actions']} actions "
+          f"in {elapsed:.1f}s ({report['actions'] / elapsed:.0f} actions/s)")
+    failure = report['failure']
+    if failure is None:
+        print("no divergence")
+        return 0
+    actions = failure.actions
+    reference, engine = run_actions(actions, ENGINES[args.engine])[1:]
+    print(f"DIVERGENCE (seed {failure.seed}), minimized to {len(actions)} actions:")
+    print('  ' + ' '.join(map(str, actions)))
+    print('  ' + ' '.join(describe(action) for action in actions))
+    print(f"  Game:   accepted={reference[0]} state={reference[1]}")
+    print(f"  engine: accepted={engine[0]} state={engine[1]}")
+    return 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -3,20 +3,62 @@ Game class for Gobblet Jr.
 """
 
 from .board import Board
+from .history import History
+from .instrument import timed
+from .piece import Piece
 from .player import Player
+from .state import (
+    COLORS, SUPPLY_BASE, apply_move, cells_of, encode_game, encode_move, position_key,
+    supply_counts
+)
 
-class Game:
+# Cell code -> (size, player index) of each piece in the cell, bottom of the stack first
+_STACKS = tuple(
+    tuple((size, ((code >> (2 * size)) & 3) - 1) for size in range(3) if (code >> (2 * size)) & 3)
+    for code in range(64)
+)
+
+
+class Game:     # pylint: disable=too-many-instance-attributes
     """Main game class for Gobblet Jr."""
 
-    def __init__(self):
-        """Initialize the game with board, players, and game state."""
+    __slots__ = (
+        'board', 'players', 'current_player_idx', 'moves_history', 'game_over', 'winner',
+        'repetition_limit', 'max_plies', 'position_counts'
+    )
+
+    def __init__(self, repetition_limit=None, max_plies=None, history_limit=None):
+        """
+        Initialize the game with board, players, and game state.
+
+        Pieces can move around the board forever, so two optional draw rules end
+        looping games with game_over set and no winner.
+
+        Args:
+            repetition_limit (int, optional): Draw when a position (including the
+                player to move) occurs this many times, e.g. 3 for threefold repetition
+            max_plies (int, optional): Draw once this many moves have been made
+            history_limit (int, optional): Moves of history kept in memory; older ones
+                are spilled to a temporary file (see game.history)
+        """
         self.board = Board()
         self.players = [Player('red'), Player('yellow')]
         self.current_player_idx = 0
-        self.moves_history = []
+        self.moves_history = History(memory_limit=history_limit)
         self.game_over = False
         self.winner = None
 
+        self.repetition_limit = repetition_limit
+        self.max_plies = max_plies
+        self.position_counts = {}
+        if repetition_limit is not None:
+            self.position_counts[position_key(*encode_game(self))] = 1
+
+    @property
+    def is_draw(self):
+        """True if the game ended under a draw rule."""
+        return self.game_over and self.winner is None
+
     @property
     def current_player(self):
         """Get the current player."""
@@ -26,6 +68,7 @@ class Game:
         """Switch to the next player."""
         self.current_player_idx = 1 - self.current_player_idx
 
+    @timed('Game.make_move')
     def make_move(self, piece_idx=None, from_pos=None, to_pos=None):
         """
         Make a move in the game.
@@ -54,6 +97,7 @@ class Game:
 
             piece = available_pieces[piece_idx]
             to_row, to_col = to_pos
+            move = encode_move(SUPPLY_BASE + piece.size, to_row * 3 + to_col)
 
             # print(    # debug statement
             #     f"Attempting a move on {self.current_player.color} player's "
@@ -66,15 +110,17 @@ class Game:
             if current_piece is None or piece.can_gobble(current_piece):
                 piece = self.current_player.place_piece(piece_idx)
                 self.board.place_piece(piece, to_row, to_col)
-                self.moves_history.append(prev_state)
+                self.moves_history.append(prev_state, move)
                 self._check_game_end()
                 self.switch_player()
+                self._check_draw()
                 return True
 
         # Move piece already on the board
         elif from_pos is not None and to_pos is not None:
             from_row, from_col = from_pos
             to_row, to_col = to_pos
+            move = encode_move(from_row * 3 + from_col, to_row * 3 + to_col)
 
             # Verify the piece belongs to the current player
             if (self.board.grid[from_row][from_col] is not None and
@@ -88,13 +134,34 @@ class Game:
                         self.winner = winner
                     else:
                         # Proceed with normal game flow
-                        self.moves_history.append(prev_state)
+                        self.moves_history.append(prev_state, move)
                         self._check_game_end()
                         self.switch_player()
+                        self._check_draw()
                     return True
 
         return False
 
+    def set_position(self, board, side, winner=0):
+        """
+        Replace the game state with a position, starting a fresh history from it.
+
+        Args:
+            board (int): Packed board (see game.state)
+            side (int): Player index to move
+            winner (int): Color code of the winner if the game is over, else 0
+        """
+        self.moves_history.close()
+        self.moves_history = History(memory_limit=self.moves_history.memory_limit)
+        self._restore_state(position_key(board, side))
+        if winner:
+            self.game_over = True
+            self.winner = COLORS[winner - 1]
+        self.position_counts = {}
+        if self.repetition_limit is not None:
+            self.position_counts[position_key(board, side)] = 1
+
+    @timed('Game.rewind')
     def rewind(self):
         """
         Rewind the game by one move.
@@ -105,44 +172,71 @@ class Game:
         if not self.moves_history:
             return False
 
-        prev_state = self.moves_history.pop()
+        prev_state, move = self.moves_history.pop()
         self._restore_state(prev_state)
+        if self.repetition_limit is not None:
+            board, side = prev_state >> 1, prev_state & 1
+            key = position_key(apply_move(board, side, move)[0], 1 - side)
+            count = self.position_counts.get(key, 0) - 1
+            if count > 0:
+                self.position_counts[key] = count
+            else:
+                self.position_counts.pop(key, None)
         return True
 
+    @timed('Game._get_state_snapshot')
     def _get_state_snapshot(self):
         """
         Get a snapshot of the current game state.
 
+        Snapshots are taken before a move, while the game is still running, so the
+        position key (see game.state) is all there is to record.
+
         Returns:
-            dict: Game state
+            int: Position key
         """
-        # This is a simplified implementation - a real one would deep copy all game state
-        # Right now, I kinda am deep copying all that's necessary for rewind
-        return {
-            'board': [row[:] for row in self.board.grid],
-            'current_player_idx': self.current_player_idx,
-            'game_over': self.game_over,
-            'winner': self.winner,
-            'available_pieces': {
-                'red': self.players[0].get_available_pieces(),
-                'yellow': self.players[1].get_available_pieces()
-            }
-        }
+        return position_key(*encode_game(self))
 
     def _restore_state(self, state):
         """
-        Restore a previous game state.
-        
+        Restore a previous game state, rebuilding the pieces from the position.
+
         Args:
-            state (dict): Game state to restore
+            state (int): Position key from _get_state_snapshot
         """
-        # This is a simplified implementation - a real one would restore all game state
-        self.board.grid = state['board']
-        self.current_player_idx = state['current_player_idx']
-        self.game_over = state['game_over']
-        self.winner = state['winner']
-        self.players[0].restore_available_pieces(state['available_pieces']['red'])
-        self.players[1].restore_available_pieces(state['available_pieces']['yellow'])
+        board, side = state >> 1, state & 1
+        grid = [[None] * 3 for _ in range(3)]
+        board_pieces = ([], [])
+        for cell, code in enumerate(cells_of(board)):
+            piece = None
+            for size, color in _STACKS[code]:   # smallest (bottom of the stack) first
+                top = Piece(size, COLORS[color])
+                top.gobbled_piece = piece
+                piece = top
+                board_pieces[color].append(piece)
+            grid[cell // 3][cell % 3] = piece
+        self.board.grid = grid
+        self.current_player_idx = side
+        self.game_over = False
+        self.winner = None
+
+        for idx, player in enumerate(self.players):
+            counts = supply_counts(board, idx)
+            player.restore_available_pieces(
+                [Piece(size, player.color) for size in (2, 1, 0) for _ in range(counts[size])]
+            )
+            player.board_pieces = board_pieces[idx]
+
+    def _check_draw(self):
+        """Count the position just reached and end the game if a draw rule applies."""
+        if self.repetition_limit is not None:
+            key = position_key(*encode_game(self))
+            self.position_counts[key] = self.position_counts.get(key, 0) + 1
+            if self.position_counts[key] >= self.repetition_limit and not self.game_over:
+                self.game_over = True
+        if (self.max_plies is not None and len(self.moves_history) >= self.max_plies
+                and not self.game_over):
+            self.game_over = True
 
     def _check_game_end(self):
         """Check if the game has ended."""
@@ -0,0 +1,99 @@
+"""
+Best-move hints computed off the caller's thread.
+
+Searches run in a worker process so they never compete with a UI loop for the GIL.
+Finished hints come back through a queue and are cached per position, so asking
+again for a position already seen (after toggling hints off and on, or rewinding)
+is answered immediately.
+"""
+
+import queue
+
+from . import state
+from .instrument import stats
+from .search import Searcher
+
+_WORKER_SEARCHER = None
+
+
+def _best_move(board, side, max_depth, time_limit):
+    """Worker process entry point; keeps one searcher (and its table) per process."""
+    global _WORKER_SEARCHER     # pylint: disable=global-statement
+    if _WORKER_SEARCHER is None:
+        _WORKER_SEARCHER = Searcher()
+    return _WORKER_SEARCHER.search(board, side, max_depth, time_limit=time_limit).move
+
+
+class HintService:
+    """Computes and caches the best move for positions, in a background process."""
+
+    def __init__(self, max_depth=6, time_limit=1.0, executor=None):
+        """
+        Args:
+            max_depth (int): Deepest search iteration for a hint
+            time_limit (float): Seconds a hint search may take
+            executor (Executor, optional): Pool to run searches in; a single-process
+                pool is created on first use if not given
+        """
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self._executor = executor
+        self._results = queue.Queue()
+        self._cache = {}    # position key -> encoded move
+        self._pending = {}  # position key -> Future of a search not yet drained
+
+    def get(self, game):
+        """
+        Get the hint for the game's current position without blocking.
+
+        Starts a background search the first time a position is asked for.
+
+        Args:
+            game (Game): Game to hint for
+
+        Returns:
+            dict: Keyword arguments for Game.make_move, or None while the hint is
+                being computed or if the game is over
+        """
+        self._drain()
+        if game.game_over:
+            return None
+        board, side = state.encode_game(game)
+        key = state.position_key(board, side)
+        if key in self._cache:
+            stats.count('HintService.cache_hit')
+            move = self._cache[key]
+            return state.move_to_kwargs(game, move) if move is not None else None
+        if key not in self._pending:
+            stats.count('HintService.search')
+            # Searches still queued for positions left behind are no longer wanted
+            for future in self._pending.values():
+                future.cancel()
+            if self._executor is None:
+                # Imported here so loading the engine does not pull in multiprocessing
+                # pylint: disable-next=import-outside-toplevel
+                from concurrent.futures import ProcessPoolExecutor
+                self._executor = ProcessPoolExecutor(max_workers=1)
+            future = self._executor.submit(
+                _best_move, board, side, self.max_depth, self.time_limit
+            )
+            self._pending[key] = future
+            future.add_done_callback(lambda done, key=key: self._results.put((key, done)))
+        return None
+
+    def close(self):
+        """Shut down the worker pool, abandoning queued searches."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _drain(self):
+        """Move finished searches from the result queue into the cache."""
+        while True:
+            try:
+                key, future = self._results.get_nowait()
+            except queue.Empty:
+                return
+            self._pending.pop(key, None)
+            if not future.cancelled() and future.exception() is None:
+                self._cache[key] = future.result()
@@ -0,0 +1,252 @@
+"""
+Compact move history for rewinding games.
+
+Instead of a snapshot of the whole game per move, the history keeps one byte per
+move (the encoded move, see ``game.state``) plus a full position checkpoint every
+``checkpoint_interval`` moves. The position before any move is rebuilt by replaying
+from the nearest checkpoint; a position that does not follow from the previous
+move (e.g. the board was edited between moves) is kept in full as well. With a
+memory limit, the oldest complete segments
+(checkpoint + moves) are spilled to a temporary file as fixed-size records and read
+back only if the game is rewound that far.
+"""
+
+import struct
+import tempfile
+from array import array
+from itertools import accumulate
+
+from .state import move_board, position_key
+
+
+# Serialized header: checkpoint interval, moves, resync entries, expected position (-1: None)
+_HEADER = struct.Struct('<HIIq')
+
+
+class History:  # pylint: disable=too-many-instance-attributes
+    """Stack of (position before the move, move) entries with bounded memory."""
+
+    __slots__ = (
+        'checkpoint_interval', 'memory_limit', 'spill_dir', '_checkpoints', '_moves',
+        '_resync', '_expected', '_length', '_spilled', '_spill_file'
+    )
+
+    def __init__(self, checkpoint_interval=32, memory_limit=None, spill_dir=None):
+        """
+        Args:
+            checkpoint_interval (int): Moves per segment; a full position is kept per segment
+            memory_limit (int, optional): Moves kept in memory before older segments are
+                spilled to disk; unlimited if None
+            spill_dir (str, optional): Directory for the spill file (system temp by default)
+        """
+        self.checkpoint_interval = checkpoint_interval
+        self.memory_limit = memory_limit
+        self.spill_dir = spill_dir
+        self._checkpoints = array('q')  # position keys, one per in-memory segment
+        self._moves = array('B')        # in-memory moves, starting at a segment boundary
+        self._resync = {}               # move index -> position not reachable by replay
+        self._expected = None           # position the last move led to
+        self._length = 0
+        self._spilled = 0               # segments on disk
+        self._spill_file = None
+
+    @property
+    def _record_size(self):
+        """Bytes per spilled segment: an 8-byte checkpoint then the moves."""
+        return 8 + self.checkpoint_interval
+
+    def __len__(self):
+        """Number of moves recorded."""
+        return self._length
+
+    def append(self, position, move):
+        """
+        Record a move.
+
+        Args:
+            position (int): Position key before the move
+            move (int): Encoded move
+        """
+        if not self._length % self.checkpoint_interval:
+            self._checkpoints.append(position)
+        elif position != self._expected:
+            self._resync[self._length] = position
+        self._moves.append(move)
+        self._expected = _advance(position, move)
+        self._length += 1
+        if (self.memory_limit is not None
+                and len(self._moves) >= self.memory_limit + self.checkpoint_interval):
+            self._spill()
+
+    def pop(self):
+        """
+        Remove the last move.
+
+        Returns:
+            tuple: (position key before the move, move)
+
+        Raises:
+            IndexError: If the history is empty
+        """
+        if not self._length:
+            raise IndexError('pop from empty history')
+        if not self._moves:
+            self._unspill()
+
+        index = self._length - 1
+        base = self._spilled * self.checkpoint_interval
+        segment = index // self.checkpoint_interval - self._spilled
+        position = self._checkpoints[segment]
+        for ply in range(base + segment * self.checkpoint_interval, index):
+            position = _advance(self._resync.get(ply, position), self._moves[ply - base])
+
+        self._expected = position if index else None
+        position = self._resync.pop(index, position)
+        move = self._moves.pop()
+        if not index % self.checkpoint_interval:
+            self._checkpoints.pop()
+        self._length -= 1
+        return position, move
+
+    def moves(self):
+        """
+        Returns:
+            list: Every recorded move, oldest first, including spilled ones
+        """
+        spilled = []
+        for segment in range(self._spilled):
+            spilled.extend(self._read_record(segment)[1])
+        return spilled + self._moves.tolist()
+
+    def initial_position(self):
+        """
+        Returns:
+            int: Position key before the first move, or None if nothing is recorded
+        """
+        if not self._length:
+            return None
+        if self._spilled:
+            return self._read_record(0)[0]
+        return self._checkpoints[0]
+
+    def memory_bytes(self):
+        """
+        Returns:
+            int: Approximate bytes of in-memory history data
+        """
+        return (self._checkpoints.buffer_info()[1] * self._checkpoints.itemsize
+                + self._moves.buffer_info()[1])
+
+    def _spill(self):
+        """Move the oldest complete segments to disk until within the memory limit."""
+        if self._spill_file is None:
+            # pylint: disable-next=consider-using-with
+            self._spill_file = tempfile.TemporaryFile(dir=self.spill_dir)
+        interval = self.checkpoint_interval
+        while len(self._moves) >= self.memory_limit + interval:
+            record = (self._checkpoints[0].to_bytes(8, 'little', signed=True)
+                      + self._moves[:interval].tobytes())
+            self._spill_file.seek(self._spilled * self._record_size)
+            self._spill_file.write(record)
+            del self._checkpoints[0]
+            del self._moves[:interval]
+            self._spilled += 1
+
+    def _read_record(self, segment):
+        """Read a spilled segment as (checkpoint, moves)."""
+        self._spill_file.seek(segment * self._record_size)
+        record = self._spill_file.read(self._record_size)
+        return int.from_bytes(record[:8], 'little', signed=True), array('B', record[8:])
+
+    def _unspill(self):
+        """Bring the newest spilled segment back into memory."""
+        self._spilled -= 1
+        checkpoint, moves = self._read_record(self._spilled)
+        self._spill_file.truncate(self._spilled * self._record_size)
+        self._checkpoints.insert(0, checkpoint)
+        self._moves = moves + self._moves
+
+    def to_bytes(self):
+        """
+        Serialize the whole history, including spilled segments.
+
+        Layout (little-endian): a header (checkpoint interval, number of moves, number
+        of resync entries, expected position), the checkpoints as 8-byte keys, the
+        moves as bytes, then the resync indexes (4 bytes) and keys (8 bytes).
+
+        Returns:
+            bytes: Data for from_bytes
+        """
+        checkpoints = array('q')
+        moves = array('B')
+        for segment in range(self._spilled):
+            checkpoint, segment_moves = self._read_record(segment)
+            checkpoints.append(checkpoint)
+            moves.extend(segment_moves)
+        checkpoints.extend(self._checkpoints)
+        moves.extend(self._moves)
+        resync = sorted(self._resync.items())
+        expected = -1 if self._expected is None else self._expected
+        return b''.join((
+            _HEADER.pack(self.checkpoint_interval, self._length, len(resync), expected),
+            checkpoints.tobytes(), moves.tobytes(),
+            array('I', [index for index, _ in resync]).tobytes(),
+            array('q', [position for _, position in resync]).tobytes(),
+        ))
+
+    @classmethod
+    def from_bytes(cls, data, memory_limit=None, spill_dir=None):
+        """
+        Rebuild a history serialized by to_bytes.
+
+        Args:
+            data (bytes-like): Serialized history
+            memory_limit (int, optional): See History; older segments are spilled again
+            spill_dir (str, optional): See History
+
+        Returns:
+            History: The rebuilt history
+
+        Raises:
+            ValueError: If the data is truncated or inconsistent
+        """
+        data = memoryview(data)
+        if len(data) < _HEADER.size:
+            raise ValueError('truncated history')
+        interval, length, num_resync, expected = _HEADER.unpack_from(data)
+        num_checkpoints = -(-length // interval) if interval else 0
+        sizes = (8 * num_checkpoints, length, 4 * num_resync, 8 * num_resync)
+        if not interval or len(data) != _HEADER.size + sum(sizes):
+            raise ValueError('truncated or corrupt history')
+
+        history = cls(interval, memory_limit, spill_dir)
+        starts = list(accumulate(sizes, initial=_HEADER.size))
+        history._checkpoints = _array('q', data[starts[0]:starts[1]])
+        history._moves = _array('B', data[starts[1]:starts[2]])
+        indexes = _array('I', data[starts[2]:starts[3]])
+        positions = _array('q', data[starts[3]:starts[4]])
+        history._resync = dict(zip(indexes, positions))
+        history._length = length
+        history._expected = None if expected < 0 else expected
+        if memory_limit is not None and len(history._moves) >= memory_limit + interval:
+            history._spill()
+        return history
+
+    def close(self):
+        """Delete the spill file, if any."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
+def _array(typecode, data):
+    """Array of a type code read from a slice of serialized data."""
+    values = array(typecode)
+    values.frombytes(data)
+    return values
+
+
+def _advance(position, move):
+    """Position key after a move, with the other side to move."""
+    board, side = position >> 1, position & 1
+    return position_key(move_board(board, side, move), 1 - side)
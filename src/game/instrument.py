@@ -0,0 +1,260 @@
+"""
+Opt-in counters and timing histograms for the engine and UI.
+
+Hot functions are wrapped with the ``timed`` decorator. While instrumentation is
+disabled (the default) the wrapper only checks a flag before calling through, so the
+cost is one extra function call. Call ``stats.enable()`` to start recording, then
+``stats.to_json``/``stats.to_csv`` or a ``PeriodicDump`` to get the numbers out.
+"""
+
+import functools
+import time
+from collections import deque
+
+HISTOGRAM_BUCKETS = 32
+
+
+class Histogram:
+    """Timing histogram with power-of-two microsecond buckets."""
+
+    def __init__(self):
+        # Bucket i counts samples in [2**(i-1), 2**i) microseconds, bucket 0 is < 1us
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, seconds):
+        """
+        Add one sample.
+
+        Args:
+            seconds (float): Measured duration
+        """
+        index = min(int(seconds * 1e6).bit_length(), HISTOGRAM_BUCKETS - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, pct):
+        """
+        Estimate a percentile as the upper edge of the bucket it falls in.
+
+        Args:
+            pct (float): Percentile between 0 and 100
+
+        Returns:
+            float: Duration in seconds, or 0.0 with no samples
+        """
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100.0
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= target and bucket:
+                return min((1 << index) / 1e6, self.max)
+        return self.max
+
+    def summary(self):
+        """
+        Returns:
+            dict: Count, total and mean/min/percentiles/max in microseconds
+        """
+        return {
+            'count': self.count,
+            'total_ms': round(self.total * 1e3, 3),
+            'mean_us': round(self.total / self.count * 1e6, 2) if self.count else 0.0,
+            'min_us': round((self.min or 0.0) * 1e6, 2),
+            'p50_us': round(self.percentile(50) * 1e6, 2),
+            'p95_us': round(self.percentile(95) * 1e6, 2),
+            'p99_us': round(self.percentile(99) * 1e6, 2),
+            'max_us': round((self.max or 0.0) * 1e6, 2),
+        }
+
+
+class Stats:
+    """Registry of named counters and timing histograms."""
+
+    def __init__(self):
+        self.enabled = False
+        self.counters = {}
+        self.timings = {}
+
+    def enable(self):
+        """Start recording."""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording; collected numbers are kept."""
+        self.enabled = False
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        self.counters = {}
+        self.timings = {}
+
+    def count(self, name, amount=1):
+        """
+        Increment a counter if recording.
+
+        Args:
+            name (str): Counter name
+            amount (int): Amount to add
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, name, seconds):
+        """
+        Add a timing sample if recording.
+
+        Args:
+            name (str): Timing name
+            seconds (float): Measured duration
+        """
+        if self.enabled:
+            histogram = self.timings.get(name)
+            if histogram is None:
+                histogram = self.timings[name] = Histogram()
+            histogram.record(seconds)
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: {'counters': {...}, 'timings': {name: summary}}
+        """
+        return {
+            'counters': dict(sorted(self.counters.items())),
+            'timings': {name: self.timings[name].summary() for name in sorted(self.timings)},
+        }
+
+    def to_json(self, path):
+        """
+        Write a snapshot as JSON.
+
+        Args:
+            path (str): Output file
+        """
+        import json     # pylint: disable=import-outside-toplevel
+        with open(path, 'w', encoding='utf-8') as out:
+            json.dump(self.snapshot(), out, indent=2)
+
+    def to_csv(self, path):
+        """
+        Write a snapshot as CSV, one row per timing or counter.
+
+        Args:
+            path (str): Output file
+        """
+        import csv      # pylint: disable=import-outside-toplevel
+        snapshot = self.snapshot()
+        fields = ['name'] + list(Histogram().summary())
+        with open(path, 'w', encoding='utf-8', newline='') as out:
+            writer = csv.DictWriter(out, fieldnames=fields)
+            writer.writeheader()
+            for name, summary in snapshot['timings'].items():
+                writer.writerow({'name': name, **summary})
+            for name, value in snapshot['counters'].items():
+                writer.writerow({'name': name, 'count': value})
+
+    def dump(self, path):
+        """
+        Write a snapshot, as CSV if path ends in .csv and JSON otherwise.
+
+        Args:
+            path (str): Output file
+        """
+        if path.endswith('.csv'):
+            self.to_csv(path)
+        else:
+            self.to_json(path)
+
+
+stats = Stats()
+
+
+def timed(name):
+    """
+    Decorator recording the wall time of every call under name while enabled.
+
+    Args:
+        name (str): Timing name, e.g. 'Game.make_move'
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not stats.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class PeriodicDump:    # pylint: disable=too-few-public-methods
+    """Writes the stats to a file at most once per interval; call tick() from a loop."""
+
+    def __init__(self, path, interval=5.0):
+        """
+        Args:
+            path (str): Output file (.csv for CSV, otherwise JSON)
+            interval (float): Seconds between dumps
+        """
+        self.path = path
+        self.interval = interval
+        self._next = time.monotonic() + interval
+
+    def tick(self):
+        """Dump if the interval has elapsed."""
+        now = time.monotonic()
+        if now >= self._next:
+            stats.dump(self.path)
+            self._next = now + self.interval
+
+
+class FrameTimer:
+    """Frame times over a sliding window, for an FPS/percentile overlay."""
+
+    def __init__(self, window=240):
+        """
+        Args:
+            window (int): Number of recent frames kept
+        """
+        self.frames = deque(maxlen=window)
+        self._last = None
+
+    def tick(self):
+        """Mark the end of a frame."""
+        now = time.perf_counter()
+        if self._last is not None:
+            self.frames.append(now - self._last)
+            stats.record('frame', now - self._last)
+        self._last = now
+
+    def percentile(self, pct):
+        """
+        Args:
+            pct (float): Percentile between 0 and 100
+
+        Returns:
+            float: Frame time in seconds over the window, or 0.0 with no frames
+        """
+        if not self.frames:
+            return 0.0
+        ordered = sorted(self.frames)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100.0))]
+
+    @property
+    def fps(self):
+        """Average frames per second over the window."""
+        total = sum(self.frames)
+        return len(self.frames) / total if total > 0 else 0.0
@@ -0,0 +1,162 @@
+"""
+Parallel search: Lazy SMP over a transposition table in shared memory.
+
+Every worker process runs the ordinary iterative-deepening ``Searcher`` on the same
+root position; they cooperate only through the shared table
+(``ttable.SharedTranspositionTable``), where each finds the others' results and move
+orderings. Helpers try the root moves in a different order each, so they spread over
+the tree instead of repeating the main search. The main search runs in the calling
+process and its result is the answer; when it completes, the helpers are stopped.
+
+Helper processes are started once and wait for positions, so a search costs no
+process start-up. A helper that dies makes the search raise rather than hang, and
+the helpers and shared memory are released when the searcher is closed or garbage
+collected.
+"""
+
+import multiprocessing
+import queue
+import random
+import time
+import weakref
+
+from .search import Searcher, SearchResult
+from .ttable import SharedTranspositionTable
+
+# Seconds to wait for a helper's result before checking the helpers are still alive
+RESULT_POLL = 0.1
+
+
+class HelperSearcher(Searcher):     # pylint: disable=too-few-public-methods
+    """Searcher that tries root moves in its own order, so helpers diverge."""
+
+    def __init__(self, index, table):
+        """
+        Args:
+            index (int): Helper number, seeding its move order
+            table (TranspositionTable): Shared table
+        """
+        super().__init__(table=table)
+        self.rng = random.Random(index)
+
+    def _root(self, board, side, depth, moves):
+        """Search the root moves in a shuffled order."""
+        moves = list(moves)
+        self.rng.shuffle(moves)
+        return super()._root(board, side, depth, moves)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def _helper(index, table_name, capacity, tasks, results, stop):
+    """Helper process: search each position received until told to stop."""
+    table = SharedTranspositionTable(capacity, name=table_name)
+    searcher = HelperSearcher(index, table)
+    for task in iter(tasks.get, None):
+        board, side, max_depth = task
+        result = searcher.search(board, side, max_depth, stop_event=stop)
+        results.put(result.nodes)
+    del searcher
+    table.close()
+
+
+def _shutdown(stop, tasks, helpers, table):
+    """Stop the helper processes and free the shared table; runs at most once."""
+    stop.set()
+    for helper_tasks in tasks:
+        helper_tasks.put(None)
+    for helper in helpers:
+        helper.join()
+    table.close()
+
+
+class ParallelSearcher:     # pylint: disable=too-many-instance-attributes
+    """Searches with several processes sharing one transposition table."""
+
+    def __init__(self, workers=None, capacity=1 << 20):
+        """
+        Args:
+            workers (int, optional): Processes searching, including this one
+                (default: CPU count); 1 searches alone on the shared table
+            capacity (int): Transposition table entries (16 bytes each)
+        """
+        self.workers = workers or multiprocessing.cpu_count()
+        self.table = SharedTranspositionTable(capacity)
+        self.searcher = Searcher(table=self.table)
+        self._stop = multiprocessing.Event()
+        self._tasks = [multiprocessing.Queue() for _ in range(self.workers - 1)]
+        self._results = multiprocessing.Queue()
+        self._helpers = [
+            multiprocessing.Process(
+                target=_helper,
+                args=(index + 1, self.table.name, self.table.capacity, tasks,
+                      self._results, self._stop),
+                daemon=True
+            )
+            for index, tasks in enumerate(self._tasks)
+        ]
+        for helper in self._helpers:
+            helper.start()
+        # Also run if close() is never called: on garbage collection or at exit
+        self._finalizer = weakref.finalize(self, _shutdown, self._stop, self._tasks,
+                                           self._helpers, self.table)
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def search(self, board, side, max_depth=8, time_limit=None, stop_event=None):
+        """
+        Search a position with every worker.
+
+        Args:
+            board (int): Packed board
+            side (int): Player index to move
+            max_depth (int): Maximum depth in plies
+            time_limit (float, optional): Seconds before the search is abandoned
+            stop_event (threading.Event, optional): Set to cancel the search
+
+        Returns:
+            SearchResult: The main search's move, score and depth, with the nodes of
+                every worker and the elapsed wall time
+
+        Raises:
+            RuntimeError: If a helper process has died
+        """
+        start = time.perf_counter()
+        self._stop.clear()
+        # Drop counts left over from a search that failed partway through collecting them
+        while True:
+            try:
+                self._results.get_nowait()
+            except queue.Empty:
+                break
+        for tasks in self._tasks:
+            tasks.put((board, side, max_depth))
+        result = self.searcher.search(board, side, max_depth, time_limit, stop_event)
+        self._stop.set()
+        nodes = result.nodes + self._helper_nodes()
+        return SearchResult(result.move, result.score, result.depth, nodes,
+                            time.perf_counter() - start)
+
+    def _helper_nodes(self):
+        """Collect every helper's node count, failing if a helper died meanwhile."""
+        nodes = 0
+        for _ in self._tasks:
+            while True:
+                try:
+                    nodes += self._results.get(timeout=RESULT_POLL)
+                    break
+                except queue.Empty:
+                    for helper in self._helpers:
+                        if not helper.is_alive():
+                            raise RuntimeError(f"search helper {helper.pid} exited "
+                                               f"with code {helper.exitcode}") from None
+        return nodes
+
+    def close(self):
+        """Stop the helper processes and free the shared table."""
+        self.searcher = None
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -2,10 +2,7 @@
 Piece class for the Gobbler pieces.
 """
 
-from dataclasses import dataclass
-
-@dataclass
-class Size:
+class Size:     # pylint: disable=too-few-public-methods
     """Piece sizes"""
     SMALL = 0
     MEDIUM = 1
@@ -14,6 +11,8 @@ class Size:
 class Piece:
     """Represents a game piece"""
 
+    __slots__ = ('size', 'color', 'gobbled_piece')
+
     def __init__(self, size, color):
         """
         Args:
@@ -7,6 +7,8 @@ from .piece import Piece, Size
 class Player:
     """Represents a player in Gobblet Jr."""
 
+    __slots__ = ('color', 'pieces', 'board_pieces')
+
     def __init__(self, color):
         """
         Args:
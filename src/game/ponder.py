@@ -0,0 +1,172 @@
+"""
+Background thinking for a computer player.
+
+The Ponderer searches on a worker thread so the caller's loop never blocks. While the
+opponent is to move it searches the position after each of the opponent's replies,
+sharing one transposition table, so when the opponent actually moves the answer is
+usually already known.
+"""
+
+import threading
+
+from . import state
+from .search import Searcher, MATE_BOUND
+
+
+class Ponderer:     # pylint: disable=too-many-instance-attributes
+    """Searches for a computer player on a background thread."""
+
+    def __init__(self, side, searcher=None, max_depth=6, move_time=2.0):
+        """
+        Args:
+            side (int): Player index the computer plays (0 = red, 1 = yellow)
+            searcher (Searcher, optional): Searcher whose table is kept between moves
+            max_depth (int): Deepest iteration for pondering and move searches
+            move_time (float): Seconds allowed when a reply was not pondered
+        """
+        self.side = side
+        self.searcher = searcher or Searcher()
+        self.max_depth = max_depth
+        self.move_time = move_time
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._replies = {}  # position key -> SearchResult, for positions the computer is to move
+        self._result = None  # (position key, SearchResult) of the last requested move
+        self._job = None  # (position key, game over) the worker was last started for
+
+    @property
+    def thinking(self):
+        """True while the worker thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def update(self, game):
+        """
+        Drive the computer player from a UI loop; call once per frame.
+
+        Starts pondering or a move search whenever the game's position changes.
+
+        Args:
+            game (Game): Game being played
+
+        Returns:
+            dict: Keyword arguments for Game.make_move once the computer's move is
+                ready, otherwise None
+        """
+        board, side = state.encode_game(game)
+        job = (state.position_key(board, side), game.game_over)
+        if job != self._job:
+            if side == self.side:
+                self.request_move(game)
+            else:
+                self.ponder(game)
+            self._job = job
+        if side == self.side:
+            return self.poll(game)
+        return None
+
+    def ponder(self, game):
+        """
+        Start thinking on the opponent's time.
+
+        Args:
+            game (Game): Game with the opponent to move
+        """
+        self.cancel()
+        board, side = state.encode_game(game)
+        if game.game_over or side == self.side:
+            return
+        self._start(self._ponder, board, side)
+
+    def request_move(self, game):
+        """
+        Start choosing a move for the computer player; collect it with poll().
+
+        A reply pondered to max_depth, or found to be a forced win or loss, is
+        delivered immediately; a shallower one only warms the table for the search.
+
+        Args:
+            game (Game): Game with the computer player to move
+        """
+        self.cancel()
+        board, side = state.encode_game(game)
+        if game.game_over or side != self.side:
+            return
+        key = state.position_key(board, side)
+        with self._lock:
+            pondered = self._replies.get(key)
+            self._replies = {}
+        if pondered is not None and pondered.move is not None and (
+                pondered.depth >= self.max_depth or abs(pondered.score) > MATE_BOUND):
+            self._result = (key, pondered)
+            return
+        self._start(self._think, board, side)
+
+    def poll(self, game):
+        """
+        Collect the move chosen by request_move, if it is ready.
+
+        Args:
+            game (Game): Game the move was requested for
+
+        Returns:
+            dict: Keyword arguments for Game.make_move, or None if there is no move
+                for the game's current position yet
+        """
+        board, side = state.encode_game(game)
+        with self._lock:
+            result = self._result
+            if result is None or result[0] != state.position_key(board, side):
+                return None
+            self._result = None
+        return state.move_to_kwargs(game, result[1].move)
+
+    def cancel(self):
+        """Stop the worker thread and drop any undelivered move, e.g. after a rewind."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._stop = threading.Event()
+        self._result = None
+        self._job = None
+
+    def _start(self, target, board, side):
+        """Run target(board, side, stop_event) on a fresh worker thread."""
+        self._thread = threading.Thread(
+            target=target, args=(board, side, self._stop), daemon=True
+        )
+        self._thread.start()
+
+    def _ponder(self, board, side, stop):
+        """Deepen a search of every opponent reply until cancelled or max_depth."""
+        children = []
+        for move in state.legal_moves(board, side):
+            child, winner = state.apply_move(board, side, move)
+            if not winner:
+                children.append((child, state.position_key(child, self.side)))
+
+        # One table generation for the whole cycle, so replies do not age each other out
+        self.searcher.table.new_search()
+        for depth in range(1, self.max_depth + 1):
+            for child, key in children:
+                if stop.is_set():
+                    return
+                with self._lock:
+                    known = self._replies.get(key)
+                if known is not None and abs(known.score) > MATE_BOUND:
+                    continue
+                result = self.searcher.search(child, self.side, depth, stop_event=stop,
+                                              new_search=False)
+                if result.depth == depth or (result.depth and abs(result.score) > MATE_BOUND):
+                    with self._lock:
+                        self._replies[key] = result
+
+    def _think(self, board, side, stop):
+        """Search the computer player's position within the move time."""
+        result = self.searcher.search(
+            board, side, self.max_depth, time_limit=self.move_time, stop_event=stop
+        )
+        if not stop.is_set():
+            with self._lock:
+                self._result = (state.position_key(board, side), result)
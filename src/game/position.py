@@ -0,0 +1,138 @@
+"""
+Immutable positions for exploring many branches of a game.
+
+A Position is the packed board (see ``game.state``) plus the side to move, the
+winner and a link to the position it was played from. Playing a move never changes
+a position; it returns a child that shares its parent, so every branch explored from
+a position reuses the history they have in common and holding thousands of them costs
+a small object each. Positions can be shared freely between threads.
+"""
+
+from dataclasses import dataclass, field
+
+from . import state
+from .game import Game
+
+
+@dataclass(frozen=True, slots=True)
+class Position:
+    """A game position; equal positions compare and hash equal whatever their history."""
+    board: int = 0
+    side: int = 0
+    winner: int = 0
+    parent: 'Position' = field(default=None, compare=False, repr=False)
+    move: int = field(default=None, compare=False)
+    ply: int = field(default=0, compare=False)
+
+    @classmethod
+    def from_game(cls, game):
+        """
+        Args:
+            game (Game): Game whose current position to take (its history is not kept)
+
+        Returns:
+            Position: Root position equal to the game's
+        """
+        board, side = state.encode_game(game)
+        winner = state.COLOR_CODES[game.winner] if game.winner else 0
+        return cls(board, side, winner)
+
+    @property
+    def key(self):
+        """Position key, see state.position_key."""
+        return state.position_key(self.board, self.side)
+
+    @property
+    def is_over(self):
+        """True if the game has been won."""
+        return self.winner != 0
+
+    @property
+    def root(self):
+        """The position this line of play started from."""
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    def canonical_key(self):
+        """
+        Returns:
+            int: Key shared with all rotations and reflections, see state.canonical_key
+        """
+        return state.canonical_key(self.board, self.side)
+
+    def legal_moves(self):
+        """
+        Returns:
+            list: Encoded legal moves, empty once the game is over
+        """
+        if self.winner:
+            return []
+        return state.legal_moves(self.board, self.side)
+
+    def play(self, move):
+        """
+        Play a move.
+
+        As in Game, the turn passes after every move except one that exposes the
+        opponent's line, so the player to move in a finished game is the loser.
+
+        Args:
+            move (int): Encoded move
+
+        Returns:
+            Position: The child position
+
+        Raises:
+            ValueError: If the game is over or the move is illegal
+        """
+        if self.winner or not state.is_legal(self.board, self.side, move):
+            raise ValueError(f"illegal move {move}")
+        board, winner = state.apply_move(self.board, self.side, move)
+        side = self.side if winner and winner != self.side + 1 else 1 - self.side
+        return Position(board, side, winner, self, move, self.ply + 1)
+
+    def children(self):
+        """
+        Returns:
+            list: (move, Position) for every legal move
+        """
+        return [(move, self.play(move)) for move in self.legal_moves()]
+
+    def path(self):
+        """
+        Returns:
+            list: Encoded moves from the root to this position
+        """
+        moves = []
+        node = self
+        while node.parent is not None:
+            moves.append(node.move)
+            node = node.parent
+        moves.reverse()
+        return moves
+
+    def to_game(self, **options):
+        """
+        Build a Game at this position, with the moves from the root as its history.
+
+        Args:
+            **options: Keyword arguments for Game (draw rules, history_limit)
+
+        Returns:
+            Game: New game that can be played on and rewound to the root
+
+        Raises:
+            ValueError: If Game does not accept a move of the path, e.g. because a
+                draw rule in options ends the game before this position
+        """
+        root = self.root
+        game = Game(**options)
+        game.set_position(root.board, root.side, root.winner)
+        for ply, move in enumerate(self.path()):
+            kwargs = state.move_to_kwargs(game, move)
+            if kwargs is None or not game.make_move(**kwargs):
+                raise ValueError(f"Game does not accept move {ply + 1} of the path "
+                                 f"({state.move_name(move)})")
+        return game
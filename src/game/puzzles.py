@@ -0,0 +1,318 @@
+"""
+"Win in N" puzzles mined from random reachable positions.
+
+Positions are sampled by playing random legal moves from the start (with the same
+rules as Game, see ``game.state``) and each is solved exactly: a puzzle is a position
+where the player to move can force a win with N moves of their own, not fewer, and
+exactly one first move does it. A move that exposes the opponent's line loses at
+once, so defences and attacks include those. Puzzles are deduplicated up to rotation
+and reflection, and mining runs in a process pool.
+
+A puzzle file is an archive like ``game.records`` (gzip if the name ends in .gz), one
+puzzle per line: ``<position key> <N> <solution move>``. Load a puzzle for display
+with ``Puzzle.to_game()``.
+
+Run from `src`: `python -m game.puzzles OUT --count 100 --moves 2 --workers 4`.
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from . import state
+from .game import Game
+from .records import open_archive
+
+
+@dataclass(frozen=True)
+class Puzzle:
+    """A position, its length in moves of the solver, and its unique first move."""
+    key: int
+    moves: int
+    solution: int
+
+    @property
+    def board(self):
+        """Packed board."""
+        return self.key >> 1
+
+    @property
+    def side(self):
+        """Player index to move (the solver)."""
+        return self.key & 1
+
+    def to_game(self):
+        """
+        Returns:
+            Game: A game set up at the puzzle position, with the solver to move
+        """
+        game = Game()
+        game.set_position(self.board, self.side)
+        return game
+
+    def solution_kwargs(self, game):
+        """
+        Args:
+            game (Game): Game set up by to_game
+
+        Returns:
+            dict: Game.make_move keyword arguments for the solution
+        """
+        return state.move_to_kwargs(game, self.solution)
+
+
+def _wins_within(board, side, moves_left, memo):
+    """True if the side to move can force a win making at most moves_left moves."""
+    key = (state.position_key(board, side), moves_left)
+    cached = memo.get(key)
+    if cached is not None:
+        return cached
+    color = side + 1
+    children = []
+    result = False
+    for move in state.legal_moves(board, side):
+        child, winner = state.apply_move(board, side, move)
+        if winner == color:
+            result = True
+            break
+        if not winner:
+            children.append(child)
+    if not result and moves_left > 1:
+        result = any(_defender_loses(child, 1 - side, moves_left - 1, memo)
+                     for child in children)
+    memo[key] = result
+    return result
+
+
+def _defender_loses(board, side, moves_left, memo):
+    """True if every move of the side to move lets the opponent win within moves_left."""
+    moves = state.legal_moves(board, side)
+    if not moves:
+        return False    # Stuck, not lost
+    children = []
+    for move in moves:
+        child, winner = state.apply_move(board, side, move)
+        if winner == side + 1:
+            return False
+        if not winner:
+            children.append(child)
+        # Otherwise the move exposed the opponent's line, which suits the opponent
+    return all(_wins_within(child, 1 - side, moves_left, memo) for child in children)
+
+
+def solve(board, side, moves):
+    """
+    Check a position for a "win in N" puzzle.
+
+    Args:
+        board (int): Packed board
+        side (int): Player index to move
+        moves (int): N, the number of moves the player to move should need
+
+    Returns:
+        int: The unique winning first move, or None if there is no forced win in
+            exactly N moves or more than one first move forces it
+    """
+    memo = {}
+    if moves > 1 and _wins_within(board, side, moves - 1, memo):
+        return None
+    solution = None
+    for move in state.legal_moves(board, side):
+        child, winner = state.apply_move(board, side, move)
+        if winner:
+            wins = winner == side + 1
+        else:
+            wins = moves > 1 and _defender_loses(child, 1 - side, moves - 1, memo)
+        if wins:
+            if solution is not None:
+                return None
+            solution = move
+    return solution
+
+
+def sample_position(rng, min_plies=4, max_plies=16):
+    """
+    Play random moves from the start.
+
+    Args:
+        rng (random.Random): Random source
+        min_plies (int): Fewest random moves
+        max_plies (int): Most random moves
+
+    Returns:
+        tuple: (board, side) of a position where the game is still running, or None
+            if the random game ended first
+    """
+    board, side = 0, 0
+    for _ in range(rng.randint(min_plies, max_plies)):
+        board, winner = state.apply_move(board, side, rng.choice(state.legal_moves(board, side)))
+        if winner:
+            return None
+        side = 1 - side
+    return board, side
+
+
+def mine(seed, samples, moves, min_plies=4, max_plies=16):
+    """
+    Sample and solve positions; the unit of work for the process pool.
+
+    Args:
+        seed (int): Random seed for this batch
+        samples (int): Positions to sample
+        moves (int): N for "win in N"
+        min_plies (int): Fewest random moves before a sample
+        max_plies (int): Most random moves before a sample
+
+    Returns:
+        tuple: (positions solved, list of (canonical key, Puzzle))
+    """
+    rng = random.Random(seed)
+    seen = set()
+    found = []
+    solved = 0
+    for _ in range(samples):
+        position = sample_position(rng, min_plies, max_plies)
+        if position is None:
+            continue
+        canonical = state.canonical_key(*position)
+        if canonical in seen:
+            continue
+        seen.add(canonical)
+        solved += 1
+        solution = solve(position[0], position[1], moves)
+        if solution is not None:
+            found.append((canonical, Puzzle(state.position_key(*position), moves, solution)))
+    return solved, found
+
+
+def _mined_batches(workers, seed, batch, args):
+    """
+    Results of mine() for consecutive seeds, in seed order, until closed.
+
+    Args:
+        workers (int, optional): Worker processes; 1 mines in this process
+        seed (int): Seed of the first batch
+        batch (int): Positions sampled per work unit
+        args (tuple): (moves, min_plies, max_plies) passed on to mine()
+
+    Yields:
+        tuple: (positions solved, [(canonical key, Puzzle), ...]) per batch
+    """
+    if workers == 1:
+        while True:
+            yield mine(seed, batch, *args)
+            seed += 1
+
+    in_flight = 2 * (workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        try:
+            while True:
+                # Keep every worker busy with a batch in hand
+                while len(pending) < in_flight:
+                    pending.append(pool.submit(mine, seed, batch, *args))
+                    seed += 1
+                yield pending.pop(0).result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def generate(count, moves, workers=None, seed=0, batch=200, min_plies=4, max_plies=16,
+             stats=None):
+    """
+    Mine distinct puzzles in parallel.
+
+    Args:
+        count (int): Puzzles wanted
+        moves (int): N for "win in N"
+        workers (int, optional): Worker processes; 1 mines in this process
+        seed (int): Seed of the first batch
+        batch (int): Positions sampled per work unit
+        min_plies (int): Fewest random moves before a sample
+        max_plies (int): Most random moves before a sample
+        stats (dict, optional): Updated with 'solved' positions and 'batches' run
+
+    Yields:
+        Puzzle: Puzzles distinct up to symmetry, until count have been found
+    """
+    stats = stats if stats is not None else {}
+    stats.setdefault('solved', 0)
+    stats.setdefault('batches', 0)
+    seen = set()
+    found = 0
+    if count <= 0:
+        return
+    batches = _mined_batches(workers, seed, batch, (moves, min_plies, max_plies))
+    try:
+        for solved, puzzles in batches:
+            stats['solved'] += solved
+            stats['batches'] += 1
+            for canonical, puzzle in puzzles:
+                if canonical not in seen and found < count:
+                    seen.add(canonical)
+                    found += 1
+                    yield puzzle
+            if found == count:
+                break
+    finally:
+        batches.close()
+
+
+def write_puzzles(path, puzzles):
+    """
+    Args:
+        path (str): Puzzle file
+        puzzles (iterable): Puzzles to write
+
+    Returns:
+        int: Number of puzzles written
+    """
+    count = 0
+    with open_archive(path, 'w') as out:
+        for puzzle in puzzles:
+            out.write(f"{puzzle.key} {puzzle.moves} {puzzle.solution}\n")
+            count += 1
+    return count
+
+
+def read_puzzles(path):
+    """
+    Args:
+        path (str): Puzzle file
+
+    Yields:
+        Puzzle: Each puzzle in the file
+    """
+    with open_archive(path, 'r') as puzzles:
+        for line in puzzles:
+            if line.strip():
+                yield Puzzle(*map(int, line.split()))
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Mine "win in N" puzzles.')
+    parser.add_argument('out', help='puzzle file (.txt or .txt.gz)')
+    parser.add_argument('--count', type=int, default=100, help='puzzles to find')
+    parser.add_argument('--moves', type=int, default=2, help='N: moves the solver needs')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args(argv)
+
+    stats = {}
+    start = time.perf_counter()
+    written = write_puzzles(args.out, generate(args.count, args.moves, args.workers,
+                                               args.seed, stats=stats))
+    elapsed = time.perf_counter() - start
+    print(f"{written} win-in-{args.moves} puzzles written to {args.out} in {elapsed:.1f}s: "
+          f"{stats['solved']} positions solved ({stats['solved'] / elapsed:.0f}/s), "
+          f"{written / elapsed:.1f} puzzles/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""
+Recorded games: reading, writing, replaying and generating them.
+
+A game record is the list of encoded moves played from the empty board (see
+``game.state``). Archives store one game per line as space-separated move codes, and
+are gzip-compressed when the file name ends in ``.gz``. Everything here streams, so
+archives of any size can be processed in constant memory.
+"""
+
+import gzip
+import random
+import time
+
+from . import state
+
+
+def open_archive(path, mode):
+    """Open an archive as text, transparently gzip-compressed for .gz paths."""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='ascii')
+    return open(path, mode, encoding='ascii')    # pylint: disable=consider-using-with
+
+
+def read_games(path):
+    """
+    Stream the games in an archive.
+
+    Args:
+        path (str): Archive file
+
+    Yields:
+        list: Encoded moves of one game
+    """
+    with open_archive(path, 'r') as archive:
+        for line in archive:
+            line = line.strip()
+            if line:
+                yield [int(move) for move in line.split()]
+
+
+def write_games(path, games):
+    """
+    Write games to an archive.
+
+    Args:
+        path (str): Archive file
+        games (iterable): Move lists
+
+    Returns:
+        int: Number of games written
+    """
+    count = 0
+    with open_archive(path, 'w') as archive:
+        for moves in games:
+            archive.write(' '.join(map(str, moves)) + '\n')
+            count += 1
+    return count
+
+
+def replay(moves):
+    """
+    Replay a game move by move.
+
+    Args:
+        moves (list): Encoded moves from the empty board
+
+    Yields:
+        tuple: (board, side, move, winner) for each move, where board and side are the
+            position before the move and winner is the color code after it (0 if the
+            game goes on)
+
+    Raises:
+        ValueError: If a move is illegal or follows the end of the game
+    """
+    board, side = 0, 0
+    for ply, move in enumerate(moves):
+        if not state.is_legal(board, side, move):
+            raise ValueError(f"illegal move {move} at ply {ply}")
+        child, winner = state.apply_move(board, side, move)
+        yield board, side, move, winner
+        if winner:
+            if ply != len(moves) - 1:
+                raise ValueError(f"moves continue after the game ended at ply {ply}")
+            return
+        board, side = child, 1 - side
+
+
+def play_out(moves):
+    """
+    Args:
+        moves (list): Encoded moves from the empty board
+
+    Returns:
+        int: Color code of the winner, 0 if the game did not finish
+    """
+    winner = 0
+    for _, _, _, winner in replay(moves):
+        pass
+    return winner
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def self_play(count, seed=None, max_plies=200, searcher=None, depth=2, randomness=0.2):
+    """
+    Generate games by self-play.
+
+    Moves are random unless a searcher is given, in which case each move is the
+    searcher's choice at the given depth, with a random move a fraction of the time
+    so games differ.
+
+    Args:
+        count (int): Number of games
+        seed (int, optional): Random seed, for reproducible streams
+        max_plies (int): Games still running after this many moves are cut off
+        searcher (Searcher, optional): Searcher choosing the moves
+        depth (int): Search depth when a searcher is given
+        randomness (float): Probability of a random move when a searcher is given
+
+    Yields:
+        list: Encoded moves of one game
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        board, side, moves = 0, 0, []
+        for _ in range(max_plies):
+            if searcher is not None and rng.random() >= randomness:
+                move = searcher.search(board, side, depth).move
+            else:
+                move = rng.choice(state.legal_moves(board, side))
+            moves.append(move)
+            board, winner = state.apply_move(board, side, move)
+            if winner:
+                break
+            side = 1 - side
+        yield moves
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments,too-many-locals
+def stream_moves(out, board_ids, seed=None, move_delay=0.0, stop=None, max_plies=200,
+                 searcher=None, depth=2, randomness=0.2):
+    """
+    Play self-play games on several boards at once, publishing every move.
+
+    Each round plays one move on every board; a finished or cut-off game is replaced
+    by a new one. Meant to feed spectator displays from threads or worker processes.
+
+    Args:
+        out (queue.Queue or multiprocessing.Queue): Receives (board_id, move) tuples, with
+            (board_id, None) announcing a new game on that board
+        board_ids (list): Boards this runner plays
+        seed (int, optional): Random seed
+        move_delay (float): Seconds to sleep between rounds
+        stop (threading.Event or multiprocessing.Event, optional): Set to stop; the
+            runner plays forever otherwise
+        max_plies (int): Games still running after this many moves are restarted
+        searcher (Searcher, optional): Searcher choosing the moves, see self_play
+        depth (int): Search depth when a searcher is given
+        randomness (float): Probability of a random move when a searcher is given
+    """
+    rng = random.Random(seed)
+    games = {board_id: None for board_id in board_ids}
+    while stop is None or not stop.is_set():
+        for board_id, game in games.items():
+            if game is None:
+                out.put((board_id, None))
+                game = games[board_id] = [0, 0, 0]     # board, side, plies
+            board, side, plies = game
+            if searcher is not None and rng.random() >= randomness:
+                move = searcher.search(board, side, depth).move
+            else:
+                move = rng.choice(state.legal_moves(board, side))
+            out.put((board_id, move))
+            board, winner = state.apply_move(board, side, move)
+            if winner or plies + 1 >= max_plies:
+                games[board_id] = None
+            else:
+                games[board_id] = [board, 1 - side, plies + 1]
+        if move_delay:
+            time.sleep(move_delay)
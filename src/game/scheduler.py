@@ -0,0 +1,309 @@
+"""
+Bot move scheduling for a host running many games with computer opponents.
+
+A host's event loop must never search itself: it submits a job per bot move and
+polls for finished moves. Jobs run on a bounded set of worker processes, each with
+its own long-lived Searcher (so its transposition table stays warm). Waiting jobs
+are kept in a priority queue ordered by deadline, so the game closest to running out
+of its per-move budget is searched first, and each search is given whatever is left
+of its budget when it starts. A game that is rewound or closed cancels its job: a
+waiting job is dropped, a running search is stopped. Queue wait and search time are
+recorded in ``instrument.Histogram``s.
+
+Run from `src` to simulate a host: `python -m game.scheduler --games 50 --workers 4`.
+"""
+
+import argparse
+import heapq
+import itertools
+import multiprocessing
+import queue
+import random
+import time
+from dataclasses import dataclass
+
+from . import state
+from .instrument import Histogram
+from .search import Searcher
+from .ttable import TranspositionTable
+
+MIN_SEARCH_TIME = 0.01  # Seconds a search gets even when its deadline has passed
+
+
+@dataclass
+class BotMove:    # pylint: disable=too-many-instance-attributes
+    """A finished bot move."""
+    game_id: object
+    job_id: int
+    move: int
+    score: int
+    depth: int
+    nodes: int
+    queue_wait: float   # Seconds from submit to the start of the search
+    search_time: float  # Seconds the worker searched
+    late: bool          # Finished after the deadline
+
+
+@dataclass
+class _Job:       # pylint: disable=too-many-instance-attributes
+    """A submitted search, waiting or running."""
+    job_id: int
+    game_id: object
+    board: int
+    side: int
+    max_depth: int
+    submitted: float
+    deadline: float
+    started: float = None
+    worker: int = None
+    cancelled: bool = False
+
+
+def _worker(tasks, results, stop, table_capacity):
+    """Worker process: search each job received until told to quit."""
+    searcher = Searcher(table=TranspositionTable(table_capacity))
+    for job_id, board, side, max_depth, time_limit in iter(tasks.get, None):
+        result = searcher.search(board, side, max_depth, time_limit, stop_event=stop)
+        results.put((job_id, result.move, result.score, result.depth, result.nodes,
+                     result.elapsed))
+
+
+class BotScheduler:     # pylint: disable=too-many-instance-attributes
+    """Runs bot searches for many games on a bounded pool of worker processes."""
+
+    def __init__(self, workers=None, max_depth=8, table_capacity=1 << 18, margin=0.02):
+        """
+        Args:
+            workers (int, optional): Worker processes (default: CPU count)
+            max_depth (int): Default maximum search depth
+            table_capacity (int): Transposition table entries per worker
+            margin (float): Seconds kept back from each budget to return the move
+        """
+        self.max_depth = max_depth
+        self.margin = margin
+        self._results = multiprocessing.Queue()
+        self._workers = []
+        for _ in range(workers or multiprocessing.cpu_count()):
+            tasks, stop = multiprocessing.Queue(), multiprocessing.Event()
+            process = multiprocessing.Process(
+                target=_worker, args=(tasks, self._results, stop, table_capacity), daemon=True
+            )
+            process.start()
+            self._workers.append((process, tasks, stop))
+        self._idle = list(range(len(self._workers)))
+        self._heap = []                 # (deadline, job_id) of waiting jobs
+        self._jobs = {}                 # job_id -> _Job, waiting or running
+        self._by_game = {}              # game_id -> job_id
+        self._ids = itertools.count(1)
+        self.queue_wait = Histogram()
+        self.search_time = Histogram()
+        self.counters = {'submitted': 0, 'completed': 0, 'cancelled': 0, 'late': 0}
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def submit(self, game_id, board, side, budget, max_depth=None):
+        """
+        Queue a bot move; replaces the game's earlier job if it has one.
+
+        Args:
+            game_id (hashable): Host's game identifier
+            board (int): Packed board
+            side (int): Player index the bot moves for
+            budget (float): Seconds from now until the move is due
+            max_depth (int, optional): Depth limit (default: the scheduler's)
+
+        Returns:
+            int: Job id
+        """
+        self.cancel(game_id)
+        now = time.perf_counter()
+        job = _Job(next(self._ids), game_id, board, side, max_depth or self.max_depth,
+                   now, now + budget)
+        self._jobs[job.job_id] = job
+        self._by_game[game_id] = job.job_id
+        heapq.heappush(self._heap, (job.deadline, job.job_id))
+        self.counters['submitted'] += 1
+        self._dispatch()
+        return job.job_id
+
+    def submit_game(self, game_id, game, budget, max_depth=None):
+        """Queue a bot move for the player to move in a Game; see submit."""
+        board, side = state.encode_game(game)
+        return self.submit(game_id, board, side, budget, max_depth)
+
+    def cancel(self, game_id):
+        """
+        Drop a game's job, e.g. when the game is rewound or closed.
+
+        Args:
+            game_id (hashable): Host's game identifier
+
+        Returns:
+            bool: True if the game had a waiting or running job
+        """
+        job = self._jobs.get(self._by_game.pop(game_id, None))
+        if job is None:
+            return False
+        job.cancelled = True
+        self.counters['cancelled'] += 1
+        if job.worker is not None:
+            self._workers[job.worker][2].set()      # Stop the running search
+        else:
+            del self._jobs[job.job_id]              # Left in the heap, skipped on dispatch
+        return True
+
+    def poll(self, timeout=0.0):
+        """
+        Collect finished moves and start waiting jobs on idle workers.
+
+        Args:
+            timeout (float): Seconds to wait for the first finished move, if none is ready
+
+        Returns:
+            list: BotMove for each move finished since the last call (cancelled
+                jobs are not reported)
+        """
+        finished = []
+        block = timeout > 0
+        while True:
+            try:
+                reply = self._results.get(block, timeout) if block else \
+                    self._results.get_nowait()
+            except queue.Empty:
+                break
+            block = False
+            move = self._finish(reply)
+            if move is not None:
+                finished.append(move)
+        self._dispatch()
+        return finished
+
+    def _finish(self, reply):
+        """Free the job's worker and turn a worker's reply into a BotMove unless cancelled."""
+        job_id, move, score, depth, nodes, elapsed = reply
+        job = self._jobs.pop(job_id)
+        self._idle.append(job.worker)
+        if job.cancelled:
+            return None
+        del self._by_game[job.game_id]
+        now = time.perf_counter()
+        self.search_time.record(elapsed)
+        self.counters['completed'] += 1
+        late = now > job.deadline
+        self.counters['late'] += late
+        return BotMove(job.game_id, job_id, move, score, depth, nodes,
+                       job.started - job.submitted, elapsed, late)
+
+    def _dispatch(self):
+        """Start the waiting jobs with the earliest deadlines on idle workers."""
+        while self._idle and self._heap:
+            deadline, job_id = heapq.heappop(self._heap)
+            job = self._jobs.get(job_id)
+            if job is None:
+                continue    # Cancelled while waiting
+            worker = self._idle.pop()
+            _, tasks, stop = self._workers[worker]
+            stop.clear()
+            job.worker = worker
+            job.started = time.perf_counter()
+            self.queue_wait.record(job.started - job.submitted)
+            time_limit = max(MIN_SEARCH_TIME, deadline - job.started - self.margin)
+            tasks.put((job_id, job.board, job.side, job.max_depth, time_limit))
+
+    @property
+    def waiting(self):
+        """Jobs queued for a worker."""
+        return sum(1 for job in self._jobs.values() if job.worker is None)
+
+    @property
+    def running(self):
+        """Jobs being searched, including cancelled ones still stopping."""
+        return len(self._workers) - len(self._idle)
+
+    def metrics(self):
+        """
+        Returns:
+            dict: Counters, current queue sizes and queue wait/search time summaries
+        """
+        return {
+            **self.counters,
+            'waiting': self.waiting,
+            'running': self.running,
+            'queue_wait': self.queue_wait.summary(),
+            'search_time': self.search_time.summary(),
+        }
+
+    def close(self):
+        """Stop every search and the worker processes."""
+        for process, tasks, stop in self._workers:
+            stop.set()
+            tasks.put(None)
+        for process, _, _ in self._workers:
+            process.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def simulate(num_games, workers, budget, max_depth=8, seed=0):
+    """
+    Host num_games random-player-versus-bot games at once until they all finish.
+
+    The random player moves instantly, so the bots' jobs pile up on the pool.
+
+    Returns:
+        dict: Scheduler metrics, with the wall time and bot moves per second
+    """
+    rng = random.Random(seed)
+    games = {game_id: (0, 0) for game_id in range(num_games)}
+    start = time.perf_counter()
+    with BotScheduler(workers, max_depth) as scheduler:
+
+        def play(game_id, board, side, move):
+            """Play a move; the random player answers at once, then the bot is asked."""
+            while True:
+                board, winner = state.apply_move(board, side, move)
+                side = 1 - side
+                if winner or not state.legal_moves(board, side):
+                    del games[game_id]
+                    return
+                if side == 1:
+                    games[game_id] = (board, side)
+                    scheduler.submit(game_id, board, side, budget)
+                    return
+                move = rng.choice(state.legal_moves(board, side))
+
+        for game_id in list(games):
+            play(game_id, 0, 0, rng.choice(state.legal_moves(0, 0)))
+        while games:
+            for bot_move in scheduler.poll(timeout=0.05):
+                board, side = games[bot_move.game_id]
+                play(bot_move.game_id, board, side, bot_move.move)
+        metrics = scheduler.metrics()
+    metrics['wall_s'] = time.perf_counter() - start
+    metrics['moves_per_s'] = metrics['completed'] / metrics['wall_s']
+    return metrics
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Simulate a host with many bot games.')
+    parser.add_argument('--games', type=int, default=50, help='games hosted at once')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--budget', type=float, default=1.0, help='seconds per bot move')
+    parser.add_argument('--depth', type=int, default=8, help='maximum search depth')
+    args = parser.parse_args(argv)
+
+    metrics = simulate(args.games, args.workers, args.budget, args.depth)
+    print(f"{metrics['completed']} bot moves in {metrics['wall_s']:.1f}s "
+          f"({metrics['moves_per_s']:.1f}/s), {metrics['late']} late")
+    for name in ('queue_wait', 'search_time'):
+        summary = metrics[name]
+        print(f"  {name:<12} p50 {summary['p50_us'] / 1e3:8.1f} ms  "
+              f"p95 {summary['p95_us'] / 1e3:8.1f} ms  max {summary['max_us'] / 1e3:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""
+Alpha-beta search over compact Gobblet Jr. positions.
+"""
+
+import time
+from dataclasses import dataclass
+
+from . import state
+from .evaluate import default_evaluator
+from .ttable import TranspositionTable
+
+WIN_SCORE = 1000
+# Scores beyond this are forced wins/losses, stored in the table relative to the node
+MATE_BOUND = WIN_SCORE - 100
+
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# How many nodes to search between checks of the clock and the stop flag
+CHECK_INTERVAL = 1024
+
+
+class SearchAborted(Exception):
+    """Raised inside the search when it runs out of time or is cancelled."""
+
+
+@dataclass
+class SearchResult:     # pylint: disable=too-few-public-methods
+    """Outcome of a search from one position."""
+    move: int = None
+    score: int = 0
+    depth: int = 0
+    nodes: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def nodes_per_second(self):
+        """Search speed over the whole search."""
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def line_score(board, side):
+    """
+    Cheap static evaluation: open two-in-a-rows for each side.
+
+    Args:
+        board (int): Packed board
+        side (int): Player index to score for
+
+    Returns:
+        int: Score from side's point of view
+    """
+    owners = [state.OWNER[code] for code in state.cells_of(board)]
+    mine = side + 1
+    score = 0
+    for a, b, c in state.LINES:
+        line = (owners[a], owners[b], owners[c])
+        own = line.count(mine)
+        other = 3 - own - line.count(0)
+        if not other:
+            score += own * own
+        elif not own:
+            score -= other * other
+    return score
+
+
+def _to_table(score, ply):
+    """Make a forced-win score relative to the node before storing it."""
+    if score > MATE_BOUND:
+        return score + ply
+    if score < -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def _from_table(score, ply):
+    """Make a stored forced-win score relative to the root again."""
+    if score > MATE_BOUND:
+        return score - ply
+    if score < -MATE_BOUND:
+        return score + ply
+    return score
+
+
+class Searcher:     # pylint: disable=too-few-public-methods
+    """Iterative-deepening negamax with alpha-beta pruning and a transposition table."""
+
+    def __init__(self, evaluate=None, table=None):
+        """
+        Args:
+            evaluate (callable, optional): evaluate(board, side) -> int static score;
+                by default a TableEvaluator, which scores like line_score, only faster
+            table (TranspositionTable, optional): Table to share between searchers
+        """
+        self.evaluate = evaluate or default_evaluator()
+        self.table = table if table is not None else TranspositionTable()
+        self.nodes = 0
+        self._deadline = None
+        self._stop_event = None
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def search(self, board, side, max_depth=8, time_limit=None, stop_event=None, *,
+               new_search=True):
+        """
+        Search a position and return the best move found.
+
+        The table is kept between calls, so searching a position whose subtree was
+        already explored (for example while pondering) completes the first depths
+        almost instantly.
+
+        Args:
+            board (int): Packed board
+            side (int): Player index to move
+            max_depth (int): Maximum depth in plies
+            time_limit (float, optional): Seconds before the search is abandoned
+            stop_event (threading.Event, optional): Set to cancel the search
+            new_search (bool): Start a new table generation; False for one of many
+                searches made for the same move, e.g. while pondering
+
+        Returns:
+            SearchResult: Best move and score of the deepest completed iteration
+        """
+        start = time.perf_counter()
+        self.nodes = 0
+        self._deadline = start + time_limit if time_limit is not None else None
+        self._stop_event = stop_event
+        if new_search:
+            self.table.new_search()
+
+        moves = state.legal_moves(board, side)
+        result = SearchResult(move=moves[0] if moves else None)
+        for depth in range(1, max_depth + 1 if moves else 1):
+            try:
+                score, move = self._root(board, side, depth, moves)
+            except SearchAborted:
+                break
+            result.move, result.score, result.depth = move, score, depth
+            if abs(score) > MATE_BOUND:
+                break
+
+        result.nodes = self.nodes
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    def _check_abort(self):
+        """Raise SearchAborted if the deadline has passed or a stop was requested."""
+        if self._stop_event is not None and self._stop_event.is_set():
+            raise SearchAborted
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise SearchAborted
+
+    @staticmethod
+    def _ordered(moves, entry):
+        """Put the table's best move for this position first."""
+        if entry is not None and entry[3] in moves:
+            best = entry[3]
+            return [best] + [move for move in moves if move != best]
+        return moves
+
+    def _root(self, board, side, depth, moves):
+        """Search every root move to the given depth."""
+        key = state.position_key(board, side)
+        alpha = -WIN_SCORE - 1
+        best_move = None
+        for move in self._ordered(moves, self.table.probe(key)):
+            score = self._score_move(board, side, move, depth, -WIN_SCORE - 1, -alpha, 0)
+            if score > alpha:
+                alpha, best_move = score, move
+        self.table.store(key, depth, alpha, EXACT, best_move)
+        return alpha, best_move
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def _score_move(self, board, side, move, depth, alpha, beta, ply):
+        """Score one move from the mover's point of view."""
+        child, winner = state.apply_move(board, side, move)
+        if winner:
+            return WIN_SCORE - ply - 1 if winner == side + 1 else -(WIN_SCORE - ply - 1)
+        return -self._negamax(child, 1 - side, depth - 1, -beta, -alpha, ply + 1)
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments,too-many-locals
+    def _negamax(self, board, side, depth, alpha, beta, ply):
+        """Alpha-beta search of a non-terminal position."""
+        self.nodes += 1
+        if not self.nodes % CHECK_INTERVAL:
+            self._check_abort()
+
+        if depth <= 0:
+            return self.evaluate(board, side)
+
+        key = state.position_key(board, side)
+        entry = self.table.probe(key)
+        if entry is not None and entry[0] >= depth:
+            score = _from_table(entry[1], ply)
+            flag = entry[2]
+            if (flag == EXACT or (flag == LOWER and score >= beta)
+                    or (flag == UPPER and score <= alpha)):
+                return score
+
+        moves = state.legal_moves(board, side)
+        if not moves:
+            return 0
+
+        original_alpha = alpha
+        best_score = -WIN_SCORE - 1
+        best_move = None
+        for move in self._ordered(moves, entry):
+            score = self._score_move(board, side, move, depth, alpha, beta, ply)
+            if score > best_score:
+                best_score, best_move = score, move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score <= original_alpha:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table.store(key, depth, _to_table(best_score, ply), flag, best_move)
+        return best_score
@@ -0,0 +1,205 @@
+"""
+Compact, versioned binary save and load of whole games.
+
+A saved game is the packed position (see ``game.state``) plus everything Game keeps
+beside it: who is to move, whether and how the game ended, the draw rule options
+and repetition counts, and the full rewind history (``History.to_bytes``). Pieces
+are rebuilt from the position on load, as rewind does, so no objects are pickled
+and a saved game is typically under a hundred bytes.
+
+Layout (little-endian)::
+
+    header        magic 'GJG', version, side, flags (bit 0: game over,
+                  bits 1-2: winner color code), packed board (8 bytes),
+                  repetition limit, max plies, history limit (4 bytes each, -1: None),
+                  number of repetition counts (4 bytes)
+    counts        position keys (8 bytes each), then their counts (4 bytes each)
+    history       the rest, see History.to_bytes
+
+``dumps_many``/``loads_many`` frame many games in one buffer for handing off a
+server's or a UI's live games at once.
+"""
+
+import struct
+from array import array
+
+from .game import Game
+from .history import History
+from .state import (
+    CELLS, CELL_BITS, COLORS, COLOR_CODES, PIECES_PER_SIZE, cells_of, encode_game,
+    supply_counts
+)
+
+MAGIC = b'GJG'
+VERSION = 1
+
+_HEADER = struct.Struct('<3sBBBqiiiI')
+_LENGTH = struct.Struct('<I')   # Frame length in dumps_many
+BOARD_BITS = CELLS * CELL_BITS
+
+
+def _option(value):
+    """Encode an optional limit."""
+    return -1 if value is None else value
+
+
+def _unoption(value):
+    """Decode an optional limit."""
+    return None if value < 0 else value
+
+
+def dumps(game):
+    """
+    Serialize a game.
+
+    Args:
+        game (Game): Game to save
+
+    Returns:
+        bytes: Data for loads
+    """
+    board, side = encode_game(game)
+    flags = int(game.game_over)
+    if game.winner is not None:
+        flags |= COLOR_CODES[game.winner] << 1
+    counts = game.position_counts
+    return b''.join((
+        _HEADER.pack(MAGIC, VERSION, side, flags, board, _option(game.repetition_limit),
+                     _option(game.max_plies), _option(game.moves_history.memory_limit),
+                     len(counts)),
+        array('q', counts.keys()).tobytes(),
+        array('I', counts.values()).tobytes(),
+        game.moves_history.to_bytes(),
+    ))
+
+
+def _unpack_header(data):
+    """
+    Read and check the header of a saved game.
+
+    Args:
+        data (memoryview): Serialized game
+
+    Returns:
+        tuple: (side, flags, board, repetition limit, max plies, history limit,
+            number of repetition counts)
+
+    Raises:
+        ValueError: See loads
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError('truncated game data')
+    magic, version, *header = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('not a saved game')
+    if version != VERSION:
+        raise ValueError(f"unsupported saved game version {version}")
+    side, flags, board = header[:3]
+    if side not in (0, 1):
+        raise ValueError(f"bad side to move {side}")
+    if flags >> 1 > len(COLOR_CODES):
+        raise ValueError(f"bad winner code {flags >> 1}")
+    _check_board(board)
+    return tuple(header)
+
+
+def _check_board(board):
+    """
+    Check a packed board could occur in a game.
+
+    Args:
+        board (int): Packed board
+
+    Raises:
+        ValueError: If the board is out of range, a cell holds a piece of no player,
+            or a player has more than PIECES_PER_SIZE pieces of a size on the board
+    """
+    if not 0 <= board < 1 << BOARD_BITS:
+        raise ValueError('bad packed board')
+    for cell, code in enumerate(cells_of(board)):
+        if any((code >> (2 * size)) & 3 == 3 for size in range(3)):
+            raise ValueError(f"bad piece code in cell {cell}")
+    for side in (0, 1):
+        if min(supply_counts(board, side)) < 0:
+            raise ValueError(f"more than {PIECES_PER_SIZE} pieces of a size for "
+                             f"{COLORS[side]}")
+
+
+def loads(data):
+    """
+    Rebuild a game saved by dumps.
+
+    Args:
+        data (bytes-like): Serialized game
+
+    Returns:
+        Game: The game, in the same state, with the same options and history
+
+    Raises:
+        ValueError: If the data is not a saved game, is from another version, is
+            truncated or holds an impossible position
+    """
+    data = memoryview(data)
+    (side, flags, board, repetition_limit, max_plies, history_limit,
+     num_counts) = _unpack_header(data)
+    offset = _HEADER.size
+    keys_end = offset + 8 * num_counts
+    counts_end = keys_end + 4 * num_counts
+    if len(data) < counts_end:
+        raise ValueError('truncated game data')
+
+    game = Game(_unoption(repetition_limit), _unoption(max_plies), _unoption(history_limit))
+    keys, counts = array('q'), array('I')
+    keys.frombytes(data[offset:keys_end])
+    counts.frombytes(data[keys_end:counts_end])
+    game.set_position(board, side, flags >> 1)
+    game.moves_history = History.from_bytes(data[counts_end:], game.moves_history.memory_limit)
+    game.game_over = bool(flags & 1)    # Also draws, which have no winner
+    game.position_counts = dict(zip(keys, counts))
+    return game
+
+
+def dumps_many(games):
+    """
+    Serialize many games into one buffer, each framed by its length.
+
+    Args:
+        games (iterable): Games to save
+
+    Returns:
+        bytes: Data for loads_many
+    """
+    frames = []
+    for game in games:
+        data = dumps(game)
+        frames.append(_LENGTH.pack(len(data)))
+        frames.append(data)
+    return b''.join(frames)
+
+
+def loads_many(data):
+    """
+    Rebuild games saved by dumps_many.
+
+    Args:
+        data (bytes-like): Serialized games
+
+    Returns:
+        list: The games, in order
+
+    Raises:
+        ValueError: If any game cannot be loaded
+    """
+    data = memoryview(data)
+    games = []
+    offset = 0
+    while offset < len(data):
+        if len(data) - offset < _LENGTH.size:
+            raise ValueError('truncated game data')
+        (size,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        if len(data) - offset < size:
+            raise ValueError('truncated game data')
+        games.append(loads(data[offset:offset + size]))
+        offset += size
+    return games
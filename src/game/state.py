@@ -0,0 +1,411 @@
+"""
+Compact integer encoding of Gobblet Jr. positions.
+
+A cell holds at most one piece of each size, so its whole stack fits in six bits:
+two bits per size (0 = empty, 1 = red, 2 = yellow), small pieces in the low bits.
+The nine cells pack into a single int (cell 0 in the low bits), which together with
+the side to move identifies a position completely, since every piece not on the
+board is still in its owner's supply.
+
+Moves are small ints too: ``src * 9 + dst``, where ``src`` is a cell index (0-8)
+for moving a piece already on the board, or ``9 + size`` (9-11) for placing a piece
+from the supply, and ``dst`` is the destination cell index.
+"""
+
+CELLS = 9
+CELL_BITS = 6
+CELL_MASK = (1 << CELL_BITS) - 1
+SUPPLY_BASE = CELLS
+NUM_MOVES = (SUPPLY_BASE + 3) * CELLS
+
+COLORS = ('red', 'yellow')
+COLOR_CODES = {'red': 1, 'yellow': 2}
+PIECES_PER_SIZE = 2
+
+# Lines in the same order Board.check_winner scans them: rows, columns, diagonals
+LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
+
+def _symmetries():
+    """The 8 rotations/reflections of the board as cell permutations."""
+    perms = []
+    for transpose in (False, True):
+        for flip_rows in (False, True):
+            for flip_cols in (False, True):
+                perm = []
+                for cell in range(CELLS):
+                    row, col = divmod(cell, 3)
+                    if transpose:
+                        row, col = col, row
+                    if flip_rows:
+                        row = 2 - row
+                    if flip_cols:
+                        col = 2 - col
+                    perm.append(row * 3 + col)
+                perms.append(tuple(perm))
+    return tuple(perms)
+
+
+# new_cells[i] = cells[perm[i]]; the identity comes first
+SYMMETRIES = _symmetries()
+
+
+def _top(code):
+    """Return (size, color code) of the visible piece in a cell code, or (-1, 0)."""
+    for size in (2, 1, 0):
+        color = (code >> (2 * size)) & 3
+        if color:
+            return size, color
+    return -1, 0
+
+
+TOP_SIZE = tuple(_top(code)[0] for code in range(64))
+OWNER = tuple(_top(code)[1] for code in range(64))
+# Pieces of each player in a cell code, as one 4-bit count per size, so summing
+# over the cells counts every size at once
+_PLACED = tuple(
+    tuple(
+        sum(1 << (4 * size) for size in range(3) if (code >> (2 * size)) & 3 == color)
+        for code in range(64)
+    )
+    for color in (1, 2)
+)
+
+
+def encode_move(src, dst):
+    """
+    Args:
+        src (int): Source cell (0-8) or SUPPLY_BASE + size for a placement
+        dst (int): Destination cell (0-8)
+
+    Returns:
+        int: Encoded move
+    """
+    return src * CELLS + dst
+
+
+def decode_move(move):
+    """
+    Args:
+        move (int): Encoded move
+
+    Returns:
+        tuple: (src, dst)
+    """
+    return divmod(move, CELLS)
+
+
+def move_name(move):
+    """
+    Readable move: 'L@1,1' places a large piece at row 1, column 1; '0,0>2,2' moves
+    the top piece from row 0, column 0 to row 2, column 2.
+
+    Args:
+        move (int): Encoded move
+
+    Returns:
+        str: Move in the notation parse_move reads
+    """
+    src, dst = divmod(move, CELLS)
+    to_row, to_col = divmod(dst, 3)
+    if src >= SUPPLY_BASE:
+        return f"{'SML'[src - SUPPLY_BASE]}@{to_row},{to_col}"
+    return f"{src // 3},{src % 3}>{to_row},{to_col}"
+
+
+def parse_move(text):
+    """
+    Args:
+        text (str): Move in move_name notation, or an encoded move as a number
+
+    Returns:
+        int: Encoded move
+
+    Raises:
+        ValueError: If the text is not a move
+    """
+    try:
+        if text.isdigit():
+            move = int(text)
+        elif '@' in text:
+            size, dst = text.split('@')
+            move = encode_move(SUPPLY_BASE + ('S', 'M', 'L').index(size.upper()), _parse_cell(dst))
+        else:
+            src, dst = text.split('>')
+            move = encode_move(_parse_cell(src), _parse_cell(dst))
+    except ValueError:
+        raise ValueError(f"not a move: {text!r}") from None
+    if not 0 <= move < NUM_MOVES:
+        raise ValueError(f"not a move: {text!r}")
+    return move
+
+
+def _parse_cell(text):
+    """'row,col' -> cell index."""
+    row, col = map(int, text.split(','))
+    if not (0 <= row < 3 and 0 <= col < 3):
+        raise ValueError(text)
+    return row * 3 + col
+
+
+def cells_of(board):
+    """
+    Unpack a board int into its nine cell codes.
+
+    Args:
+        board (int): Packed board
+
+    Returns:
+        list: Nine cell codes
+    """
+    return [(board >> (CELL_BITS * i)) & CELL_MASK for i in range(CELLS)]
+
+
+def pack(cells):
+    """
+    Pack nine cell codes into a board int.
+
+    Args:
+        cells (list): Nine cell codes
+
+    Returns:
+        int: Packed board
+    """
+    board = 0
+    for i, code in enumerate(cells):
+        board |= code << (CELL_BITS * i)
+    return board
+
+
+def position_key(board, side):
+    """
+    Single int identifying a position, suitable as a hash/cache key.
+
+    Args:
+        board (int): Packed board
+        side (int): Player index to move (0 = red, 1 = yellow)
+
+    Returns:
+        int: Position key
+    """
+    return (board << 1) | side
+
+
+def canonical_key(board, side):
+    """
+    Position key shared by all rotations and reflections of a position.
+
+    Symmetric positions play identically, except that when one move completes lines
+    for both players, Board.check_winner picks whichever line it scans first.
+
+    Args:
+        board (int): Packed board
+        side (int): Player index to move
+
+    Returns:
+        int: Smallest position key over the 8 symmetries
+    """
+    cells = cells_of(board)
+    return min(
+        position_key(pack([cells[i] for i in perm]), side) for perm in SYMMETRIES
+    )
+
+
+def encode_game(game):
+    """
+    Encode the position of a Game.
+
+    Args:
+        game (Game): Game to encode
+
+    Returns:
+        tuple: (board, side)
+    """
+    cells = []
+    for row in game.board.grid:
+        for piece in row:
+            code = 0
+            while piece is not None:
+                code |= COLOR_CODES[piece.color] << (2 * piece.size)
+                piece = piece.gobbled_piece
+            cells.append(code)
+    return pack(cells), game.current_player_idx
+
+
+def supply_counts(board, side):
+    """
+    Count the pieces of each size still in a player's supply.
+
+    Args:
+        board (int): Packed board
+        side (int): Player index
+
+    Returns:
+        list: Counts indexed by size
+    """
+    table = _PLACED[side]
+    placed = 0
+    for i in range(CELLS):
+        placed += table[(board >> (CELL_BITS * i)) & CELL_MASK]
+    return [PIECES_PER_SIZE - ((placed >> (4 * size)) & 15) for size in range(3)]
+
+
+def winner_of(cells):
+    """
+    Find the winning color following Board.check_winner's scan order.
+
+    Args:
+        cells (list): Nine cell codes
+
+    Returns:
+        int: Color code of the winner (1 = red, 2 = yellow) or 0
+    """
+    owners = [OWNER[code] for code in cells]
+    for a, b, c in LINES:
+        owner = owners[a]
+        if owner and owner == owners[b] == owners[c]:
+            return owner
+    return 0
+
+
+def legal_moves(board, side):
+    """
+    Generate every legal move for the side to move.
+
+    Placements of the same size are interchangeable, so each size is generated once,
+    largest first.
+
+    Args:
+        board (int): Packed board
+        side (int): Player index to move
+
+    Returns:
+        list: Encoded moves
+    """
+    cells = cells_of(board)
+    tops = [TOP_SIZE[code] for code in cells]
+    counts = supply_counts(board, side)
+    color = side + 1
+    moves = []
+    for size in (2, 1, 0):
+        if counts[size]:
+            base = (SUPPLY_BASE + size) * CELLS
+            for dst in range(CELLS):
+                if tops[dst] < size:
+                    moves.append(base + dst)
+    for src in range(CELLS):
+        if OWNER[cells[src]] == color:
+            size = tops[src]
+            base = src * CELLS
+            for dst in range(CELLS):
+                if dst != src and tops[dst] < size:
+                    moves.append(base + dst)
+    return moves
+
+
+def move_board(board, side, move):
+    """
+    Apply a legal move without looking for a winner, e.g. to replay known moves.
+
+    Args:
+        board (int): Packed board
+        side (int): Player index making the move
+        move (int): Encoded move, assumed legal
+
+    Returns:
+        int: New board
+    """
+    src, dst = divmod(move, CELLS)
+    if src >= SUPPLY_BASE:
+        size = src - SUPPLY_BASE
+    else:
+        shift = CELL_BITS * src
+        size = TOP_SIZE[(board >> shift) & CELL_MASK]
+        board &= ~(3 << (shift + 2 * size))
+    return board | (side + 1) << (CELL_BITS * dst + 2 * size)
+
+
+def apply_move(board, side, move):
+    """
+    Apply a legal move.
+
+    Args:
+        board (int): Packed board
+        side (int): Player index making the move
+        move (int): Encoded move, assumed legal
+
+    Returns:
+        tuple: (new board, winner color code or 0)
+    """
+    board = move_board(board, side, move)
+    return board, winner_of(cells_of(board))
+
+
+def is_legal(board, side, move):
+    """
+    Check whether an encoded move is legal for the side to move.
+
+    Args:
+        board (int): Packed board
+        side (int): Player index to move
+        move (int): Encoded move
+
+    Returns:
+        bool: True if the move is legal
+    """
+    if not 0 <= move < NUM_MOVES:
+        return False
+    src, dst = divmod(move, CELLS)
+    dst_size = TOP_SIZE[(board >> (CELL_BITS * dst)) & CELL_MASK]
+    if src >= SUPPLY_BASE:
+        size = src - SUPPLY_BASE
+        return supply_counts(board, side)[size] > 0 and dst_size < size
+    code = (board >> (CELL_BITS * src)) & CELL_MASK
+    return src != dst and OWNER[code] == side + 1 and dst_size < TOP_SIZE[code]
+
+
+def move_to_kwargs(game, move):
+    """
+    Translate an encoded move into Game.make_move keyword arguments.
+
+    Args:
+        game (Game): Game the move is for
+        move (int): Encoded move
+
+    Returns:
+        dict: Keyword arguments for Game.make_move, or None if the supply has no
+            piece of the required size
+    """
+    src, dst = divmod(move, CELLS)
+    to_pos = divmod(dst, 3)
+    if src < SUPPLY_BASE:
+        return {'from_pos': divmod(src, 3), 'to_pos': to_pos}
+    size = src - SUPPLY_BASE
+    for idx, piece in enumerate(game.current_player.get_available_pieces()):
+        if piece.size == size:
+            return {'piece_idx': idx, 'to_pos': to_pos}
+    return None
+
+
+def move_from_kwargs(game, piece_idx=None, from_pos=None, to_pos=None):
+    """
+    Translate Game.make_move keyword arguments into an encoded move.
+
+    Args:
+        game (Game): Game the move is for, before the move is made
+        piece_idx (int, optional): Index into the current player's available pieces
+        from_pos (tuple, optional): Position (row, col) to move piece from
+        to_pos (tuple): Position (row, col) to move/place piece to
+
+    Returns:
+        int: Encoded move
+    """
+    dst = to_pos[0] * 3 + to_pos[1]
+    if from_pos is None:
+        size = game.current_player.get_available_pieces()[piece_idx].size
+        return encode_move(SUPPLY_BASE + size, dst)
+    return encode_move(from_pos[0] * 3 + from_pos[1], dst)
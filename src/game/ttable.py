@@ -0,0 +1,266 @@
+"""
+Fixed-size transposition table for search.
+
+Entries live in two flat ``array('q')`` columns (key, packed data) rather than one
+Python object per entry, so memory is fixed at 16 bytes per slot no matter how many
+positions are searched. Slots are grouped in pairs: the first slot of a pair keeps
+the deepest result (unless it is left over from an earlier search), the second
+always takes the newest, so deep results survive while shallow ones keep flowing.
+``SharedTranspositionTable`` keeps the same columns in shared memory for parallel
+search.
+"""
+
+from array import array
+
+EMPTY = -1
+NO_MOVE = 0xFF
+SCORE_OFFSET = 1 << 15
+
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+def pack_entry(depth, score, flag, move, age):
+    """
+    Pack one entry's fields into a non-negative int.
+
+    Args:
+        depth (int): Search depth, 0-255
+        score (int): Score, -32768 to 32767
+        flag (int): Bound type, 0-3
+        move (int or None): Best move, 0-254
+        age (int): Search generation, 0-255
+
+    Returns:
+        int: Packed entry
+    """
+    return ((score + SCORE_OFFSET)
+            | (NO_MOVE if move is None else move) << 16
+            | flag << 24
+            | depth << 26
+            | age << 34)
+
+
+def unpack_entry(data):
+    """
+    Args:
+        data (int): Packed entry
+
+    Returns:
+        tuple: (depth, score, flag, move, age)
+    """
+    move = (data >> 16) & 0xFF
+    return ((data >> 26) & 0xFF, (data & 0xFFFF) - SCORE_OFFSET, (data >> 24) & 3,
+            None if move == NO_MOVE else move, (data >> 34) & 0xFF)
+
+
+class TranspositionTable:     # pylint: disable=too-many-instance-attributes
+    """Bounded table of search results keyed by position key."""
+
+    def __init__(self, capacity=1 << 18, keys=None, data=None):
+        """
+        Args:
+            capacity (int): Number of entries, rounded up to a power of two (min 2)
+            keys (sequence, optional): Preallocated int64 storage for keys, e.g. a
+                memoryview over shared memory; must hold `capacity` items filled with EMPTY
+            data (sequence, optional): Preallocated int64 storage for packed entries
+        """
+        bits = max(1, (capacity - 1).bit_length())
+        self.capacity = 1 << bits
+        self._shift = 64 - (bits - 1)
+        self.keys = keys if keys is not None else array('q', [EMPTY]) * self.capacity
+        self.data = data if data is not None else array('q', [0]) * self.capacity
+        self.age = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _slot(self, key):
+        """Index of the first slot of the pair a key hashes to."""
+        if self._shift >= 64:
+            return 0
+        return (((key * _HASH_MULTIPLIER) & _MASK64) >> self._shift) << 1
+
+    def new_search(self):
+        """Start a new search generation; older entries become preferred for eviction."""
+        self.age = (self.age + 1) & 0xFF
+
+    def probe(self, key):
+        """
+        Look up a position.
+
+        Args:
+            key (int): Position key
+
+        Returns:
+            tuple: (depth, score, flag, move) or None if not stored
+        """
+        slot = self._slot(key)
+        keys = self.keys
+        if keys[slot] != key:
+            slot += 1
+            if keys[slot] != key:
+                self.misses += 1
+                return None
+        self.hits += 1
+        data = self.data[slot]
+        move = (data >> 16) & 0xFF
+        return ((data >> 26) & 0xFF, (data & 0xFFFF) - SCORE_OFFSET, (data >> 24) & 3,
+                None if move == NO_MOVE else move)
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def store(self, key, depth, score, flag, move):
+        """
+        Store a search result, replacing an older or shallower entry.
+
+        Args:
+            key (int): Position key
+            depth (int): Depth searched
+            score (int): Score found
+            flag (int): Bound type of the score
+            move (int or None): Best move found
+        """
+        slot = self._slot(key)
+        keys = self.keys
+        old = keys[slot]
+        if (old in (EMPTY, key) or ((self.data[slot] >> 34) & 0xFF) != self.age
+                or depth >= (self.data[slot] >> 26) & 0xFF):
+            # Take the depth-preferred slot, dropping any copy in the other one
+            if keys[slot + 1] == key:
+                keys[slot + 1] = EMPTY
+        else:
+            # Keep the deeper entry from this search, use the always-replace slot
+            slot += 1
+            old = keys[slot]
+        if old not in (EMPTY, key):
+            self.evictions += 1
+        keys[slot] = key
+        self.data[slot] = pack_entry(depth, score, flag, move, self.age)
+        self.stores += 1
+
+    def clear(self):
+        """Empty the table and reset its statistics."""
+        for slot in range(self.capacity):
+            self.keys[slot] = EMPTY
+        self.hits = self.misses = self.stores = self.evictions = 0
+
+    def __len__(self):
+        """Number of occupied slots."""
+        return sum(1 for key in self.keys if key != EMPTY)
+
+    @property
+    def hit_rate(self):
+        """Fraction of probes that found their position."""
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def statistics(self):
+        """
+        Returns:
+            dict: Capacity, occupancy and probe/store counters
+        """
+        return {
+            'capacity': self.capacity,
+            'filled': len(self),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hit_rate, 4),
+            'stores': self.stores,
+            'evictions': self.evictions,
+        }
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """
+    Transposition table in shared memory, for several search processes at once.
+
+    Stores are not locked. Instead the key column holds ``key ^ data`` (the
+    "lockless hashing" trick): if two processes write the same slot at once and one
+    process's key lands next to the other's data, the pair no longer XORs back to the
+    key, so the torn entry reads as a miss rather than a wrong result. An empty slot
+    (key EMPTY, data 0) XORs to EMPTY, so the base class's bookkeeping is unchanged.
+    """
+
+    def __init__(self, capacity=1 << 18, name=None):
+        """
+        Args:
+            capacity (int): Number of entries, rounded up to a power of two (min 2)
+            name (str, optional): Shared memory block to attach to, as created by
+                another table's process; a new, empty block is created if None
+        """
+        # Imported here so loading the plain table, and search, does not pull in
+        # multiprocessing
+        from multiprocessing import shared_memory  # pylint: disable=import-outside-toplevel
+        bits = max(1, (capacity - 1).bit_length())
+        size = 1 << bits
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=16 * size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.owner = name is None
+        words = self.shm.buf.cast('q')
+        # The block may be rounded up to whole pages, so bound the data column too
+        super().__init__(size, keys=words[:size], data=words[size:2 * size])
+        if self.owner:
+            self.clear()
+
+    @property
+    def name(self):
+        """Shared memory block name, for other processes to attach with."""
+        return self.shm.name
+
+    def probe(self, key):
+        """See TranspositionTable.probe."""
+        slot = self._slot(key)
+        keys, data = self.keys, self.data
+        entry = data[slot]
+        if keys[slot] ^ entry != key:
+            slot += 1
+            entry = data[slot]
+            if keys[slot] ^ entry != key:
+                self.misses += 1
+                return None
+        self.hits += 1
+        move = (entry >> 16) & 0xFF
+        return ((entry >> 26) & 0xFF, (entry & 0xFFFF) - SCORE_OFFSET, (entry >> 24) & 3,
+                None if move == NO_MOVE else move)
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def store(self, key, depth, score, flag, move):
+        """See TranspositionTable.store."""
+        slot = self._slot(key)
+        keys, data = self.keys, self.data
+        entry = data[slot]
+        old = keys[slot] ^ entry
+        if (old in (EMPTY, key) or ((entry >> 34) & 0xFF) != self.age
+                or depth >= (entry >> 26) & 0xFF):
+            if keys[slot + 1] ^ data[slot + 1] == key:
+                keys[slot + 1], data[slot + 1] = EMPTY, 0
+        else:
+            slot += 1
+            old = keys[slot] ^ data[slot]
+        if old not in (EMPTY, key):
+            self.evictions += 1
+        entry = pack_entry(depth, score, flag, move, self.age)
+        data[slot] = entry
+        keys[slot] = key ^ entry
+        self.stores += 1
+
+    def clear(self):
+        """Empty the table (for every attached process) and reset this one's statistics."""
+        self.keys[:] = array('q', [EMPTY]) * self.capacity
+        self.data[:] = array('q', [0]) * self.capacity
+        self.hits = self.misses = self.stores = self.evictions = 0
+
+    def __len__(self):
+        """Number of occupied slots."""
+        return sum(1 for key, entry in zip(self.keys, self.data) if key ^ entry != EMPTY)
+
+    def close(self):
+        """Detach from the shared memory, and free it if this table created it."""
+        self.keys.release()
+        self.data.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,202 @@
+"""
+Offline tuning of the table evaluator's weights against game outcomes.
+
+Positions come from recorded games or self-play (labelled as in ``game.dataset``)
+or from an exported dataset's ``keys``/``labels`` shards. Their ``evaluate.FEATURES``
+counts are built with vectorized NumPy lookups, and the weights are fitted by
+L2-regularized logistic regression (Newton's method) on whether the side to move
+won, or by ridge least squares onto +-LINEAR_TARGET logits. Unfinished games are
+left out. The result is saved as a weights file for ``TableEvaluator.load``.
+
+Run from `src`: `python -m game.tune weights.json --self-play 20000 [--method linear]`.
+"""
+
+import argparse
+
+import numpy as np
+
+from . import evaluate, state
+from .dataset import PositionDataset, labelled_positions
+from .records import read_games, self_play
+
+LINEAR_TARGET = 2.0     # Logit a win is regressed onto by least squares
+
+_CELL_SHIFTS = np.arange(state.CELLS, dtype=np.int64) * state.CELL_BITS
+_CLASSES = np.array(evaluate.CLASSES, dtype=np.int64)                    # (side, code)
+_LINE_PATTERN = np.array(evaluate.LINE_PATTERN, dtype=np.int64)
+_PLACED = np.array([[evaluate.placed_pieces(code, side) for code in range(64)]
+                    for side in (0, 1)], dtype=np.float64)               # (side, code, 6)
+_LINES = np.array(state.LINES, dtype=np.int64)                           # (8, 3)
+
+
+def feature_matrix(boards, sides):
+    """
+    Vectorized evaluate.features.
+
+    Args:
+        boards (array-like): Packed boards
+        sides (array-like): Player index to move for each board
+
+    Returns:
+        ndarray: (N, evaluate.FEATURES) float64 feature counts
+    """
+    boards = np.asarray(boards, dtype=np.int64)
+    sides = np.asarray(sides, dtype=np.int64)
+    cells = (boards[:, None] >> _CELL_SHIFTS) & state.CELL_MASK         # (N, 9)
+    classes = _CLASSES[sides[:, None], cells]                            # (N, 9)
+    triples = classes[:, _LINES]                                         # (N, 8, 3)
+    size = evaluate.CELL_CLASSES
+    patterns = _LINE_PATTERN[(triples[..., 0] * size + triples[..., 1]) * size
+                             + triples[..., 2]]                          # (N, 8)
+    matrix = np.zeros((len(boards), evaluate.FEATURES))
+    np.add.at(matrix, (np.arange(len(boards))[:, None], patterns), 1.0)
+    matrix[:, evaluate.PIECE_FEATURES:evaluate.TEMPO_FEATURE] = \
+        _PLACED[sides[:, None], cells].sum(axis=1)
+    matrix[:, evaluate.TEMPO_FEATURE] = 1.0
+    return matrix
+
+
+def fit_logistic(matrix, wins, l2=1.0, iterations=20, tolerance=1e-6):
+    """
+    L2-regularized logistic regression by Newton's method.
+
+    Args:
+        matrix (ndarray): (N, F) features
+        wins (ndarray): (N,) 1 where the side to move won, 0 where it lost
+        l2 (float): Regularization strength (on every weight)
+        iterations (int): Maximum Newton steps
+        tolerance (float): Stop once the largest weight change is below this
+
+    Returns:
+        ndarray: (F,) weights in logit units
+    """
+    weights = np.zeros(matrix.shape[1])
+    penalty = l2 * np.eye(matrix.shape[1])
+    for _ in range(iterations):
+        predicted = 1.0 / (1.0 + np.exp(-(matrix @ weights)))
+        gradient = matrix.T @ (predicted - wins) + l2 * weights
+        hessian = (matrix * (predicted * (1.0 - predicted))[:, None]).T @ matrix + penalty
+        step = np.linalg.solve(hessian, gradient)
+        weights -= step
+        if np.abs(step).max() < tolerance:
+            break
+    return weights
+
+
+def fit_least_squares(matrix, wins, l2=1.0):
+    """
+    Ridge regression onto +-LINEAR_TARGET.
+
+    Args:
+        matrix (ndarray): (N, F) features
+        wins (ndarray): (N,) 1 where the side to move won, 0 where it lost
+        l2 (float): Regularization strength
+
+    Returns:
+        ndarray: (F,) weights in logit units
+    """
+    targets = (2.0 * wins - 1.0) * LINEAR_TARGET
+    gram = matrix.T @ matrix + l2 * np.eye(matrix.shape[1])
+    return np.linalg.solve(gram, matrix.T @ targets)
+
+
+def report(weights, matrix, wins):
+    """
+    Args:
+        weights (ndarray): Fitted weights
+        matrix (ndarray): Features to score
+        wins (ndarray): Outcomes
+
+    Returns:
+        dict: 'accuracy' of the predicted winner and mean 'log_loss'
+    """
+    logits = matrix @ weights
+    predicted = np.clip(1.0 / (1.0 + np.exp(-logits)), 1e-9, 1 - 1e-9)
+    return {
+        'accuracy': float(np.mean((logits > 0) == (wins > 0.5))),
+        'log_loss': float(-np.mean(wins * np.log(predicted)
+                                   + (1 - wins) * np.log(1 - predicted))),
+    }
+
+
+def load_positions(games=None, dataset=None):
+    """
+    Collect decided positions.
+
+    Args:
+        games (iterable, optional): Move lists to label (deduplicated)
+        dataset (str, optional): Directory written by game.dataset.export_positions
+
+    Returns:
+        tuple: (boards, sides, wins) arrays, wins being 1.0 for a win of the side to move
+    """
+    if dataset is not None:
+        shards = PositionDataset(dataset).shards
+        keys = np.concatenate([np.asarray(shard['keys']) for shard in shards])
+        labels = np.concatenate([np.asarray(shard['labels']) for shard in shards])
+        keys, labels = keys[labels != 0], labels[labels != 0]
+        return keys >> 1, keys & 1, (labels > 0).astype(np.float64)
+    rows = [(board, side, label) for board, side, label, _ in labelled_positions(games)
+            if label]
+    boards, sides, labels = (np.array(column, dtype=np.int64) for column in zip(*rows))
+    return boards, sides, (labels > 0).astype(np.float64)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def tune(boards, sides, wins, method='logistic', l2=1.0, holdout=0.1, seed=0):
+    """
+    Fit weights, holding out a fraction of positions to report on.
+
+    Args:
+        boards (ndarray): Packed boards
+        sides (ndarray): Player index to move
+        wins (ndarray): 1.0 where the side to move won, 0.0 where it lost
+        method (str): 'logistic' or 'linear'
+        l2 (float): Regularization strength
+        holdout (float): Fraction of positions kept out of the fit
+        seed (int): Random seed for the split
+
+    Returns:
+        tuple: (weights list, {'train': report, 'holdout': report})
+    """
+    matrix = feature_matrix(boards, sides)
+    order = np.random.default_rng(seed).permutation(len(wins))
+    split = int(len(wins) * (1 - holdout))
+    train, test = order[:split], order[split:]
+    fit = fit_logistic if method == 'logistic' else fit_least_squares
+    weights = fit(matrix[train], wins[train], l2)
+    reports = {'train': report(weights, matrix[train], wins[train])}
+    if len(test):
+        reports['holdout'] = report(weights, matrix[test], wins[test])
+    return weights.tolist(), reports
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Tune the table evaluator on game outcomes.')
+    parser.add_argument('out', help='weights file to write (JSON)')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--self-play', type=int, metavar='N', help='generate N random games')
+    source.add_argument('--games', nargs='+', metavar='ARCHIVE', help='game archives to read')
+    source.add_argument('--dataset', metavar='DIR', help='exported position shards')
+    parser.add_argument('--method', choices=('logistic', 'linear'), default='logistic')
+    parser.add_argument('--l2', type=float, default=1.0, help='regularization strength')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args(argv)
+
+    if args.self_play is not None:
+        games = self_play(args.self_play, seed=args.seed)
+    elif args.games:
+        games = (moves for path in args.games for moves in read_games(path))
+    else:
+        games = None
+    boards, sides, wins = load_positions(games, args.dataset)
+    weights, reports = tune(boards, sides, wins, args.method, args.l2, seed=args.seed)
+    evaluate.TableEvaluator(weights).save(args.out)
+    print(f"{len(wins)} decided positions, {args.method} fit written to {args.out}")
+    for name, values in reports.items():
+        print(f"  {name:<8} accuracy {values['accuracy']:.3f}  log loss {values['log_loss']:.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,311 @@
+"""
+Gym-style vectorized environment for training agents.
+
+Many games are stepped per call as NumPy arrays of cell codes (see ``game.state``),
+so a batch of moves costs a handful of array operations instead of one Python
+``Game.make_move`` per game. Rules follow ``Game`` exactly, including the rule that a
+move exposing an opponent's line loses.
+
+Actions are encoded moves (``src * 9 + dst``, see ``game.state``), 0 to NUM_MOVES - 1.
+Rewards are from the point of view of the player who just moved: +1 win, -1 loss,
+0 otherwise. An illegal action loses immediately.
+"""
+
+import multiprocessing
+
+import numpy as np
+
+from . import state
+
+OBS_PLANES = 9   # 6 piece planes (color x size), 2 visible-owner planes, side to move
+
+_TOP_SIZE = np.array(state.TOP_SIZE, dtype=np.int8)
+_OWNER = np.array(state.OWNER, dtype=np.int8)
+_LINES = np.array(state.LINES, dtype=np.intp)
+_SIZE_SHIFTS = np.array([0, 2, 4], dtype=np.uint8)
+_CELL_RANGE = np.arange(state.CELLS)
+
+
+def observations(cells, side):
+    """
+    Encode positions as observation tensors.
+
+    Args:
+        cells (ndarray): (N, 9) uint8 cell codes
+        side (ndarray): (N,) player index to move
+
+    Returns:
+        ndarray: (N, OBS_PLANES, 3, 3) float32
+    """
+    count = cells.shape[0]
+    obs = np.zeros((count, OBS_PLANES, state.CELLS), dtype=np.float32)
+    pieces = (cells[:, None, :] >> _SIZE_SHIFTS[None, :, None]) & 3    # (N, size, cell)
+    obs[:, 0:3] = pieces == 1
+    obs[:, 3:6] = pieces == 2
+    owners = _OWNER[cells]
+    obs[:, 6] = owners == 1
+    obs[:, 7] = owners == 2
+    obs[:, 8] = side[:, None]
+    return obs.reshape((count, OBS_PLANES, 3, 3))
+
+
+def action_masks(cells, side):
+    """
+    Legal-action masks.
+
+    Args:
+        cells (ndarray): (N, 9) uint8 cell codes
+        side (ndarray): (N,) player index to move
+
+    Returns:
+        ndarray: (N, NUM_MOVES) bool
+    """
+    count = cells.shape[0]
+    color = (side + 1).astype(np.uint8)
+    tops = _TOP_SIZE[cells]
+    owners = _OWNER[cells]
+    mask = np.zeros((count, state.SUPPLY_BASE + 3, state.CELLS), dtype=bool)
+
+    # Board moves: own visible piece onto a different cell with a smaller top
+    movable = owners == color[:, None]
+    mask[:, :state.SUPPLY_BASE] = (
+        movable[:, :, None]
+        & (tops[:, None, :] < tops[:, :, None])
+        & (_CELL_RANGE[:, None] != _CELL_RANGE[None, :])
+    )
+
+    # Placements: a size still in the supply onto a cell with a smaller top
+    for size in range(3):
+        on_board = (((cells >> _SIZE_SHIFTS[size]) & 3) == color[:, None]).sum(axis=1)
+        in_supply = on_board < state.PIECES_PER_SIZE
+        mask[:, state.SUPPLY_BASE + size] = in_supply[:, None] & (tops < size)
+
+    return mask.reshape(count, state.NUM_MOVES)
+
+
+def winners(cells):
+    """
+    Winning color per position, following Board.check_winner's scan order.
+
+    Args:
+        cells (ndarray): (N, 9) uint8 cell codes
+
+    Returns:
+        ndarray: (N,) int8 color code of the winner (1 = red, 2 = yellow) or 0
+    """
+    lines = _OWNER[cells][:, _LINES]    # (N, 8, 3)
+    complete = (lines[:, :, 0] != 0) & (lines[:, :, 0] == lines[:, :, 1]) \
+        & (lines[:, :, 1] == lines[:, :, 2])
+    first = complete.argmax(axis=1)
+    found = complete[np.arange(cells.shape[0]), first]
+    return np.where(found, lines[np.arange(cells.shape[0]), first, 0], 0).astype(np.int8)
+
+
+class VectorEnv:
+    """Steps many independent games at once."""
+
+    def __init__(self, num_envs, max_steps=200, auto_reset=True):
+        """
+        Args:
+            num_envs (int): Number of games
+            max_steps (int): Moves after which a game is truncated (games can cycle)
+            auto_reset (bool): Reset finished games inside step()
+        """
+        self.num_envs = num_envs
+        self.max_steps = max_steps
+        self.auto_reset = auto_reset
+        self.cells = np.zeros((num_envs, state.CELLS), dtype=np.uint8)
+        self.side = np.zeros(num_envs, dtype=np.int8)
+        self.steps = np.zeros(num_envs, dtype=np.int32)
+
+    def reset(self):
+        """
+        Start every game from the empty board.
+
+        Returns:
+            tuple: (observations, info) where info holds 'action_mask'
+        """
+        self.cells[:] = 0
+        self.side[:] = 0
+        self.steps[:] = 0
+        return self.observe(), {'action_mask': self.action_masks()}
+
+    def observe(self):
+        """
+        Returns:
+            ndarray: (num_envs, OBS_PLANES, 3, 3) float32 observations
+        """
+        return observations(self.cells, self.side)
+
+    def action_masks(self):
+        """
+        Returns:
+            ndarray: (num_envs, NUM_MOVES) bool legal-action masks
+        """
+        return action_masks(self.cells, self.side)
+
+    def _play(self, actions):
+        """
+        Make the legal moves on the boards; illegal or out-of-range ones change nothing.
+
+        Args:
+            actions (ndarray): (num_envs,) int64 encoded moves
+
+        Returns:
+            tuple: (legal mask, mover's color code per game)
+        """
+        rows = np.arange(self.num_envs)
+        in_range = (actions >= 0) & (actions < state.NUM_MOVES)
+        actions = np.where(in_range, actions, 0)
+        legal = in_range & self.action_masks()[rows, actions]
+
+        src, dst = np.divmod(actions, state.CELLS)
+        color = (self.side + 1).astype(np.uint8)
+        placing = src >= state.SUPPLY_BASE
+        src_cell = np.where(placing, 0, src)
+        size = np.where(placing, src - state.SUPPLY_BASE, _TOP_SIZE[self.cells[rows, src_cell]])
+        shift = (2 * np.maximum(size, 0)).astype(np.uint8)
+
+        moving = legal & ~placing
+        self.cells[rows[moving], src_cell[moving]] &= ~(np.uint8(3) << shift[moving])
+        self.cells[rows[legal], dst[legal]] |= color[legal] << shift[legal]
+        return legal, color
+
+    def step(self, actions):
+        """
+        Make one move in every game.
+
+        Args:
+            actions (array-like): (num_envs,) encoded moves
+
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, info). info holds
+                'winner' (color code per game), 'illegal', 'action_mask' and, for
+                games reset by auto_reset, 'final_observation'
+        """
+        legal, color = self._play(np.asarray(actions, dtype=np.int64))
+        winner = winners(self.cells)
+        winner = np.where(legal, winner, 2 - self.side).astype(np.int8)
+        terminated = (winner != 0) | ~legal
+        rewards = np.where(winner == 0, 0.0, np.where(winner == color, 1.0, -1.0))
+        rewards = rewards.astype(np.float32)
+
+        self.steps += 1
+        truncated = ~terminated & (self.steps >= self.max_steps)
+        self.side = np.where(terminated, self.side, 1 - self.side).astype(np.int8)
+
+        info = {'winner': winner, 'illegal': ~legal}
+        done = terminated | truncated
+        if self.auto_reset and done.any():
+            info['final_observation'] = self.observe()
+            self.cells[done] = 0
+            self.side[done] = 0
+            self.steps[done] = 0
+        info['action_mask'] = self.action_masks()
+        return self.observe(), rewards, terminated, truncated, info
+
+    def close(self):
+        """Nothing to release; present for API symmetry with ShardedVectorEnv."""
+
+
+def _shard_worker(conn, num_envs, max_steps, auto_reset):
+    """Subprocess loop serving one VectorEnv shard over a pipe."""
+    env = VectorEnv(num_envs, max_steps, auto_reset)
+    while True:
+        command, data = conn.recv()
+        if command == 'step':
+            conn.send(env.step(data))
+        elif command == 'reset':
+            conn.send(env.reset())
+        elif command == 'action_masks':
+            conn.send(env.action_masks())
+        elif command == 'close':
+            conn.close()
+            return
+
+
+def _concat_info(infos):
+    """Merge per-shard info dicts, filling 'final_observation' where a shard had none."""
+    merged = {}
+    for key in infos[0].keys() | {key for info in infos for key in info}:
+        parts = [info.get(key) for info in infos]
+        if any(part is None for part in parts):
+            template = next(part for part in parts if part is not None)
+            parts = [np.zeros((len(info['winner']),) + template.shape[1:], template.dtype)
+                     if part is None else part for part, info in zip(parts, infos)]
+        merged[key] = np.concatenate(parts)
+    return merged
+
+
+class ShardedVectorEnv:
+    """VectorEnv split across subprocesses, one shard per worker, for multiple cores."""
+
+    def __init__(self, num_envs, num_workers=None, max_steps=200, auto_reset=True):
+        """
+        Args:
+            num_envs (int): Total number of games
+            num_workers (int, optional): Worker processes; defaults to the CPU count
+            max_steps (int): Moves after which a game is truncated
+            auto_reset (bool): Reset finished games inside step()
+        """
+        num_workers = max(1, min(num_workers or multiprocessing.cpu_count(), num_envs))
+        self.num_envs = num_envs
+        self.shard_sizes = [len(part) for part in np.array_split(np.arange(num_envs), num_workers)]
+        self._bounds = np.cumsum(self.shard_sizes)[:-1]
+        self._conns = []
+        self._processes = []
+        for size in self.shard_sizes:
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_shard_worker, args=(child, size, max_steps, auto_reset), daemon=True
+            )
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+
+    def _broadcast(self, command, parts=None):
+        """Send a command to every shard and collect the replies in order."""
+        for index, conn in enumerate(self._conns):
+            conn.send((command, None if parts is None else parts[index]))
+        return [conn.recv() for conn in self._conns]
+
+    def reset(self):
+        """
+        Returns:
+            tuple: (observations, info), as VectorEnv.reset
+        """
+        replies = self._broadcast('reset')
+        return (np.concatenate([obs for obs, _ in replies]),
+                _concat_info([info for _, info in replies]))
+
+    def action_masks(self):
+        """
+        Returns:
+            ndarray: (num_envs, NUM_MOVES) bool legal-action masks
+        """
+        return np.concatenate(self._broadcast('action_masks'))
+
+    def step(self, actions):
+        """
+        Args:
+            actions (array-like): (num_envs,) encoded moves
+
+        Returns:
+            tuple: As VectorEnv.step
+        """
+        parts = np.split(np.asarray(actions, dtype=np.int64), self._bounds)
+        replies = self._broadcast('step', parts)
+        obs, rewards, terminated, truncated = (
+            np.concatenate([reply[index] for reply in replies]) for index in range(4)
+        )
+        return obs, rewards, terminated, truncated, _concat_info([reply[4] for reply in replies])
+
+    def close(self):
+        """Stop the worker processes."""
+        for conn in self._conns:
+            conn.send(('close', None))
+        for process in self._processes:
+            process.join()
+        self._conns = []
+        self._processes = []
@@ -1,91 +1,102 @@
 """
 Main entry point for the Gobblet Jr. game.
 To run the game, navigate to the `src` directory and run `python gobblet.py`.
+
+Only the engine is imported at module level; pygame and the `ui` package are loaded
+once the game window is actually needed, so `--help` and headless tooling stay fast.
 """
 
+import argparse
 import sys
 import os
-import pygame
 
-from game.game import Game
-from ui.renderer import Renderer
-from ui.input_handler import InputHandler
-from ui.constants import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, TITLE, WHITE,
-    PLAYER1_LABEL_POSITION, PLAYER2_LABEL_POSITION,
-    PLAYER1_PIECES_POSITION, PLAYER2_PIECES_POSITION
-)
+# Add the src directory to the Python path, before importing anything from it
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Add the src directory to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# pylint: disable=wrong-import-position
+from game.game import Game
+from game.hints import HintService
+from game.instrument import stats, FrameTimer, PeriodicDump
+from game.ponder import Ponderer
+from ui.constants import WINDOW_WIDTH, WINDOW_HEIGHT, TITLE
+# pylint: enable=wrong-import-position
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument(
+        "--ai", choices=("red", "yellow"),
+        help="let the computer play this color, thinking during your turn"
+    )
+    parser.add_argument(
+        "--stats", metavar="PATH",
+        help="record engine and UI timings, dumping them to PATH (.json or .csv) every 5s"
+    )
+    parser.add_argument(
+        "--fps", action="store_true",
+        help="show FPS and frame time percentiles"
+    )
+    parser.add_argument(
+        "--record", metavar="PATH",
+        help="record the input events to PATH, for replay with `python -m benchmarks.replay`"
+    )
+    return parser.parse_args(argv)
 
 def main():
     """Main function to run the Gobblet Jr. game."""
+    args = parse_args()
+
+    # Load the UI only now that a window is wanted
+    # pylint: disable=import-outside-toplevel
+    import pygame
+    from ui.recording import EventRecorder
+    from ui.session import GameSession
+    # pylint: enable=import-outside-toplevel
+
     pygame.init()   # pylint: disable=no-member
-    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    screen = pygame.display.set_mode(
+        (WINDOW_WIDTH, WINDOW_HEIGHT), pygame.RESIZABLE  # pylint: disable=no-member
+    )
     pygame.display.set_caption(TITLE)
     clock = pygame.time.Clock()
 
     # Initialize game components
-    game = Game()
-    renderer = Renderer(screen)
-    input_handler = InputHandler(game)
+    ponderer = Ponderer(0 if args.ai == "red" else 1) if args.ai else None
+    hints = HintService()
+    session = GameSession(screen, Game(), ponderer=ponderer, hints=hints)
+    recorder = EventRecorder(args.record, (WINDOW_WIDTH, WINDOW_HEIGHT)) if args.record else None
+
+    # Optional instrumentation
+    if args.stats:
+        stats.enable()
+    stats_dump = PeriodicDump(args.stats) if args.stats else None
+    frame_timer = FrameTimer()
 
     running = True
     while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:   # pylint: disable=no-member
-                running = False
-
-            # Check for clicks on the rewind button
-            if (
-                event.type == pygame.MOUSEBUTTONDOWN    # pylint: disable=no-member
-                and event.button == 1
-            ):
-                if renderer.button_rewind_rect.collidepoint(event.pos):
-                    # Attempt a rewind and cancel any dragging
-                    if game.rewind():
-                        input_handler.cancel_drag()
+        events = pygame.event.get()
+        if recorder is not None:
+            recorder.record_frame(events)
+        for event in events:
+            running = session.handle_event(event) and running
 
-            # Pass event to input handler for dragging, etc.
-            input_handler.handle_event(event)
-
-        # Clear the screen
-        screen.fill(WHITE)
-
-        # Draw the board and pieces
-        renderer.draw_board()
-        renderer.draw_board_pieces(game.board)
-
-        # Draw player areas
-        renderer.draw_player_area(
-            game.players[0],
-            PLAYER1_LABEL_POSITION,
-            PLAYER1_PIECES_POSITION,
-            current_player=(game.current_player_idx == 0)
-        )
-        renderer.draw_player_area(
-            game.players[1],
-            PLAYER2_LABEL_POSITION,
-            PLAYER2_PIECES_POSITION,
-            current_player=(game.current_player_idx == 1)
-        )
-
-        # Draw the Rewind button
-        renderer.draw_buttons()
-
-        # Draw game status
-        renderer.draw_game_status(game)
-
-        # Draw any dragged piece
-        is_dragging, piece, pos = input_handler.get_dragging_info()
-        if is_dragging and piece:
-            renderer.draw_dragging_piece(piece, pos)
+        session.update()
+        session.draw(frame_timer if args.fps else None)
 
         # Update the display
         pygame.display.flip()
         clock.tick(60)
-
+        frame_timer.tick()
+        if stats_dump is not None:
+            stats_dump.tick()
+
+    if ponderer is not None:
+        ponderer.cancel()
+    hints.close()
+    if recorder is not None:
+        recorder.close()
+    if args.stats:
+        stats.dump(args.stats)
     pygame.quit()   # pylint: disable=no-member
     sys.exit()
 
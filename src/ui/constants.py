@@ -11,12 +11,23 @@ GRAY = (128, 128, 128)
 RED = (255, 0, 0)
 YELLOW = (255, 255, 0)
 GREEN = (0, 255, 0)
+HINT_COLOR = (0, 160, 255, 90)  # Translucent, drawn over the board
 
 BOARD_ORIGIN = (100, 50)       # Top-left corner of the board
 CELL_SIZE = 100                # Each cell is 100x100
 BOARD_ROWS = 3
 BOARD_COLS = 3
 
+PIECE_RADII = (20, 30, 40)     # By piece size: small, medium, large
+SUPPLY_MARGIN = 20             # First supply piece's centre, right of the pieces position
+SUPPLY_SPACING = 50            # Between supply piece centres
+
+# View controls
+ZOOM_STEP = 0.1
+ZOOM_RANGE = (0.5, 1.3)        # Board zoom, limited so the board stays clear of the supplies
+SCALE_STEP = 0.1
+SCALE_RANGE = (0.5, 2.0)       # Size of the whole game relative to the window
+
 LABEL_OFFSET = 40
 PLAYER1_LABEL_POSITION = (50, 400)
 PLAYER2_LABEL_POSITION = (450, 400)
@@ -0,0 +1,273 @@
+"""
+Headless rendering of recorded games to PNG filmstrips, for reviewing games in bulk.
+
+Each game is replayed move by move through ``Game``, and every position, from the
+start to the last move, is drawn into one tile of a large off-screen surface, tiles
+running left to right and then down. Tiles are drawn the way ``Renderer`` draws the
+game screen, scaled to the tile by a ``View``, but from cached parts: the board and
+player labels are rendered once per player to move, each piece once per size, colour
+and board or supply radius, and each status line once; a tile is then a handful of
+blits. The supply rows are drawn at half size, lowered into the turn outline: at
+full size the large pieces reach over the player labels and out of the outline.
+Games are spread over a pool of worker processes, each with its own renderer and
+SDL's dummy video driver, so no window is ever opened.
+
+Run from the `src` directory:
+`python -m ui.filmstrip OUT_DIR ARCHIVE... --workers 4` (or `--self-play N`).
+"""
+
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+from game import state
+from game.game import Game
+from game.instrument import timed
+from game.records import read_games, self_play
+from .constants import (
+    WHITE, BLACK, GRAY,
+    PLAYER1_LABEL_POSITION, PLAYER2_LABEL_POSITION,
+    PLAYER1_PIECES_POSITION, PLAYER2_PIECES_POSITION,
+)
+from .renderer import Renderer, STATUS_POSITION, status_text
+from .view import supply_slot
+
+TILE_SIZE = (320, 240)  # Pixels per position
+COLUMNS = 8             # Tiles per row of a filmstrip
+TILE_MARGIN = 2         # Pixels between tiles
+SUPPLY_SCALE = 0.5      # Supply piece radii relative to the game screen's
+SUPPLY_DROP = 20        # Layout units the supply rows sit below the game screen's
+
+PLAYER_AREAS = (
+    (PLAYER1_LABEL_POSITION, PLAYER1_PIECES_POSITION),
+    (PLAYER2_LABEL_POSITION, PLAYER2_PIECES_POSITION),
+)
+
+
+class FilmstripRenderer(Renderer):
+    """Draws every position of a game into the tiles of one surface."""
+
+    def __init__(self, tile_size=TILE_SIZE, columns=COLUMNS):
+        """
+        Args:
+            tile_size (tuple): Tile (width, height) in pixels
+            columns (int): Tiles per row
+        """
+        super().__init__(pygame.Surface(tile_size))
+        self.tile_size = tuple(tile_size)
+        self.columns = columns
+        self._backgrounds = {}  # Player index to move, or None once over -> Surface
+        self._sprites = {}      # (size, color, on_board) -> (Surface, radius)
+        self._texts = {}        # (text, colour) -> Surface
+
+    def _background(self, game, turn):
+        """Board grid and player labels, with the outline for the player to move."""
+        background = self._backgrounds.get(turn)
+        if background is None:
+            self.screen.fill(WHITE)
+            self.draw_board()
+            for idx, (label_position, pieces_position) in enumerate(PLAYER_AREAS):
+                self.draw_player_label(game.players[idx], label_position, pieces_position,
+                                       current_player=idx == turn)
+            background = self._backgrounds[turn] = self.screen.copy()
+        return background
+
+    def _sprite(self, piece, on_board):
+        """A piece drawn once on a transparent surface, with its radius."""
+        key = (piece.size, piece.color, on_board)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            radius = self.view.piece_radius(piece.size, on_board)
+            if not on_board:
+                radius = max(1, round(radius * SUPPLY_SCALE))
+            # pylint: disable-next=no-member
+            surface = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            self._draw_circle(surface, piece, (radius, radius), radius)
+            sprite = self._sprites[key] = (surface, radius)
+        return sprite
+
+    def _text(self, text, color):
+        """A line of text rendered once."""
+        surface = self._texts.get((text, color))
+        if surface is None:
+            surface = self._texts[(text, color)] = self.font.render(text, True, color)
+        return surface
+
+    @timed('FilmstripRenderer.draw_tile')
+    def draw_tile(self, surface, origin, game, ply):
+        """
+        Draw a game's current position into a tile.
+
+        Args:
+            surface (pygame.Surface): Surface holding the tile
+            origin (tuple): Top-left corner of the tile on the surface
+            game (Game): Game to draw
+            ply (int): Moves played, shown in the tile's corner
+        """
+        left, top = origin
+        view = self.view
+        turn = None if game.game_over else game.current_player_idx
+        surface.blit(self._background(game, turn), origin)
+
+        for idx, cell_rect in enumerate(view.cell_rects):
+            piece = game.board.grid[idx // 3][idx % 3]
+            if piece is not None:
+                self._blit_piece(surface, piece, True,
+                                 (left + cell_rect.centerx, top + cell_rect.centery))
+        self._draw_supplies(surface, origin, game)
+
+        x, y = view.to_screen(STATUS_POSITION)
+        surface.blit(self._text(*status_text(game)), (left + x, top + y))
+        surface.blit(self._text(f"Ply {ply}", BLACK), (left + view.length(10),
+                                                       top + view.length(10)))
+
+    def _draw_supplies(self, surface, origin, game):
+        """Draw both players' supply rows into the tile at origin."""
+        left, top = origin
+        for player, (_, pieces_position) in zip(game.players, PLAYER_AREAS):
+            for idx, piece in enumerate(player.get_available_pieces()):
+                slot_x, slot_y = supply_slot(pieces_position, idx)
+                x, y = self.view.to_screen((slot_x, slot_y + SUPPLY_DROP))
+                self._blit_piece(surface, piece, False, (left + x, top + y))
+
+    def _blit_piece(self, surface, piece, on_board, center):
+        """Blit a piece's sprite centred on a point of the surface."""
+        sprite, radius = self._sprite(piece, on_board)
+        surface.blit(sprite, (center[0] - radius, center[1] - radius))
+
+    def _strip_size(self, tiles):
+        """Pixel size of a filmstrip holding a number of tiles."""
+        width, height = self.tile_size
+        columns = min(self.columns, tiles)
+        rows = math.ceil(tiles / self.columns)
+        return (columns * (width + TILE_MARGIN) + TILE_MARGIN,
+                rows * (height + TILE_MARGIN) + TILE_MARGIN)
+
+    def _tile_origin(self, ply):
+        """Top-left corner of a ply's tile."""
+        row, col = divmod(ply, self.columns)
+        width, height = self.tile_size
+        return (TILE_MARGIN + col * (width + TILE_MARGIN),
+                TILE_MARGIN + row * (height + TILE_MARGIN))
+
+    def render(self, moves):
+        """
+        Replay a game and draw every position it passes through.
+
+        Replay stops at a move that is not legal in the game, and the filmstrip is
+        cropped to the positions drawn.
+
+        Args:
+            moves (list): Encoded moves
+
+        Returns:
+            tuple: (filmstrip Surface, number of moves drawn)
+        """
+        strip = pygame.Surface(self._strip_size(len(moves) + 1))
+        strip.fill(GRAY)
+        game = Game()
+        self.draw_tile(strip, self._tile_origin(0), game, 0)
+        ply = 0
+        for move in moves:
+            kwargs = state.move_to_kwargs(game, move)
+            if kwargs is None or not game.make_move(**kwargs):
+                break
+            ply += 1
+            self.draw_tile(strip, self._tile_origin(ply), game, ply)
+        if ply < len(moves):
+            strip = strip.subsurface(pygame.Rect((0, 0), self._strip_size(ply + 1))).copy()
+        return strip, ply
+
+
+_WORKER_RENDERER = None
+
+
+def _init_worker(tile_size, columns):
+    """Pool initializer: a headless pygame and one renderer per worker process."""
+    global _WORKER_RENDERER     # pylint: disable=global-statement
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()   # pylint: disable=no-member
+    _WORKER_RENDERER = FilmstripRenderer(tile_size, columns)
+
+
+def _render_job(job):
+    """Render one game to its PNG file; returns the number of moves drawn."""
+    moves, path = job
+    strip, plies = _WORKER_RENDERER.render(moves)
+    pygame.image.save(strip, path)
+    return plies
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def render_games(games, out_dir, workers=None, tile_size=TILE_SIZE, columns=COLUMNS,
+                 chunksize=8):
+    """
+    Render games to `game_NNNNNN.png` filmstrips, numbered in input order.
+
+    Args:
+        games (iterable): Move lists
+        out_dir (str): Directory for the PNG files (created if missing)
+        workers (int, optional): Worker processes (default: CPU count)
+        tile_size (tuple): Tile (width, height) in pixels
+        columns (int): Tiles per row
+        chunksize (int): Games handed to a worker at a time
+
+    Returns:
+        dict: 'games', 'plies' drawn, 'seconds', 'games_per_s' and 'plies_per_s'
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = ((moves, os.path.join(out_dir, f"game_{idx:06d}.png"))
+            for idx, moves in enumerate(games))
+    start = time.perf_counter()
+    count = plies = 0
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(tuple(tile_size), columns)) as executor:
+        for drawn in executor.map(_render_job, jobs, chunksize=chunksize):
+            count += 1
+            plies += drawn
+    seconds = time.perf_counter() - start
+    return {
+        'games': count,
+        'plies': plies,
+        'seconds': seconds,
+        'games_per_s': count / seconds if seconds else 0.0,
+        'plies_per_s': plies / seconds if seconds else 0.0,
+    }
+
+
+def _tile_size(text):
+    """Parse a WIDTHxHEIGHT tile size."""
+    width, _, height = text.partition('x')
+    return int(width), int(height)
+
+
+def main(argv=None):
+    """Render recorded or self-play games to PNG filmstrips."""
+    parser = argparse.ArgumentParser(description='Render games to PNG filmstrips, headless.')
+    parser.add_argument('out_dir', help='directory for the PNG files')
+    parser.add_argument('archives', nargs='*', help='game archives to render')
+    parser.add_argument('--self-play', type=int, metavar='N', help='render N random games')
+    parser.add_argument('--workers', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--tile', type=_tile_size, default=TILE_SIZE, metavar='WxH',
+                        help='tile size in pixels')
+    parser.add_argument('--columns', type=int, default=COLUMNS, help='tiles per row')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for --self-play')
+    args = parser.parse_args(argv)
+    if not args.archives and args.self_play is None:
+        parser.error('give game archives or --self-play N')
+
+    if args.self_play is not None:
+        games = self_play(args.self_play, seed=args.seed)
+    else:
+        games = (moves for path in args.archives for moves in read_games(path))
+    stats = render_games(games, args.out_dir, args.workers, args.tile, args.columns)
+    print(f"{stats['games']} games, {stats['plies']} moves rendered to {args.out_dir} "
+          f"in {stats['seconds']:.1f}s ({stats['games_per_s']:.1f} games/s, "
+          f"{stats['plies_per_s']:.0f} tiles/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,17 +3,26 @@ This module handles mouse input events for the game.
 """
 
 import pygame
-from .constants import BOARD_ORIGIN, CELL_SIZE, BOARD_ROWS, BOARD_COLS
+from game.instrument import timed
+from .constants import PLAYER1_PIECES_POSITION, PLAYER2_PIECES_POSITION, BOARD_ROWS, BOARD_COLS
+from .view import View
 
 class InputHandler:
     """Handles mouse input events for the game."""
 
-    def __init__(self, game):
+    def __init__(self, game, view=None):
+        """
+        Args:
+            game (Game): Game receiving the moves
+            view (View, optional): View transform shared with the renderer, for hit testing
+        """
         self.game = game
+        self.view = view if view is not None else View()
         self.dragging = False
         self.dragged_piece = None
         self.mouse_pos = (0, 0)
 
+    @timed('InputHandler.handle_event')
     def handle_event(self, event):
         """Handle mouse events for picking up and dropping pieces."""
         if (
@@ -45,30 +54,24 @@ class InputHandler:
             return
 
         current_player = self.game.current_player
-        # Check if click is on player's available pieces
-        for (idx, piece) in enumerate(current_player.get_available_pieces()):
-            # Estimate rough bounding circle for each piece
-            # Player area positions come from the renderer's known layout
-            if current_player.color == 'red':
-                base_x, base_y = (50, 440)
-            else:
-                base_x, base_y = (450, 440)
-
-            piece_x = base_x + 20 + idx * 50
-            piece_y = base_y
-            radius_map = {0: 20, 1: 30, 2: 40}
-            radius = radius_map.get(piece.size, 20)
-            dist = ((pos[0] - piece_x)**2 + (pos[1] - piece_y)**2)**0.5
-            if dist <= radius:
-                self.dragging = True
-                self.dragged_piece = piece
-                self.mouse_pos = pos
-                return
+        # Check if click is on player's available pieces, laid out as the renderer draws them
+        pieces = current_player.get_available_pieces()
+        idx = self.view.supply_piece_at(
+            pos,
+            PLAYER1_PIECES_POSITION if self.game.current_player_idx == 0
+            else PLAYER2_PIECES_POSITION,
+            pieces
+        )
+        if idx is not None:
+            self.dragging = True
+            self.dragged_piece = pieces[idx]
+            self.mouse_pos = pos
+            return
 
         # Check board pieces
-        row = (pos[1] - BOARD_ORIGIN[1]) // CELL_SIZE
-        col = (pos[0] - BOARD_ORIGIN[0]) // CELL_SIZE
-        if 0 <= row < BOARD_ROWS and 0 <= col < BOARD_COLS:
+        cell = self.view.cell_at(pos)
+        if cell is not None:
+            row, col = cell
             piece = self.game.board.grid[row][col]
             if piece and piece.color == current_player.color:
                 self.dragging = True
@@ -81,12 +84,12 @@ class InputHandler:
             self.cancel_drag()
             return
 
-        row = (pos[1] - BOARD_ORIGIN[1]) // CELL_SIZE
-        col = (pos[0] - BOARD_ORIGIN[0]) // CELL_SIZE
+        cell = self.view.cell_at(pos)
+        row, col = cell if cell is not None else (None, None)
 
         # Attempt placing from supply
         if self.dragged_piece in self.game.current_player.get_available_pieces():
-            if 0 <= row < BOARD_ROWS and 0 <= col < BOARD_COLS:
+            if cell is not None:
                 current_player = self.game.current_player
                 piece_idx = current_player.get_available_pieces().index(self.dragged_piece)
                 self.game.make_move(piece_idx=piece_idx, to_pos=(row, col))
@@ -102,12 +105,7 @@ class InputHandler:
                 if old_row is not None:
                     break
 
-            if (
-                old_row is not None
-                and old_col is not None
-                and 0 <= row < BOARD_ROWS
-                and 0 <= col < BOARD_COLS
-            ):
+            if old_row is not None and old_col is not None and cell is not None:
                 self.game.make_move(from_pos=(old_row, old_col), to_pos=(row, col))
 
         self.cancel_drag()
@@ -0,0 +1,84 @@
+"""
+Recording and replaying the input event stream.
+
+A recording is a text file of JSON lines: a header object, then one array per frame
+holding that frame's input events, so a replay reproduces the same events on the same
+frames. Only the event types and attributes the game reacts to are kept.
+"""
+
+import json
+
+import pygame
+
+RECORDING_VERSION = 1
+
+# pylint: disable=no-member
+RECORDED_EVENTS = {
+    pygame.QUIT: (),
+    pygame.KEYDOWN: ('key', 'mod'),
+    pygame.MOUSEBUTTONDOWN: ('pos', 'button'),
+    pygame.MOUSEBUTTONUP: ('pos', 'button'),
+    pygame.MOUSEMOTION: ('pos',),
+    pygame.VIDEORESIZE: ('size',),
+}
+# pylint: enable=no-member
+
+class EventRecorder:
+    """Writes the events of each frame to a recording file."""
+
+    def __init__(self, path, size):
+        """
+        Args:
+            path (str): Recording file
+            size (tuple): Window (width, height) the events were recorded in
+        """
+        self.file = open(path, 'w', encoding='ascii')    # pylint: disable=consider-using-with
+        self.frames = 0
+        self.file.write(json.dumps({'version': RECORDING_VERSION, 'size': list(size)}) + '\n')
+
+    def record_frame(self, events):
+        """
+        Args:
+            events (list): Events handled this frame
+        """
+        kept = []
+        for event in events:
+            attrs = RECORDED_EVENTS.get(event.type)
+            if attrs is not None:
+                kept.append([event.type] + [getattr(event, attr) for attr in attrs])
+        self.file.write(json.dumps(kept, separators=(',', ':')) + '\n')
+        self.frames += 1
+
+    def close(self):
+        """Finish the recording."""
+        self.file.close()
+
+
+def read_recording(path):
+    """
+    Read a recording.
+
+    Args:
+        path (str): Recording file
+
+    Returns:
+        tuple: (header dict, list of frames, each a list of pygame events)
+
+    Raises:
+        ValueError: If the file is not a recording of a supported version
+    """
+    with open(path, encoding='ascii') as recording:
+        header = json.loads(recording.readline() or 'null')
+        if not isinstance(header, dict) or header.get('version') != RECORDING_VERSION:
+            raise ValueError(f"{path} is not a version {RECORDING_VERSION} input recording")
+        frames = []
+        for line in recording:
+            frame = []
+            for event_type, *values in json.loads(line):
+                attrs = dict(zip(RECORDED_EVENTS[event_type], values))
+                for attr in ('pos', 'size'):
+                    if attr in attrs:
+                        attrs[attr] = tuple(attrs[attr])
+                frame.append(pygame.event.Event(event_type, attrs))
+            frames.append(frame)
+    return header, frames
@@ -4,32 +4,82 @@ pieces, player areas, buttons, and game status.
 """
 
 import pygame
+from game.instrument import timed
 from .constants import (
     BLACK, GRAY, RED, YELLOW, GREEN,
-    BOARD_ORIGIN, CELL_SIZE, BOARD_ROWS, BOARD_COLS,
-    BUTTON_WIDTH, BUTTON_HEIGHT,
+    BOARD_ROWS, BOARD_COLS,
+    BUTTON_WIDTH, BUTTON_HEIGHT, HINT_COLOR,
 )
+from .view import View, supply_slot
 
-class Renderer:
+STATUS_POSITION = (250, 10)     # Layout position of the game status line
+
+
+def status_text(game):
+    """
+    Args:
+        game (Game): Game to describe
+
+    Returns:
+        tuple: (status line, text colour): the winner in green once the game is
+            over, otherwise whose turn it is
+    """
+    if game.game_over:
+        if game.winner:
+            return f"Game Over! Winner: {game.winner}", GREEN
+        return "Game Over! No winner", GREEN
+    return f"Current Turn: {game.current_player.color}", BLACK
+
+
+class Renderer:     # pylint: disable=too-many-instance-attributes
     """Handles rendering of the game board, pieces, and UI elements."""
 
-    def __init__(self, screen):
+    def __init__(self, screen, view=None):
+        """
+        Args:
+            screen (pygame.Surface): Surface to draw on
+            view (View, optional): View transform; one fitting the screen by default
+        """
         self.screen = screen
-        self.font = pygame.font.SysFont("Arial", 20)
-        self.font_big = pygame.font.SysFont("Arial", 26)
+        self.view = view if view is not None else View(screen.get_size())
+
+        # Fonts, rebuilt when the view's scale changes
+        self._font_unit = None
+        self.font = None
+        self.font_big = None
+
+        # Buttons, in layout coordinates
+        self._button_rewind_layout = (10, 10, BUTTON_WIDTH, BUTTON_HEIGHT)
+
+        # Overlay of the hint on show, kept while the hint and view stay the same;
+        # (hint key, view version, surface)
+        self._hint_overlay = None
+
+        # Frame stats text, re-rendered a few times per second rather than every frame
+        self._frame_stats_surface = None
+        self._frame_stats_updated = 0
 
-        # Buttons
-        self.button_rewind_rect = pygame.Rect(10, 10, BUTTON_WIDTH, BUTTON_HEIGHT)
+        self._update_fonts()
 
+    def _update_fonts(self):
+        """Create fonts sized for the current view scale."""
+        if self._font_unit != self.view.unit:
+            self._font_unit = self.view.unit
+            self.font = pygame.font.SysFont("Arial", self.view.length(20))
+            self.font_big = pygame.font.SysFont("Arial", self.view.length(26))
+
+    @property
+    def button_rewind_rect(self):
+        """Screen rectangle of the rewind button."""
+        return self.view.rect(*self._button_rewind_layout)
+
+    @timed('Renderer.draw_board')
     def draw_board(self):
         """Draw the 3x3 board grid."""
-        for row in range(BOARD_ROWS):
-            for col in range(BOARD_COLS):
-                rect_x = BOARD_ORIGIN[0] + col * CELL_SIZE
-                rect_y = BOARD_ORIGIN[1] + row * CELL_SIZE
-                cell_rect = pygame.Rect(rect_x, rect_y, CELL_SIZE, CELL_SIZE)
-                pygame.draw.rect(self.screen, GRAY, cell_rect, 2)
+        for cell_rect in self.view.cell_rects:
+            pygame.draw.rect(self.screen, GRAY, cell_rect, self.view.line_width)
 
+    @timed('Renderer.draw_board_pieces')
     def draw_board_pieces(self, board):
         """Draw all pieces on the board."""
         for row in range(BOARD_ROWS):
@@ -40,84 +90,134 @@ class Renderer:
 
     def _draw_piece(self, piece, row, col):
         """Draw a single piece at its board position with an outline."""
-        color = RED if piece.color == "red" else YELLOW
-        radius_map = {0: 20, 1: 30, 2: 40}
-        radius = radius_map.get(piece.size, 20)
-
-        center_x = BOARD_ORIGIN[0] + col * CELL_SIZE + CELL_SIZE // 2
-        center_y = BOARD_ORIGIN[1] + row * CELL_SIZE + CELL_SIZE // 2
+        center = self.view.cell_rects[row * BOARD_COLS + col].center
+        self._draw_circle(self.screen, piece, center, self.view.piece_radius(piece.size))
 
-        pygame.draw.circle(self.screen, color, (center_x, center_y), radius)
-        pygame.draw.circle(self.screen, BLACK, (center_x, center_y), radius, 2)  # Outline
+    def _draw_circle(self, surface, piece, center, radius):
+        """Draw a piece as a filled circle with an outline."""
+        color = RED if piece.color == "red" else YELLOW
+        pygame.draw.circle(surface, color, center, radius)
+        pygame.draw.circle(surface, BLACK, center, radius, self.view.line_width)  # Outline
 
+    @timed('Renderer.draw_player_area')
     def draw_player_area(self, player, label_position, pieces_position, current_player=False):
         """
         Draw the pieces area for a player, adjusting text and outline if current player's turn.
         """
+        view = self.view
+        self.draw_player_label(player, label_position, pieces_position, current_player)
+
+        # Render each available piece in a row below the label
+        for idx, piece in enumerate(player.get_available_pieces()):
+            self._draw_circle(
+                self.screen, piece,
+                view.to_screen(supply_slot(pieces_position, idx)),
+                view.piece_radius(piece.size, on_board=False)
+            )
+
+    @timed('Renderer.draw_player_label')
+    def draw_player_label(self, player, label_position, pieces_position, current_player=False):
+        """
+        Draw a player's label, and the outline around their area if it is their turn.
+        """
+        self._update_fonts()
+        view = self.view
         label = f"Player {player.color.capitalize()}"
 
         if current_player:
             label += " (Your Turn)"
 
             # Draw a rectangle around the player's area
-            highlight_rect = pygame.Rect(pieces_position[0] - 10, pieces_position[1] - 10, 320, 60)
-            pygame.draw.rect(self.screen, BLACK, highlight_rect, 2)
+            highlight_rect = view.rect(pieces_position[0] - 10, pieces_position[1] - 10, 320, 60)
+            pygame.draw.rect(self.screen, BLACK, highlight_rect, view.length(2))
 
         text_surface = self.font.render(label, True, BLACK)
-        self.screen.blit(text_surface, label_position)
-
-        # Render each available piece in a row below the label
-        x_off = pieces_position[0]
-        y_off = pieces_position[1]
-        for idx, piece in enumerate(player.get_available_pieces()):
-            radius_map = {0: 20, 1: 30, 2: 40}
-            radius = radius_map.get(piece.size, 20)
-
-            circ_centre = (x_off + 20 + idx * 50, y_off)
-            pygame.draw.circle(
-                self.screen,
-                RED if piece.color == "red" else YELLOW,
-                circ_centre,
-                radius
-            )
-            pygame.draw.circle(self.screen, BLACK, circ_centre, radius, 2)  # Outline
+        self.screen.blit(text_surface, view.to_screen(label_position))
 
+    @timed('Renderer.draw_buttons')
     def draw_buttons(self):
         """Draw the rewind button."""
-        pygame.draw.rect(self.screen, GRAY, self.button_rewind_rect)
+        self._update_fonts()
+        rect = self.button_rewind_rect
+        pygame.draw.rect(self.screen, GRAY, rect)
         rewind_text = self.font.render("Rewind", True, BLACK)
         self.screen.blit(
             rewind_text,
             (
-                self.button_rewind_rect.centerx - rewind_text.get_width() // 2,
-                self.button_rewind_rect.centery - rewind_text.get_height() // 2
+                rect.centerx - rewind_text.get_width() // 2,
+                rect.centery - rewind_text.get_height() // 2
             )
         )
 
+    @timed('Renderer.draw_game_status')
     def draw_game_status(self, game):
         """
         Display game status.
         - If game over, text is green and shows winner.
         - Otherwise, show current player's color.
         """
-        if game.game_over:
-            if game.winner:
-                status_str = f"Game Over! Winner: {game.winner}"
-            else:
-                status_str = "Game Over! No winner"
-            text_color = GREEN
-        else:
-            status_str = f"Current Turn: {game.current_player.color}"
-            text_color = BLACK
-
+        self._update_fonts()
+        status_str, text_color = status_text(game)
         text_surf = self.font.render(status_str, True, text_color)
-        self.screen.blit(text_surf, (250, 10))
+        self.screen.blit(text_surf, self.view.to_screen(STATUS_POSITION))
 
+    @timed('Renderer.draw_dragging_piece')
     def draw_dragging_piece(self, piece, pos):
         """Draw a piece currently being dragged, with dark outline."""
-        color = RED if piece.color == "red" else YELLOW
-        radius_map = {0: 20, 1: 30, 2: 40}
-        radius = radius_map.get(piece.size, 20)
+        self._draw_circle(self.screen, piece, pos, self.view.piece_radius(piece.size))
 
-        pygame.draw.circle(self.screen, color, pos, radius)
-        pygame.draw.circle(self.screen, BLACK, pos, radius, 2)  # Outline
+    @timed('Renderer.draw_hint')
+    def draw_hint(self, hint, pieces_position):
+        """
+        Highlight a suggested move: the piece to pick up and the cell to drop it on.
+
+        Args:
+            hint (dict): Game.make_move keyword arguments for the suggested move
+            pieces_position (tuple): Supply position of the player the hint is for
+        """
+        key = (hint.get('piece_idx'), hint.get('from_pos'), hint['to_pos'], pieces_position)
+        cached = self._hint_overlay
+        if cached is None or cached[0] != key or cached[1] != self.view.version:
+            cached = (key, self.view.version, self._build_hint_overlay(hint, pieces_position))
+            self._hint_overlay = cached
+        self.screen.blit(cached[2], (0, 0))
+
+    def _build_hint_overlay(self, hint, pieces_position):
+        """Render a hint onto a transparent, screen-sized surface."""
+        view = self.view
+        # pylint: disable-next=no-member
+        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+
+        cell_rect = view.cell_rect(*hint['to_pos'])
+        pygame.draw.rect(overlay, HINT_COLOR, cell_rect)
+
+        if hint.get('from_pos') is not None:
+            source = view.cell_rect(*hint['from_pos']).center
+        else:
+            source = view.to_screen(supply_slot(pieces_position, hint['piece_idx']))
+        pygame.draw.circle(overlay, HINT_COLOR, source, view.length(44), view.length(4))
+        pygame.draw.line(overlay, HINT_COLOR, source, cell_rect.center, view.length(4))
+        return overlay
+
+    @timed('Renderer.draw_frame_stats')
+    def draw_frame_stats(self, frame_timer):
+        """
+        Show FPS and frame time percentiles in the bottom-left corner.
+
+        Args:
+            frame_timer (FrameTimer): Recent frame times
+        """
+        now = pygame.time.get_ticks()
+        if self._frame_stats_surface is None or now - self._frame_stats_updated >= 250:
+            text = (
+                f"{frame_timer.fps:5.1f} fps  "
+                f"p50 {frame_timer.percentile(50) * 1e3:4.1f} ms  "
+                f"p95 {frame_timer.percentile(95) * 1e3:4.1f} ms  "
+                f"p99 {frame_timer.percentile(99) * 1e3:4.1f} ms"
+            )
+            self._frame_stats_surface = self.font.render(text, True, BLACK)
+            self._frame_stats_updated = now
+        self.screen.blit(
+            self._frame_stats_surface,
+            (10, self.screen.get_height() - self._frame_stats_surface.get_height() - 10)
+        )
@@ -0,0 +1,160 @@
+"""
+One game on screen: event handling and per-frame drawing.
+
+Shared by the interactive window in `gobblet.py` and the input replay benchmark, so
+both run exactly the same input and rendering code.
+"""
+
+import pygame
+from .constants import (
+    WHITE,
+    PLAYER1_LABEL_POSITION, PLAYER2_LABEL_POSITION,
+    PLAYER1_PIECES_POSITION, PLAYER2_PIECES_POSITION
+)
+from .input_handler import InputHandler
+from .renderer import Renderer
+from .view import View
+
+# pylint: disable=no-member
+ROTATE_KEYS = {pygame.K_LEFT: -1, pygame.K_UP: -1, pygame.K_RIGHT: 1, pygame.K_DOWN: 1}
+RESIZE_KEYS = {pygame.K_MINUS: -1, pygame.K_EQUALS: 1}  # Zoom; with shift (_ and +), game size
+# pylint: enable=no-member
+
+class GameSession:  # pylint: disable=too-many-instance-attributes
+    """Wires a game to the renderer, input handler, computer player and hints."""
+
+    def __init__(self, screen, game, ponderer=None, hints=None):
+        """
+        Args:
+            screen (pygame.Surface): Surface to draw on
+            game (Game): Game being played
+            ponderer (Ponderer, optional): Computer player, if any
+            hints (HintService, optional): Hint service; the h key does nothing without one
+        """
+        self.screen = screen
+        self.game = game
+        self.view = View(screen.get_size())
+        self.renderer = Renderer(screen, self.view)
+        self.input_handler = InputHandler(game, self.view)
+        self.ponderer = ponderer
+        self.hints = hints
+        self.show_hint = False
+
+    def handle_event(self, event):
+        """
+        Handle one event.
+
+        Args:
+            event (pygame.event.Event): Event to handle
+
+        Returns:
+            bool: False if the window was closed
+        """
+        if event.type == pygame.QUIT:   # pylint: disable=no-member
+            return False
+
+        # View controls: rotate, zoom, game size and window size
+        if event.type == pygame.KEYDOWN:    # pylint: disable=no-member
+            if event.key in ROTATE_KEYS:
+                self.view.rotate(ROTATE_KEYS[event.key])
+            elif event.key in RESIZE_KEYS:
+                if getattr(event, 'mod', 0) & pygame.KMOD_SHIFT:    # pylint: disable=no-member
+                    self.view.scale_by(RESIZE_KEYS[event.key])
+                else:
+                    self.view.zoom_by(RESIZE_KEYS[event.key])
+        elif event.type == pygame.VIDEORESIZE:  # pylint: disable=no-member
+            self.view.resize(event.size)
+            self.screen = self.renderer.screen = pygame.display.get_surface() or self.screen
+
+        # Toggle the best-move hint
+        if (
+            event.type == pygame.KEYDOWN    # pylint: disable=no-member
+            and event.key == pygame.K_h     # pylint: disable=no-member
+            and self.hints is not None
+        ):
+            self.show_hint = not self.show_hint
+
+        # Check for clicks on the rewind button
+        if (
+            event.type == pygame.MOUSEBUTTONDOWN    # pylint: disable=no-member
+            and event.button == 1
+        ):
+            if self.renderer.button_rewind_rect.collidepoint(event.pos):
+                self.rewind()
+
+        # Pass event to input handler for dragging, etc. (not on the computer's turn)
+        if self.ponderer is None or self.game.current_player_idx != self.ponderer.side:
+            self.input_handler.handle_event(event)
+        return True
+
+    def rewind(self):
+        """Take back the last move, or the last two against the computer."""
+        # Stop the computer's search before the position changes under it
+        if self.ponderer is not None:
+            self.ponderer.cancel()
+        # Attempt a rewind and cancel any dragging
+        if self.game.rewind():
+            self.input_handler.cancel_drag()
+            # Against the computer, go back to the human's previous turn
+            if self.ponderer is not None and self.game.current_player_idx == self.ponderer.side:
+                self.game.rewind()
+
+    def update(self):
+        """Let the computer move once its background search has an answer."""
+        if self.ponderer is not None:
+            move = self.ponderer.update(self.game)
+            if move is not None:
+                self.game.make_move(**move)
+
+    def draw(self, frame_timer=None):
+        """
+        Draw a whole frame (without flipping the display).
+
+        Args:
+            frame_timer (FrameTimer, optional): Show FPS and frame time percentiles
+        """
+        game = self.game
+        renderer = self.renderer
+
+        # Clear the screen
+        self.screen.fill(WHITE)
+
+        # Draw the board and pieces
+        renderer.draw_board()
+        renderer.draw_board_pieces(game.board)
+
+        # Draw player areas
+        renderer.draw_player_area(
+            game.players[0],
+            PLAYER1_LABEL_POSITION,
+            PLAYER1_PIECES_POSITION,
+            current_player=(game.current_player_idx == 0)
+        )
+        renderer.draw_player_area(
+            game.players[1],
+            PLAYER2_LABEL_POSITION,
+            PLAYER2_PIECES_POSITION,
+            current_player=(game.current_player_idx == 1)
+        )
+
+        # Draw the Rewind button
+        renderer.draw_buttons()
+
+        # Draw game status
+        renderer.draw_game_status(game)
+
+        # Draw the hint once the background search has delivered it
+        hint = self.hints.get(game) if self.show_hint else None
+        if hint is not None:
+            renderer.draw_hint(
+                hint,
+                PLAYER1_PIECES_POSITION if game.current_player_idx == 0 else PLAYER2_PIECES_POSITION
+            )
+
+        # Draw any dragged piece
+        is_dragging, piece, pos = self.input_handler.get_dragging_info()
+        if is_dragging and piece:
+            renderer.draw_dragging_piece(piece, pos)
+
+        if frame_timer is not None:
+            renderer.draw_frame_stats(frame_timer)
@@ -0,0 +1,272 @@
+"""
+Spectator wall: many live games at once, drawn as a grid of miniature boards.
+
+Moves arrive on a queue as (board_id, move) tuples (see ``game.records.stream_moves``),
+with (board_id, None) starting a new game on that board. Boards are kept as packed
+positions (see ``game.state``) and drawn from a sprite atlas: one opaque sprite per
+cell content (empty, or the visible piece), drawn once by ``Renderer`` through a
+``View`` scaled to the wall's cell size, so drawing a board is nine small blits. Only
+boards whose position changed since the last frame are redrawn, and only their
+rectangles are sent to the display.
+
+Run from the `src` directory: `python -m ui.spectator --boards 64 --runners 4`.
+"""
+
+import argparse
+import math
+import multiprocessing
+import os
+import queue
+import time
+
+import pygame
+from game import state
+from game.piece import Piece
+from game.records import self_play, stream_moves
+from .constants import WINDOW_WIDTH, WINDOW_HEIGHT, TITLE, WHITE, GRAY, GREEN, CELL_SIZE
+from .renderer import Renderer
+from .view import View
+
+BOARD_MARGIN = 6                # Pixels between boards
+
+
+class SpectatorWall(Renderer):  # pylint: disable=too-many-instance-attributes
+    """A grid of miniature boards following live games."""
+
+    def __init__(self, screen, num_boards, columns=None):
+        """
+        Args:
+            screen (pygame.Surface): Surface to draw on
+            num_boards (int): Number of boards
+            columns (int, optional): Boards per row; chosen to fit the screen by default
+        """
+        self.num_boards = num_boards
+        width, height = screen.get_size()
+        # By default, the largest boards that fit, then the fewest empty slots
+        self.columns = columns or max(
+            range(1, num_boards + 1),
+            key=lambda cols: (min(width // cols, height // math.ceil(num_boards / cols)),
+                              -cols * math.ceil(num_boards / cols))
+        )
+        self.rows = math.ceil(num_boards / self.columns)
+        tile = min(width // self.columns, height // self.rows)
+        self.cell = max(3, (tile - BOARD_MARGIN) // 3)
+        self.board_size = self.cell * 3
+        # A view whose board cells are exactly one wall cell, for drawing the sprites
+        unit = self.cell / CELL_SIZE
+        super().__init__(screen, View((WINDOW_WIDTH * unit, WINDOW_HEIGHT * unit)))
+
+        # Centre the grid of boards on the screen
+        left = (width - self.columns * tile) // 2 + BOARD_MARGIN // 2
+        top = (height - self.rows * tile) // 2 + BOARD_MARGIN // 2
+        self.rects = [
+            pygame.Rect(left + (idx % self.columns) * tile, top + (idx // self.columns) * tile,
+                        self.board_size, self.board_size)
+            for idx in range(num_boards)
+        ]
+
+        self.positions = [(0, 0, 0)] * num_boards   # (board, side, winner)
+        self.moves = 0
+        self._dirty = set(range(num_boards))
+        self._atlas, self._sprites = self._build_atlas()
+
+    def _build_atlas(self):
+        """
+        Draw every cell sprite into one surface, the way Renderer draws the board.
+
+        Returns:
+            tuple: (atlas surface, {(size, color code) or None: source Rect in the atlas})
+        """
+        cell = self.cell
+        keys = [None] + [(size, color) for size in range(3) for color in (1, 2)]
+        atlas = pygame.Surface((cell * len(keys), cell), 0, self.screen)
+        atlas.fill(WHITE)
+        sprites = {}
+        for idx, key in enumerate(keys):
+            rect = pygame.Rect(idx * cell, 0, cell, cell)
+            if key is not None:
+                size, color = key
+                self._draw_circle(atlas, Piece(size, state.COLORS[color - 1]), rect.center,
+                                  self.view.piece_radius(size))
+            pygame.draw.rect(atlas, GRAY, rect, self.view.line_width)
+            sprites[key] = rect
+        return atlas, sprites
+
+    def reset(self, board_id):
+        """Start a new game on a board."""
+        self.positions[board_id] = (0, 0, 0)
+        self._dirty.add(board_id)
+
+    def apply(self, board_id, move):
+        """
+        Play a move on a board.
+
+        Args:
+            board_id (int): Board index
+            move (int): Encoded move; None starts a new game
+        """
+        if move is None:
+            self.reset(board_id)
+            return
+        board, side, _ = self.positions[board_id]
+        board, winner = state.apply_move(board, side, move)
+        self.positions[board_id] = (board, 1 - side, winner)
+        self.moves += 1
+        self._dirty.add(board_id)
+
+    def consume(self, source, limit=None):
+        """
+        Apply the moves waiting on a queue, without blocking.
+
+        Args:
+            source (queue.Queue or multiprocessing.Queue): Queue of (board_id, move)
+            limit (int, optional): Maximum number of moves to take this call
+
+        Returns:
+            int: Number of queue entries applied
+        """
+        count = 0
+        while limit is None or count < limit:
+            try:
+                board_id, move = source.get_nowait()
+            except queue.Empty:
+                break
+            self.apply(board_id, move)
+            count += 1
+        return count
+
+    def draw(self, full=False):
+        """
+        Redraw the boards that changed since the last call.
+
+        Args:
+            full (bool): Redraw everything, e.g. after the screen was cleared
+
+        Returns:
+            list: Screen rectangles drawn, for pygame.display.update
+        """
+        if full:
+            self._dirty.update(range(self.num_boards))
+        dirty = [self._draw_board(board_id) for board_id in self._dirty]
+        self._dirty.clear()
+        return dirty
+
+    def _draw_board(self, board_id):
+        """Blit a board's cells from the atlas; returns the board's screen rectangle."""
+        atlas, sprites, cell = self._atlas, self._sprites, self.cell
+        board, _, winner = self.positions[board_id]
+        rect = self.rects[board_id]
+        for idx in range(state.CELLS):
+            code = (board >> (state.CELL_BITS * idx)) & state.CELL_MASK
+            size = state.TOP_SIZE[code]
+            sprite = sprites[(size, state.OWNER[code])] if size >= 0 else sprites[None]
+            row, col = divmod(idx, 3)
+            self.screen.blit(atlas, (rect.x + col * cell, rect.y + row * cell), sprite)
+        if winner:
+            pygame.draw.rect(self.screen, GREEN, rect, max(2, cell // 12))
+        return rect
+
+
+def start_runners(num_boards, num_runners, move_delay, seed=None):
+    """
+    Start self-play worker processes, splitting the boards between them.
+
+    Returns:
+        tuple: (multiprocessing.Queue of moves, stop Event, list of Processes)
+    """
+    moves = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    runners = []
+    for runner in range(num_runners):
+        board_ids = list(range(runner, num_boards, num_runners))
+        process = multiprocessing.Process(
+            target=stream_moves,
+            args=(moves, board_ids, None if seed is None else seed + runner, move_delay, stop),
+            daemon=True
+        )
+        process.start()
+        runners.append(process)
+    return moves, stop, runners
+
+
+def run_benchmark(num_boards, frames):
+    """
+    Time frames in which every board receives a move, the wall's worst case.
+
+    Args:
+        num_boards (int): Number of boards
+        frames (int): Frames to time
+
+    Returns:
+        list: Seconds per frame, including taking the moves off the queue
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()   # pylint: disable=no-member
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    screen.fill(WHITE)
+    wall = SpectatorWall(screen, num_boards)
+    games = list(self_play(num_boards, seed=0))
+    plies = [0] * num_boards
+    moves = queue.Queue()
+    times = []
+    for _ in range(frames):
+        for board_id, game in enumerate(games):
+            if plies[board_id] == len(game):
+                moves.put((board_id, None))
+                plies[board_id] = 0
+            moves.put((board_id, game[plies[board_id]]))
+            plies[board_id] += 1
+        start = time.perf_counter()
+        wall.consume(moves)
+        pygame.display.update(wall.draw())
+        times.append(time.perf_counter() - start)
+    pygame.quit()   # pylint: disable=no-member
+    return times
+
+
+def main(argv=None):
+    """Show live self-play games on a wall of boards."""
+    parser = argparse.ArgumentParser(description='Spectator wall of live self-play games.')
+    parser.add_argument('--boards', type=int, default=64, help='number of boards')
+    parser.add_argument('--runners', type=int, default=2, help='self-play worker processes')
+    parser.add_argument('--move-delay', type=float, default=0.5,
+                        help='seconds between moves on each board')
+    parser.add_argument('--seed', type=int, help='random seed for the runners')
+    parser.add_argument('--benchmark', type=int, metavar='FRAMES',
+                        help='time FRAMES worst-case frames headless and print percentiles')
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        times = sorted(run_benchmark(args.boards, args.benchmark))
+        print(f"{args.boards} boards, every board moving every frame: "
+              f"{len(times) / sum(times):.0f} fps")
+        for pct in (50, 95, 99):
+            print(f"  p{pct:<4}{times[min(len(times) - 1, len(times) * pct // 100)] * 1e3:8.3f} ms")
+        return
+
+    pygame.init()   # pylint: disable=no-member
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption(f"{TITLE} - {args.boards} live games")
+    screen.fill(WHITE)
+    pygame.display.flip()
+    wall = SpectatorWall(screen, args.boards)
+    moves, stop, runners = start_runners(args.boards, args.runners, args.move_delay, args.seed)
+    clock = pygame.time.Clock()
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:   # pylint: disable=no-member
+                running = False
+        wall.consume(moves)
+        pygame.display.update(wall.draw())
+        clock.tick(60)
+
+    stop.set()
+    for runner in runners:
+        runner.join(timeout=1.0)
+    pygame.quit()   # pylint: disable=no-member
+
+
+if __name__ == '__main__':
+    main()
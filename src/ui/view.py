@@ -0,0 +1,189 @@
+"""
+View transform: where the game's layout lands on screen.
+
+Everything is laid out in fixed layout coordinates (the WINDOW_WIDTH x WINDOW_HEIGHT
+positions in constants). The view scales that layout to fit the window and centres
+it, scaled again by the user's game size; the board is additionally zoomed about its
+centre and rotated in quarter turns. Drawing maps layout to screen, and input maps
+screen back through the inverse, so hit testing always matches what is drawn.
+
+The transformed geometry (cell rectangles, piece radii) is computed once per change
+rather than every frame, and every change bumps ``version``, which renderers use as
+a cache key.
+"""
+
+import pygame
+from .constants import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, BOARD_ORIGIN, CELL_SIZE, BOARD_ROWS, BOARD_COLS,
+    PIECE_RADII, SUPPLY_MARGIN, SUPPLY_SPACING,
+    ZOOM_STEP, ZOOM_RANGE, SCALE_STEP, SCALE_RANGE
+)
+
+BOARD_CENTER = (
+    BOARD_ORIGIN[0] + BOARD_COLS * CELL_SIZE / 2,
+    BOARD_ORIGIN[1] + BOARD_ROWS * CELL_SIZE / 2,
+)
+
+
+def _clamp(value, limits):
+    """Clamp a value into (low, high), rounded to avoid drifting float steps."""
+    return round(min(max(value, limits[0]), limits[1]), 3)
+
+
+def supply_slot(pieces_position, idx):
+    """
+    Args:
+        pieces_position (tuple): Layout position of a player's supply row
+        idx (int): Index into the player's available pieces
+
+    Returns:
+        tuple: Layout coordinates of the piece's centre
+    """
+    return (pieces_position[0] + SUPPLY_MARGIN + idx * SUPPLY_SPACING, pieces_position[1])
+
+
+class View:     # pylint: disable=too-many-instance-attributes
+    """Zoom, rotation and window size, with the transforms they imply."""
+
+    def __init__(self, size=(WINDOW_WIDTH, WINDOW_HEIGHT)):
+        """
+        Args:
+            size (tuple): Window (width, height) in pixels
+        """
+        self.size = tuple(size)
+        self.zoom = 1.0         # Board only
+        self.scale = 1.0        # Whole game, on top of fitting the window
+        self.rotation = 0       # Board quarter turns, clockwise
+        self.version = 0
+        self._update()
+
+    def resize(self, size):
+        """Follow a window resize."""
+        self.size = tuple(size)
+        self._update()
+
+    def zoom_by(self, steps):
+        """Zoom the board in (positive) or out (negative) by a number of steps."""
+        self.zoom = _clamp(self.zoom + steps * ZOOM_STEP, ZOOM_RANGE)
+        self._update()
+
+    def scale_by(self, steps):
+        """Make the whole game bigger (positive) or smaller (negative) in the window."""
+        self.scale = _clamp(self.scale + steps * SCALE_STEP, SCALE_RANGE)
+        self._update()
+
+    def rotate(self, quarter_turns):
+        """Rotate the board clockwise (positive) or anticlockwise (negative)."""
+        self.rotation = (self.rotation + quarter_turns) % 4
+        self._update()
+
+    def _update(self):
+        """Recompute the transform after a change."""
+        width, height = self.size
+        self.unit = min(width / WINDOW_WIDTH, height / WINDOW_HEIGHT) * self.scale
+        self.offset = (
+            (width - WINDOW_WIDTH * self.unit) / 2,
+            (height - WINDOW_HEIGHT * self.unit) / 2,
+        )
+        self.cell_size = CELL_SIZE * self.zoom * self.unit
+        center = self.to_screen(BOARD_CENTER)
+        self.board_rect = pygame.Rect(0, 0, round(self.cell_size * BOARD_COLS),
+                                      round(self.cell_size * BOARD_ROWS))
+        self.board_rect.center = center
+        self.line_width = self.length(2)
+        self._radii = {
+            on_board: tuple(
+                max(1, round(radius * self.unit * (self.zoom if on_board else 1.0)))
+                for radius in PIECE_RADII
+            )
+            for on_board in (True, False)
+        }
+        self.cell_rects = tuple(
+            self._cell_rect(row, col) for row in range(BOARD_ROWS) for col in range(BOARD_COLS)
+        )
+        self.version += 1
+
+    def to_screen(self, point):
+        """Layout coordinates -> integer screen pixels."""
+        return (round(self.offset[0] + point[0] * self.unit),
+                round(self.offset[1] + point[1] * self.unit))
+
+    def to_layout(self, pos):
+        """Screen pixels -> layout coordinates."""
+        return ((pos[0] - self.offset[0]) / self.unit, (pos[1] - self.offset[1]) / self.unit)
+
+    def length(self, value):
+        """Scale a layout length to pixels (at least 1)."""
+        return max(1, round(value * self.unit))
+
+    def rect(self, x, y, width, height):
+        """Layout rectangle -> screen pygame.Rect."""
+        left, top = self.to_screen((x, y))
+        right, bottom = self.to_screen((x + width, y + height))
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def piece_radius(self, size, on_board=True):
+        """Pixel radius of a piece, zoomed along with the board if on it."""
+        return self._radii[on_board][size]
+
+    def _displayed_cell(self, row, col):
+        """Where a board cell appears after rotation, as (row, col)."""
+        for _ in range(self.rotation):
+            row, col = col, BOARD_ROWS - 1 - row
+        return row, col
+
+    def _cell_rect(self, row, col):
+        """Screen rectangle of a board cell, after rotation."""
+        row, col = self._displayed_cell(row, col)
+        left = round(col * self.cell_size)
+        top = round(row * self.cell_size)
+        return pygame.Rect(
+            self.board_rect.left + left, self.board_rect.top + top,
+            round((col + 1) * self.cell_size) - left, round((row + 1) * self.cell_size) - top
+        )
+
+    def cell_rect(self, row, col):
+        """
+        Args:
+            row (int): Board row
+            col (int): Board column
+
+        Returns:
+            pygame.Rect: Screen pixels covered by the cell
+        """
+        return self.cell_rects[row * BOARD_COLS + col].copy()
+
+    def cell_at(self, pos):
+        """
+        Inverse transform for hit testing.
+
+        Args:
+            pos (tuple): Screen position
+
+        Returns:
+            tuple: Board (row, col) under the position, or None if off the board
+        """
+        # Test the drawn, rounded rectangles so edge pixels hit the cell they belong to
+        for idx, rect in enumerate(self.cell_rects):
+            if rect.collidepoint(pos):
+                return divmod(idx, BOARD_COLS)
+        return None
+
+    def supply_piece_at(self, pos, pieces_position, pieces):
+        """
+        Find the supply piece under a screen position.
+
+        Args:
+            pos (tuple): Screen position
+            pieces_position (tuple): Layout position of the player's supply row
+            pieces (list): The player's available pieces
+
+        Returns:
+            int: Index of the piece, or None
+        """
+        x, y = self.to_layout(pos)
+        for idx, piece in enumerate(pieces):
+            slot_x, slot_y = supply_slot(pieces_position, idx)
+            if (x - slot_x) ** 2 + (y - slot_y) ** 2 <= PIECE_RADII[piece.size] ** 2:
+                return idx
+        return None
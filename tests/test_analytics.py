@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+from src.game import state
+from src.game.analytics import Summary, summarize, analyze, canonical_opening, describe_opening
+from src.game.records import write_games, self_play
+
+LARGE, MEDIUM = state.SUPPLY_BASE + 2, state.SUPPLY_BASE + 1
+
+# Same moves as test_game's test_expose_opponent_win: yellow uncovers red's top row
+EXPOSURE_GAME = [
+    state.encode_move(LARGE, 0), state.encode_move(LARGE, 4),
+    state.encode_move(MEDIUM, 2), state.encode_move(LARGE, 2),
+    state.encode_move(LARGE, 1), state.encode_move(2, 5),
+]
+
+class TestAnalytics(unittest.TestCase):
+    """Test cases for archive statistics."""
+
+    def test_single_game(self):
+        """Test an exposure loss, gobbles and length are counted."""
+        report = summarize([EXPOSURE_GAME]).report()
+        self.assertEqual(report['games'], 1)
+        self.assertEqual(report['wins'], {'red': 1, 'yellow': 0})
+        self.assertEqual(report['first_player_win_rate'], 1.0)
+        self.assertEqual(report['exposure_losses'], 1)
+        self.assertEqual(report['average_length'], 6)
+        self.assertEqual(report['gobbles_per_game'], {'small': 0, 'medium': 0, 'large': 1})
+        self.assertEqual(report['top_openings'], [{'moves': 'L@0,0 L@1,1', 'games': 1}])
+
+    def test_openings_are_symmetric(self):
+        """Test mirrored openings count as the same line."""
+        self.assertEqual(
+            canonical_opening([state.encode_move(LARGE, 0), state.encode_move(MEDIUM, 1)]),
+            canonical_opening([state.encode_move(LARGE, 8), state.encode_move(MEDIUM, 5)]),
+        )
+        self.assertEqual(describe_opening([state.encode_move(3, 7)]), '1,0>2,1')
+
+    def test_merge(self):
+        """Test merging partial summaries equals summarising everything at once."""
+        games = list(self_play(200, seed=9))
+        left, right = summarize(games[:80]), summarize(games[80:])
+        merged = Summary()
+        merged.merge(left)
+        merged.merge(right)
+        self.assertEqual(merged.report(), summarize(games).report())
+
+    def test_parallel_archives(self):
+        """Test archive shards summarised in worker processes match a serial run."""
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for seed in range(3):
+                paths.append(os.path.join(tmp, f'shard{seed}.txt.gz'))
+                write_games(paths[-1], self_play(100, seed=seed))
+            self.assertEqual(analyze(paths, workers=2).report(), analyze(paths, workers=1).report())
+
+if __name__ == '__main__':
+    unittest.main()
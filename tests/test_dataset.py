@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+import weakref
+from unittest import mock
+import numpy as np
+from src.game import state
+from src.game.dataset import (
+    export_positions, encode_features, labelled_positions, PositionDataset, ShardWriter, FEATURES
+)
+from src.game.records import self_play
+
+class TestDataset(unittest.TestCase):
+    """Test cases for memory-mapped position export."""
+
+    def setUp(self):
+        """Set up a scratch directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        self._tmp.cleanup()
+
+    def test_encode_features(self):
+        """Test a stacked cell shows both pieces and only the top as visible."""
+        board = state.pack([0b1001] + [0] * 8)  # red small under yellow medium
+        features = encode_features([board], [1])[0].reshape(9, 9)
+        self.assertEqual(features.shape, (9, 9))
+        self.assertEqual(features[0, 0], 1)    # red small
+        self.assertEqual(features[4, 0], 1)    # yellow medium
+        self.assertEqual(features[6, 0], 0)    # red not visible
+        self.assertEqual(features[7, 0], 1)    # yellow visible
+        self.assertTrue((features[8] == 1).all())
+
+    def test_export_and_read(self):
+        """Test rows, labels and shard rollover."""
+        games = list(self_play(50, seed=4))
+        totals = export_positions(games, self.directory, shard_size=100, dedupe=False)
+        self.assertEqual(totals['written'], sum(len(moves) for moves in games))
+
+        dataset = PositionDataset(self.directory)
+        self.assertEqual(len(dataset), totals['written'])
+        self.assertGreater(len(dataset.shards), 1)
+        features, label = dataset[0]
+        self.assertEqual(features.shape, (FEATURES,))
+        self.assertFalse(features.any())   # empty board, red to move
+        self.assertIn(label, (-1, 0, 1))
+        self.assertIsInstance(dataset.shards[0]['features'], np.memmap)
+
+        rows = sum(len(labels) for _, labels in dataset.batches(64, shuffle=True, seed=0))
+        self.assertEqual(rows, len(dataset))
+
+    def test_dedupe_keeps_first_label_and_bounds_memory(self):
+        """Test a repeated position keeps its first label, and max_seen caps the memory."""
+        games = list(self_play(20, seed=3))
+        rows = list(labelled_positions(games))
+        self.assertEqual(len({key for _, _, _, key in rows}), len(rows))
+        first = {}
+        for board, side, label, key in labelled_positions(games, dedupe=False):
+            first.setdefault(key, label)
+        self.assertTrue(all(first[key] == label for _, _, label, key in rows))
+
+        capped = list(labelled_positions(games, max_seen=1))
+        self.assertEqual(sum(1 for _, _, _, key in capped if key == state.canonical_key(0, 0)),
+                         1)
+        self.assertGreater(len(capped), len(rows))
+
+    def test_shard_maps_released_before_rename(self):
+        """Test a shard's memmap is released before its file is replaced (needed on Windows)."""
+        writer = ShardWriter(self.directory, shard_size=10)
+        writer.append(encode_features([0], [0]), np.zeros(1, np.int8), np.zeros(1, np.int64))
+        maps = {column: weakref.ref(array) for column, array in writer._arrays.items()}
+        replaced = []
+
+        def replace(source, target):
+            """Check the target's map is gone, then rename."""
+            column = os.path.basename(target).split('.')[1]
+            replaced.append(maps[column]() is None)
+            os.rename(source, target)
+
+        with mock.patch('src.game.dataset.os.replace', replace):
+            writer.close()
+        self.assertEqual(replaced, [True, True, True])
+
+    def test_dedupe_by_symmetry(self):
+        """Test mirrored openings and repeated games produce no new rows."""
+        place = state.SUPPLY_BASE + 2
+        left = [state.encode_move(place, 0)]
+        right = [state.encode_move(place, 2)]
+        totals = export_positions([left, right, left], self.directory)
+        self.assertEqual(totals['positions'], 3)
+        self.assertEqual(totals['written'], 1)
+
+    def test_appends_new_shards(self):
+        """Test a second export adds shards instead of overwriting."""
+        export_positions(self_play(5, seed=1), self.directory)
+        first = len(PositionDataset(self.directory))
+        export_positions(self_play(5, seed=2), self.directory)
+        self.assertGreater(len(PositionDataset(self.directory)), first)
+        self.assertEqual(len(os.listdir(self.directory)), 6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import io
+import unittest
+from src.game import state
+from src.game.engine import Engine, EngineClient
+from src.game.search import Searcher
+
+
+class RecordingSearcher(Searcher):
+    """Searcher that records the limits of each search, and fails on request."""
+
+    def __init__(self):
+        """Start with no searches recorded."""
+        super().__init__()
+        self.limits = []
+        self.fail = False
+
+    def search(self, board, side, max_depth=8, time_limit=None, stop_event=None, **kwargs):
+        """Record (max_depth, time_limit), then search or raise."""
+        self.limits.append((max_depth, time_limit))
+        if self.fail:
+            raise RuntimeError('table corrupted')
+        return super().search(board, side, max_depth, time_limit, stop_event, **kwargs)
+
+
+class TestEngine(unittest.TestCase):
+    """Test cases for the resident engine protocol."""
+
+    def setUp(self):
+        """Set up an engine writing to a buffer."""
+        self.out = io.StringIO()
+        self.engine = Engine(out=self.out)
+
+    def _send(self, *lines):
+        """Run commands and return the reply lines."""
+        start = self.out.tell()
+        self.engine.run(lines)
+        return self.out.getvalue()[start:].splitlines()
+
+    def _fields(self, reply):
+        """Parse a bestmove reply into a dict."""
+        words = reply.split()
+        return dict(zip(words[::2], words[1::2]))
+
+    def test_replies_one_line_per_command(self):
+        """Test each command gets exactly one reply, and quit stops reading."""
+        replies = self._send('isready', 'position start moves L@1,1 S@0,0', 'go depth 2',
+                             'newgame', 'quit', 'isready')
+        self.assertEqual(replies[:2], ['readyok', 'ok'])
+        fields = self._fields(replies[2])
+        self.assertEqual(fields['depth'], '2')
+        self.assertIn(fields['bestmove'], {state.move_name(move) for move in state.legal_moves(
+            *self._board_after(['L@1,1', 'S@0,0']))})
+        self.assertEqual(replies[3:], ['ok'])
+
+    def _board_after(self, moves):
+        """(board, side) after moves from the start."""
+        board, side = 0, 0
+        for text in moves:
+            board, _ = state.apply_move(board, side, state.parse_move(text))
+            side = 1 - side
+        return board, side
+
+    def test_errors_do_not_stop_the_engine(self):
+        """Test bad commands get an error reply and later commands still run."""
+        replies = self._send('bogus', 'position start moves 0,0>1,1', 'position somewhere',
+                             'go depth x', 'go sideways 3', 'isready')
+        self.assertTrue(all(reply.startswith('error') for reply in replies[:5]))
+        self.assertEqual(replies[5], 'readyok')
+
+    def test_unexpected_failure_is_reported(self):
+        """Test a command failing with any exception gets an error and the engine goes on."""
+        searcher = RecordingSearcher()
+        self.engine = Engine(searcher, out=self.out)
+        searcher.fail = True
+        replies = self._send('position start', 'go depth 2', 'isready')
+        self.assertEqual(replies[0], 'ok')
+        self.assertEqual(replies[1], 'error go failed: RuntimeError: table corrupted')
+        self.assertEqual(replies[2], 'readyok')
+        searcher.fail = False
+        self.assertTrue(self._send('go depth 1')[0].startswith('bestmove'))
+
+    def test_bare_go_is_time_limited(self):
+        """Test 'go' without limits gets the default move time, and explicit limits win."""
+        searcher = RecordingSearcher()
+        self.engine = Engine(searcher, out=self.out, default_depth=3, default_movetime=0.5)
+        self._send('position start', 'go', 'go depth 2', 'go movetime 100')
+        self.assertEqual(searcher.limits, [(3, 0.5), (2, None), (3, 0.1)])
+
+    def test_finished_game_has_no_best_move(self):
+        """Test a won position reports no best move and accepts no further moves."""
+        win = ['L@0,0', 'S@2,2', 'L@0,1', 'S@2,1', 'M@0,2']
+        self.assertEqual(self._send(f"position start moves {' '.join(win)}", 'go'),
+                         ['ok', 'bestmove none'])
+        self.assertTrue(self._send('position start moves ' + ' '.join(win + ['S@1,1']))[0]
+                        .startswith('error'))
+
+    def test_position_key_and_warm_table(self):
+        """Test a position key sets the position, and a repeated search reuses the table."""
+        board, side = self._board_after(['L@1,1', 'L@0,0'])
+        key = state.position_key(board, side)
+        first = self._fields(self._send(f"position key {key}", 'go depth 4')[1])
+        second = self._fields(self._send(f"position key {key}", 'go depth 4')[1])
+        self.assertEqual(first['bestmove'], second['bestmove'])
+        self.assertLess(int(second['nodes']), int(first['nodes']) // 10)
+        self._send('newgame')
+        third = self._fields(self._send(f"position key {key}", 'go depth 4')[1])
+        self.assertEqual(third['nodes'], first['nodes'])
+
+    def test_client_process(self):
+        """Test the client runs a real engine process for several requests."""
+        client = EngineClient(['--depth', '2'])
+        try:
+            self.assertEqual(client.request('isready'), 'readyok')
+            result = client.analyse(['L@1,1'])
+            self.assertEqual(result['depth'], 2)
+            self.assertIn(state.parse_move(result['bestmove']),
+                          state.legal_moves(*self._board_after(['L@1,1'])))
+            with self.assertRaises(ValueError):
+                client.analyse(['0,0>1,1'])
+            self.assertEqual(client.analyse(key=0, depth=1)['depth'], 1)
+        finally:
+            client.close()
+        self.assertEqual(client.process.returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
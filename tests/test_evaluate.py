@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from src.game import state
+from src.game.evaluate import FEATURES, TEMPO_FEATURE, TableEvaluator, features
+from src.game.records import self_play
+from src.game.search import line_score
+
+
+def _positions(count, seed):
+    """Every position before a move in some random games."""
+    positions = []
+    for moves in self_play(count, seed=seed):
+        board, side = 0, 0
+        for move in moves:
+            positions.append((board, side))
+            board, winner = state.apply_move(board, side, move)
+            side = 1 - side
+            if winner:
+                break
+    return positions
+
+
+class TestTableEvaluator(unittest.TestCase):
+    """Test cases for the table-driven evaluator."""
+
+    def test_default_weights_match_line_score(self):
+        """Test the default tables score every position exactly like line_score."""
+        evaluator = TableEvaluator()
+        for board, side in _positions(50, seed=4):
+            self.assertEqual(evaluator(board, side), line_score(board, side))
+
+    def test_tables_follow_features(self):
+        """Test an evaluation is the weighted feature sum, up to table rounding."""
+        weights = [((idx * 37) % 11 - 5) / 50 for idx in range(FEATURES)]
+        evaluator = TableEvaluator(weights)
+        for board, side in _positions(20, seed=5):
+            expected = sum(w * f for w, f in zip(weights, features(board, side))) * 100
+            self.assertLessEqual(abs(evaluator(board, side) - expected), 10)
+        self.assertEqual(sum(features(0, 0)), 8 + 1)    # Eight empty lines, tempo
+        self.assertEqual(features(0, 1)[TEMPO_FEATURE], 1)
+
+    def test_save_and_load(self):
+        """Test weights survive a weights file, and a wrong size is rejected."""
+        weights = [idx / 1000 for idx in range(FEATURES)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'weights.json')
+            TableEvaluator(weights).save(path)
+            self.assertEqual(TableEvaluator.load(path).weights, weights)
+        with self.assertRaises(ValueError):
+            TableEvaluator(weights[:-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+# pylint: disable=wrong-import-position
+import pygame
+from game import state
+from game.game import Game
+from game.records import self_play
+from ui.constants import (
+    RED, YELLOW, PLAYER1_LABEL_POSITION, PLAYER1_PIECES_POSITION, PLAYER2_PIECES_POSITION
+)
+from ui.filmstrip import FilmstripRenderer, render_games
+# pylint: enable=wrong-import-position
+
+GAMES = list(self_play(3, seed=4, max_plies=12))
+
+
+class TestFilmstrip(unittest.TestCase):
+    """Test cases for headless filmstrip rendering."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()   # pylint: disable=no-member
+
+    def setUp(self):
+        """Set up a renderer with the default tiles, four to a row."""
+        self.renderer = FilmstripRenderer(columns=4)
+
+    def test_strip_has_a_tile_per_position(self):
+        """Test a game renders every position, in a strip sized for them."""
+        moves = GAMES[0]
+        strip, plies = self.renderer.render(moves)
+        self.assertEqual(plies, len(moves))
+        # pylint: disable-next=protected-access
+        self.assertEqual(strip.get_size(), self.renderer._strip_size(len(moves) + 1))
+
+    def test_illegal_move_crops_the_strip(self):
+        """Test replay stops at an illegal move and the strip holds only the tiles drawn."""
+        moves = GAMES[1][:5]
+        board, side = 0, 0
+        for move in moves:
+            board, _ = state.apply_move(board, side, move)
+            side = 1 - side
+        empty = next(cell for cell, code in enumerate(state.cells_of(board)) if not code)
+        illegal = state.encode_move(empty, (empty + 1) % state.CELLS)
+        strip, plies = self.renderer.render(moves + [illegal] + GAMES[1][5:])
+        self.assertEqual(plies, len(moves))
+        # pylint: disable-next=protected-access
+        self.assertEqual(strip.get_size(), self.renderer._strip_size(len(moves) + 1))
+
+    def test_supply_stays_inside_turn_outline(self):
+        """Test supply pieces are drawn inside their outlines and clear of the labels."""
+        surface = pygame.Surface(self.renderer.tile_size)
+        self.renderer.draw_tile(surface, (0, 0), Game(), 0)
+        view = self.renderer.view
+        outlines = [view.rect(x - 10, y - 10, 320, 60)
+                    for x, y in (PLAYER1_PIECES_POSITION, PLAYER2_PIECES_POSITION)]
+        label_bottom = view.to_screen(PLAYER1_LABEL_POSITION)[1] + self.renderer.font.get_height()
+        below_board = view.board_rect.bottom + 1
+        pieces = 0
+        for y in range(below_board, surface.get_height()):
+            for x in range(surface.get_width()):
+                if tuple(surface.get_at((x, y)))[:3] in (RED, YELLOW):
+                    pieces += 1
+                    self.assertGreater(y, label_bottom)
+                    self.assertTrue(any(outline.inflate(-2, -2).collidepoint(x, y)
+                                        for outline in outlines), (x, y))
+        self.assertGreater(pieces, 0)
+
+    def test_render_games_writes_one_png_per_game(self):
+        """Test render_games writes numbered PNGs and counts the games and moves."""
+        with tempfile.TemporaryDirectory() as out_dir:
+            stats = render_games(GAMES, out_dir, workers=1, tile_size=(160, 120))
+            names = sorted(os.listdir(out_dir))
+            self.assertEqual(names, [f"game_{idx:06d}.png" for idx in range(len(GAMES))])
+            strip = pygame.image.load(os.path.join(out_dir, names[0]))
+            self.assertEqual(strip.get_width(), 8 * (160 + 2) + 2)
+        self.assertEqual(stats['games'], len(GAMES))
+        self.assertEqual(stats['plies'], sum(len(moves) for moves in GAMES))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from src.game.footprint import allocated_per_object, measure
+from src.game.piece import Piece, Size
+from src.game.player import Player
+
+# Bytes per object (CPython 3.11 with __slots__ measured about 56 / 552 / 2072 / 2240 / 2360 / 1.3)
+LIMITS = {
+    'piece': 80,
+    'player': 800,
+    'game_fresh': 2800,
+    'game_after_moves': 3000,
+    'game_after_long_play': 3200,
+    'game_after_random_play': 3000,
+    'history_entry': 4,
+}
+
+
+class TestFootprint(unittest.TestCase):
+    """Memory regression tests for the compact object layout."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.figures = measure(games=100, moves=40, long_moves=200)
+
+    def test_figures_within_limits(self):
+        """Test every footprint figure stays under its limit."""
+        for name, limit in LIMITS.items():
+            with self.subTest(name):
+                self.assertLessEqual(self.figures[name], limit)
+
+    def test_long_play_does_not_accumulate(self):
+        """Test long play with rewinds costs no more than a few hundred bytes over a fresh game."""
+        self.assertLess(self.figures['game_after_long_play'] - self.figures['game_fresh'], 600)
+
+    def test_compact_objects_have_no_instance_dict(self):
+        """Test pieces and players use slots instead of a per-instance __dict__."""
+        for obj in (Piece(Size.SMALL, 'red'), Player('red')):
+            with self.subTest(type(obj).__name__):
+                self.assertFalse(hasattr(obj, '__dict__'))
+
+    def test_allocated_per_object(self):
+        """Test the measurement counts objects kept alive and not the garbage."""
+        self.assertGreaterEqual(allocated_per_object(lambda: bytearray(1000), 50), 1000)
+        self.assertLess(allocated_per_object(lambda: len(bytearray(1000)), 50), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
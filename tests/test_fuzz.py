@@ -0,0 +1,62 @@
+import unittest
+from unittest import mock
+from src.game import state
+from src.game.fuzz import (
+    ENGINES, REWIND, Divergence, StateEngine, describe, fuzz, minimize, random_game,
+    run_actions
+)
+
+class ExposureBugEngine(StateEngine):
+    """StateEngine that wrongly passes the turn after a move exposing the opponent's line."""
+
+    def play(self, move):
+        """Play like StateEngine, then break the exposure rule."""
+        mover = self.side
+        accepted = super().play(move)
+        if accepted and self.winner and self.winner != mover + 1:
+            self.side = 1 - mover
+        return accepted
+
+class TestFuzz(unittest.TestCase):
+    """Test cases for the differential fuzzer."""
+
+    def test_engines_agree_with_game(self):
+        """Test every alternative engine matches Game over random games."""
+        for name in ENGINES:
+            report = fuzz(name, 60, workers=1, chunk=20)
+            self.assertEqual(report['games'], 60)
+            self.assertIsNone(report['failure'], name)
+
+    def test_finds_and_minimizes_divergence(self):
+        """Test a broken exposure rule is caught and shrunk to a 1-minimal repro."""
+        for seed in range(500):
+            actions, divergence = random_game(seed, ExposureBugEngine)
+            if divergence is not None:
+                break
+        self.assertIsNotNone(divergence)
+
+        small = minimize(actions, ExposureBugEngine)
+        self.assertLess(len(small), min(len(actions), 20))
+        self.assertEqual(run_actions(small, ExposureBugEngine)[0], len(small) - 1)
+        for idx in range(len(small)):
+            self.assertIsNone(run_actions(small[:idx] + small[idx + 1:], ExposureBugEngine))
+
+    def test_report_names_divergence(self):
+        """Test the report carries the failing seed and its minimized actions."""
+        with mock.patch.dict(ENGINES, {'bug': ExposureBugEngine}):
+            report = fuzz('bug', 500, workers=1, chunk=100)
+        failure = report['failure']
+        self.assertIsInstance(failure, Divergence)
+        self.assertLess(report['games'], 500)
+        actions, divergence = random_game(failure.seed, ExposureBugEngine)
+        self.assertIsNotNone(divergence)
+        self.assertEqual(failure.actions, minimize(actions, ExposureBugEngine))
+
+    def test_describe(self):
+        """Test actions are described readably."""
+        self.assertEqual(describe(state.encode_move(state.SUPPLY_BASE + 2, 4)), 'L@1,1')
+        self.assertEqual(describe(state.encode_move(0, 8)), '0,0>2,2')
+        self.assertEqual(describe(REWIND), 'rewind')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -157,6 +157,40 @@ class TestGame(unittest.TestCase):
         self.assertEqual(self.game.current_player.color, "red")
         self.assertIsNone(self.game.board.grid[0][0])
     
+    def test_rewind_restores_gobbled_pieces(self):
+        """Test rewinding restores whole stacks, not just the visible pieces."""
+        self.game.make_move(piece_idx=4, to_pos=(0, 0))  # Red small
+        self.game.make_move(piece_idx=2, to_pos=(0, 0))  # Yellow medium gobbles it
+        self.game.make_move(piece_idx=0, to_pos=(1, 1))  # Red large
+        self.game.make_move(from_pos=(0, 0), to_pos=(2, 2))  # Yellow reveals red small
+
+        self.game.rewind()
+        top = self.game.board.grid[0][0]
+        self.assertEqual((top.color, top.size), ("yellow", Size.MEDIUM))
+        self.assertEqual((top.gobbled_piece.color, top.gobbled_piece.size), ("red", Size.SMALL))
+        self.assertIsNone(self.game.board.grid[2][2])
+
+        # The restored stack still plays: moving the medium away reveals the small again
+        self.game.make_move(from_pos=(0, 0), to_pos=(2, 2))
+        self.assertEqual(self.game.board.grid[0][0].color, "red")
+        self.assertEqual(len(self.game.players[1].get_available_pieces()), 5)
+
+    def test_long_session_history(self):
+        """Test a bounded history spills to disk and still rewinds to the start."""
+        game = Game(history_limit=16)
+        self._shuffle(game, 0)
+        for _ in range(50):
+            self.assertTrue(game.make_move(from_pos=(0, 0), to_pos=(0, 1)))
+            self.assertTrue(game.make_move(from_pos=(2, 2), to_pos=(2, 1)))
+            self.assertTrue(game.make_move(from_pos=(0, 1), to_pos=(0, 0)))
+            self.assertTrue(game.make_move(from_pos=(2, 1), to_pos=(2, 2)))
+        self.assertEqual(len(game.moves_history), 202)
+        while game.rewind():
+            pass
+        self.assertTrue(all(cell is None for row in game.board.grid for cell in row))
+        self.assertEqual(game.current_player.color, "red")
+        self.assertEqual(len(game.current_player.get_available_pieces()), 6)
+
     def test_nested_gobbling(self):
         """Test gobbling a piece that has already gobbled another piece."""
         # Place a small red piece
@@ -231,5 +265,66 @@ class TestGame(unittest.TestCase):
         self.assertTrue(self.game.game_over)
         self.assertEqual(self.game.winner, "red")
 
+    def _shuffle(self, game, times):
+        """Place a large piece each in opposite corners, then move them back and forth."""
+        game.make_move(piece_idx=0, to_pos=(0, 0))  # Red large
+        game.make_move(piece_idx=0, to_pos=(2, 2))  # Yellow large
+        for _ in range(times):
+            game.make_move(from_pos=(0, 0), to_pos=(0, 1))
+            game.make_move(from_pos=(2, 2), to_pos=(2, 1))
+            game.make_move(from_pos=(0, 1), to_pos=(0, 0))
+            game.make_move(from_pos=(2, 1), to_pos=(2, 2))
+
+    def test_no_draw_rule_by_default(self):
+        """Test repeated positions do not end a game unless a draw rule is set."""
+        self._shuffle(self.game, 3)
+        self.assertFalse(self.game.game_over)
+
+    def test_threefold_repetition(self):
+        """Test the third occurrence of a position ends the game as a draw."""
+        game = Game(repetition_limit=3)
+        self._shuffle(game, 1)
+        self.assertFalse(game.game_over)
+        self.assertEqual(max(game.position_counts.values()), 2)
+
+        game.make_move(from_pos=(0, 0), to_pos=(0, 1))
+        game.make_move(from_pos=(2, 2), to_pos=(2, 1))
+        game.make_move(from_pos=(0, 1), to_pos=(0, 0))
+        self.assertFalse(game.game_over)
+        game.make_move(from_pos=(2, 1), to_pos=(2, 2))
+        self.assertTrue(game.game_over)
+        self.assertTrue(game.is_draw)
+        self.assertIsNone(game.winner)
+        self.assertFalse(game.make_move(from_pos=(0, 0), to_pos=(0, 1)))
+
+    def test_rewind_undoes_repetition_count(self):
+        """Test rewinding out of a draw reopens the game and forgets the repetition."""
+        game = Game(repetition_limit=3)
+        self._shuffle(game, 2)
+        self.assertTrue(game.is_draw)
+
+        game.rewind()
+        self.assertFalse(game.game_over)
+        game.make_move(from_pos=(2, 1), to_pos=(2, 2))
+        self.assertTrue(game.is_draw)
+
+        # Take back two moves and play something else: no third repetition
+        game.rewind()
+        game.rewind()
+        game.make_move(from_pos=(0, 1), to_pos=(1, 1))
+        game.make_move(from_pos=(2, 1), to_pos=(2, 2))
+        self.assertFalse(game.game_over)
+
+    def test_max_plies(self):
+        """Test the ply cap ends the game as a draw."""
+        game = Game(max_plies=4)
+        self._shuffle(game, 0)
+        game.make_move(from_pos=(0, 0), to_pos=(0, 1))
+        self.assertFalse(game.game_over)
+        game.make_move(from_pos=(2, 2), to_pos=(2, 1))
+        self.assertTrue(game.is_draw)
+        game.rewind()
+        self.assertFalse(game.game_over)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
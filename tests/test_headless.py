@@ -0,0 +1,50 @@
+import glob
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestHeadless(unittest.TestCase):
+    """Test cases for importing the engine without pygame."""
+
+    def test_engine_imports_without_pygame(self):
+        """Test every game module can be imported without loading pygame."""
+        modules = sorted(
+            'src.game.' + os.path.splitext(os.path.basename(path))[0]
+            for path in glob.glob(os.path.join(ROOT, 'src', 'game', '*.py'))
+        )
+        code = (
+            f"import importlib, sys\n"
+            f"for name in {modules!r}:\n"
+            f"    importlib.import_module(name)\n"
+            f"sys.exit('pygame' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=False)
+        self.assertEqual(result.returncode, 0)
+
+    def test_search_imports_without_multiprocessing(self):
+        """Test the search, pondering, hint and engine modules start without multiprocessing."""
+        code = (
+            "import sys\n"
+            "import src.game.engine, src.game.hints, src.game.ponder, src.game.search\n"
+            "sys.exit('multiprocessing' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=False)
+        self.assertEqual(result.returncode, 0)
+
+    def test_cli_help_without_pygame(self):
+        """Test parsing the game's command line does not load the UI."""
+        code = (
+            "import sys\n"
+            "sys.path.insert(0, 'src')\n"
+            "import gobblet\n"
+            "gobblet.parse_args([])\n"
+            "sys.exit('pygame' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=False)
+        self.assertEqual(result.returncode, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from src.game.game import Game
+from src.game.hints import HintService
+
+class TestHintService(unittest.TestCase):
+    """Test cases for background best-move hints."""
+
+    def setUp(self):
+        """Set up a hint service on a thread pool and a game with an open line."""
+        self.hints = HintService(max_depth=3, executor=ThreadPoolExecutor(max_workers=1))
+        self.game = Game()
+        self.game.make_move(piece_idx=0, to_pos=(0, 0))  # Red large
+        self.game.make_move(piece_idx=0, to_pos=(1, 0))  # Yellow large
+        self.game.make_move(piece_idx=1, to_pos=(0, 1))  # Red large
+        self.game.make_move(piece_idx=0, to_pos=(2, 2))  # Yellow medium
+
+    def tearDown(self):
+        """Shut the pool down."""
+        self.hints.close()
+
+    def _wait_for_hint(self):
+        """Poll like the UI loop until the hint arrives."""
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            hint = self.hints.get(self.game)
+            if hint is not None:
+                return hint
+            time.sleep(0.01)
+        self.fail("hint was not delivered")
+        return None
+
+    def test_hint_is_computed_in_background(self):
+        """Test the first request returns immediately and the hint arrives later."""
+        self.assertIsNone(self.hints.get(self.game))
+        hint = self._wait_for_hint()
+        self.assertEqual(hint['to_pos'], (0, 2))
+
+    def test_hint_is_cached_across_rewind(self):
+        """Test returning to a seen position answers from the cache."""
+        hint = self._wait_for_hint()
+        self.game.make_move(**hint)
+        self.game.rewind()
+        self.assertEqual(self.hints.get(self.game), hint)
+
+    def test_no_hint_when_game_over(self):
+        """Test finished games get no hint."""
+        self.game.make_move(**self._wait_for_hint())
+        self.assertIsNone(self.hints.get(self.game))
+
+if __name__ == '__main__':
+    unittest.main()
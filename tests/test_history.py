@@ -0,0 +1,74 @@
+import tempfile
+import unittest
+from src.game import state
+from src.game.history import History
+from src.game.records import self_play
+
+class TestHistory(unittest.TestCase):
+    """Test cases for the compact move history."""
+
+    def _positions(self, moves):
+        """Return the position key before each move of a game."""
+        board, side, positions = 0, 0, []
+        for move in moves:
+            positions.append(state.position_key(board, side))
+            board, _ = state.apply_move(board, side, move)
+            side = 1 - side
+        return positions
+
+    def _check(self, history):
+        """Push and pop random games, comparing against a plain list."""
+        for moves in self_play(10, seed=3):
+            entries = list(zip(self._positions(moves), moves))
+            for position, move in entries:
+                history.append(position, move)
+            self.assertEqual(len(history), len(entries))
+            self.assertEqual(history.moves(), moves)
+            self.assertEqual(history.initial_position(), 0)
+            while entries:
+                self.assertEqual(history.pop(), entries.pop())
+            self.assertEqual(len(history), 0)
+
+    def test_push_pop(self):
+        """Test popping rebuilds every position from the checkpoints."""
+        self._check(History(checkpoint_interval=4))
+
+    def test_spill_to_disk(self):
+        """Test a memory limit spills old segments and reads them back on rewind."""
+        with tempfile.TemporaryDirectory() as tmp:
+            history = History(checkpoint_interval=4, memory_limit=8, spill_dir=tmp)
+            self._check(history)
+            history.close()
+
+    def test_memory_bound(self):
+        """Test in-memory data stays bounded however long the history grows."""
+        history = History(checkpoint_interval=16, memory_limit=64)
+        moves = next(self_play(1, seed=1, max_plies=20))
+        positions = self._positions(moves)
+        for _ in range(100):
+            for position, move in zip(positions, moves):
+                history.append(position, move)
+        self.assertEqual(len(history), 100 * len(moves))
+        self.assertLess(history.memory_bytes(), 512)
+        self.assertEqual(history.pop(), (positions[-1], moves[-1]))
+        history.close()
+
+    def test_out_of_sequence_position(self):
+        """Test positions that do not follow from the previous move are kept as is."""
+        history = History()
+        first = state.encode_move(state.SUPPLY_BASE + 2, 4)
+        history.append(0, first)
+        # Same side to move again, as if the player had been switched by hand
+        board, _ = state.apply_move(0, 0, first)
+        second = state.encode_move(state.SUPPLY_BASE + 1, 0)
+        history.append(state.position_key(board, 0), second)
+        self.assertEqual(history.pop(), (state.position_key(board, 0), second))
+        self.assertEqual(history.pop(), (0, first))
+
+    def test_pop_empty(self):
+        """Test popping an empty history raises IndexError."""
+        with self.assertRaises(IndexError):
+            History().pop()
+
+if __name__ == '__main__':
+    unittest.main()
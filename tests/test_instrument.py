@@ -0,0 +1,118 @@
+import csv
+import json
+import os
+import sys
+import tempfile
+import unittest
+from src.game.game import Game
+from src.game.instrument import stats, Histogram, FrameTimer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+# pylint: disable=wrong-import-position
+import pygame
+from game import instrument as ui_instrument    # The instance the UI modules record to
+from game.game import Game as UIGame
+from ui.constants import PLAYER1_LABEL_POSITION, PLAYER1_PIECES_POSITION
+from ui.filmstrip import FilmstripRenderer
+from ui.input_handler import InputHandler
+from ui.renderer import Renderer
+# pylint: enable=wrong-import-position
+
+class TestInstrument(unittest.TestCase):
+    """Test cases for the instrumentation layer."""
+
+    def tearDown(self):
+        """Leave instrumentation off and empty for other tests."""
+        stats.disable()
+        stats.reset()
+
+    def test_disabled_records_nothing(self):
+        """Test nothing is collected unless enabled."""
+        Game().make_move(piece_idx=0, to_pos=(0, 0))
+        stats.count('anything')
+        self.assertEqual(stats.snapshot(), {'counters': {}, 'timings': {}})
+
+    def test_engine_calls_are_timed(self):
+        """Test make_move, the snapshot and check_winner are recorded when enabled."""
+        stats.enable()
+        game = Game()
+        game.make_move(piece_idx=0, to_pos=(0, 0))
+        game.make_move(piece_idx=0, to_pos=(1, 1))
+        game.rewind()
+
+        timings = stats.snapshot()['timings']
+        self.assertEqual(timings['Game.make_move']['count'], 2)
+        self.assertEqual(timings['Game._get_state_snapshot']['count'], 2)
+        self.assertEqual(timings['Board.check_winner']['count'], 2)
+        self.assertEqual(timings['Game.rewind']['count'], 1)
+
+    def test_ui_calls_are_timed(self):
+        """Test input handling and the renderer's draw calls are recorded when enabled."""
+        pygame.init()   # pylint: disable=no-member
+        ui_stats = ui_instrument.stats
+        ui_stats.enable()
+        try:
+            game = UIGame()
+            renderer = Renderer(pygame.Surface((800, 600)))
+            handler = InputHandler(game, renderer.view)
+            motion = pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0))  # pylint: disable=no-member
+            handler.handle_event(motion)
+            renderer.draw_board()
+            renderer.draw_frame_stats(FrameTimer())
+            renderer.draw_player_label(game.players[0], PLAYER1_LABEL_POSITION,
+                                       PLAYER1_PIECES_POSITION)
+            timings = ui_stats.snapshot()['timings']
+            filmstrip = FilmstripRenderer()
+            filmstrip.draw_tile(pygame.Surface(filmstrip.tile_size), (0, 0), game, 0)
+            tile_timings = ui_stats.snapshot()['timings']
+        finally:
+            ui_stats.disable()
+            ui_stats.reset()
+        for name in ('InputHandler.handle_event', 'Renderer.draw_board',
+                     'Renderer.draw_frame_stats', 'Renderer.draw_player_label'):
+            self.assertEqual(timings[name]['count'], 1, name)
+        self.assertEqual(tile_timings['FilmstripRenderer.draw_tile']['count'], 1)
+
+    def test_histogram_percentiles(self):
+        """Test percentiles land in the right power-of-two bucket."""
+        histogram = Histogram()
+        for _ in range(90):
+            histogram.record(3e-6)
+        for _ in range(10):
+            histogram.record(1e-3)
+        self.assertEqual(histogram.percentile(50), 4e-6)
+        self.assertEqual(histogram.percentile(99), 1e-3)
+        self.assertEqual(histogram.summary()['count'], 100)
+
+    def test_export(self):
+        """Test JSON and CSV exports contain the recorded names."""
+        stats.enable()
+        stats.count('hits', 3)
+        stats.record('work', 0.002)
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, 'stats.json')
+            csv_path = os.path.join(tmp, 'stats.csv')
+            stats.dump(json_path)
+            stats.dump(csv_path)
+            with open(json_path, encoding='utf-8') as src:
+                data = json.load(src)
+            with open(csv_path, encoding='utf-8') as src:
+                rows = {row['name']: row for row in csv.DictReader(src)}
+        self.assertEqual(data['counters'], {'hits': 3})
+        self.assertEqual(data['timings']['work']['count'], 1)
+        self.assertEqual(rows['hits']['count'], '3')
+        self.assertEqual(rows['work']['count'], '1')
+
+    def test_frame_timer(self):
+        """Test the frame window reports percentiles and FPS."""
+        timer = FrameTimer(window=4)
+        timer.frames.extend([0.01, 0.02, 0.02, 0.05])
+        self.assertEqual(timer.percentile(50), 0.02)
+        self.assertEqual(timer.percentile(99), 0.05)
+        self.assertAlmostEqual(timer.fps, 40.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import gc
+import time
+import unittest
+from multiprocessing import shared_memory
+from src.game.game import Game
+from src.game import state
+from src.game.parallel import ParallelSearcher
+from src.game.search import Searcher, WIN_SCORE
+
+
+class TestParallelSearch(unittest.TestCase):
+    """Test cases for Lazy SMP search."""
+
+    def test_finds_immediate_win_with_helpers(self):
+        """Test helper processes join the search and the main result stands."""
+        game = Game()
+        game.make_move(piece_idx=0, to_pos=(0, 0))  # Red large
+        game.make_move(piece_idx=0, to_pos=(1, 0))  # Yellow large
+        game.make_move(piece_idx=1, to_pos=(0, 1))  # Red large
+        game.make_move(piece_idx=0, to_pos=(2, 2))  # Yellow medium
+        board, side = state.encode_game(game)
+
+        with ParallelSearcher(workers=2, capacity=1 << 12) as searcher:
+            result = searcher.search(board, side, max_depth=3)
+            self.assertEqual(result.score, WIN_SCORE - 1)
+            self.assertTrue(game.make_move(**state.move_to_kwargs(game, result.move)))
+            self.assertEqual(game.winner, "red")
+
+            # Searches can follow each other on the same helpers
+            opening = searcher.search(0, 0, max_depth=3)
+            self.assertGreater(opening.nodes, searcher.searcher.nodes)
+
+    def test_single_worker_matches_searcher(self):
+        """Test one worker on the shared table searches exactly like a plain Searcher."""
+        expected = Searcher().search(0, 0, max_depth=4)
+        with ParallelSearcher(workers=1, capacity=1 << 18) as searcher:
+            result = searcher.search(0, 0, max_depth=4)
+        self.assertEqual((result.move, result.score, result.nodes),
+                         (expected.move, expected.score, expected.nodes))
+
+    def test_dead_helper_raises(self):
+        """Test a search fails promptly, instead of hanging, when a helper has died."""
+        with ParallelSearcher(workers=2, capacity=1 << 12) as searcher:
+            helper = searcher._helpers[0]   # pylint: disable=protected-access
+            helper.kill()   # SIGTERM may be caught by handlers inherited from the parent
+            helper.join()
+            start = time.perf_counter()
+            with self.assertRaises(RuntimeError):
+                searcher.search(0, 0, max_depth=2)
+            self.assertLess(time.perf_counter() - start, 5.0)
+
+    def test_stale_helper_counts_are_dropped(self):
+        """Test counts left by a search cut short are not added to the next search."""
+        with ParallelSearcher(workers=2, capacity=1 << 12) as searcher:
+            # A count another helper sent before the dead-helper error was raised
+            results = searcher._results     # pylint: disable=protected-access
+            results.put(10 ** 9)
+            deadline = time.perf_counter() + 5
+            while results.empty() and time.perf_counter() < deadline:
+                time.sleep(0.01)
+            result = searcher.search(0, 0, max_depth=2)
+            self.assertGreaterEqual(result.nodes, searcher.searcher.nodes)
+            self.assertLess(result.nodes, 10 ** 9)
+
+    def test_unclosed_searcher_is_released(self):
+        """Test dropping a searcher without close() stops its helpers and frees the table."""
+        searcher = ParallelSearcher(workers=2, capacity=1 << 12)
+        name = searcher.table.name
+        helpers = list(searcher._helpers)     # pylint: disable=protected-access
+        del searcher
+        gc.collect()
+        self.assertFalse(any(helper.is_alive() for helper in helpers))
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import time
+import unittest
+from src.game import state
+from src.game.game import Game
+from src.game.ponder import Ponderer
+from src.game.search import Searcher, SearchResult
+
+
+class GatedSearcher(Searcher):
+    """Holds pondering at depth 1: deeper untimed searches wait until stopped."""
+
+    def __init__(self):
+        """Record every search as (kind, max_depth, result)."""
+        super().__init__()
+        self.calls = []
+
+    def search(self, board, side, max_depth=8, time_limit=None, stop_event=None, **kwargs):
+        """Search, or wait for the stop event in place of a deeper ponder search."""
+        if time_limit is None and max_depth > 1:
+            self.calls.append(('held', max_depth, None))
+            stop_event.wait()
+            return SearchResult()
+        result = super().search(board, side, max_depth, time_limit, stop_event, **kwargs)
+        self.calls.append(('searched', max_depth, result))
+        return result
+
+
+class TestPonderer(unittest.TestCase):
+    """Test cases for background thinking."""
+
+    def setUp(self):
+        """Set up a game with the computer playing yellow."""
+        self.game = Game()
+        self.ponderer = Ponderer(1, max_depth=2, move_time=1.0)
+
+    def tearDown(self):
+        """Stop any worker thread."""
+        self.ponderer.cancel()
+
+    def _wait_for_move(self):
+        """Poll the ponderer like a UI loop would."""
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            move = self.ponderer.update(self.game)
+            if move is not None:
+                return move
+            time.sleep(0.01)
+        self.fail("computer did not move")
+        return None
+
+    def test_pondered_reply_is_instant(self):
+        """Test a reply found while pondering is delivered without searching."""
+        self.ponderer.update(self.game)
+        while self.ponderer.thinking:
+            time.sleep(0.01)
+        self.game.make_move(piece_idx=0, to_pos=(1, 1))
+
+        self.ponderer.request_move(self.game)
+        self.assertFalse(self.ponderer.thinking)
+        move = self.ponderer.poll(self.game)
+        self.assertIsNotNone(move)
+        self.assertTrue(self.game.make_move(**move))
+
+    def test_shallow_pondered_reply_is_searched(self):
+        """Test a reply pondered only to depth 1 is searched to max_depth, not played."""
+        searcher = GatedSearcher()
+        self.ponderer = Ponderer(1, searcher, max_depth=3, move_time=5.0)
+        self.ponderer.update(self.game)
+        deadline = time.time() + 5
+        while ('held', 2, None) not in searcher.calls and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertIn(('held', 2, None), searcher.calls)
+        self.game.make_move(piece_idx=0, to_pos=(1, 1))
+
+        move = self._wait_for_move()
+        kind, depth, result = searcher.calls[-1]
+        self.assertEqual((kind, depth, result.depth), ('searched', 3, 3))
+        self.assertEqual(move, state.move_to_kwargs(self.game, result.move))
+        self.assertTrue(self.game.make_move(**move))
+
+    def test_ponder_cycle_is_one_table_generation(self):
+        """Test pondering every reply ages the shared table only once."""
+        self.ponderer.update(self.game)
+        while self.ponderer.thinking:
+            time.sleep(0.01)
+        self.assertEqual(self.ponderer.searcher.table.age, 1)
+
+    def test_unpondered_move(self):
+        """Test the computer still moves when nothing was pondered."""
+        self.game.make_move(piece_idx=0, to_pos=(0, 0))
+        self.assertTrue(self.game.make_move(**self._wait_for_move()))
+        self.assertEqual(self.game.current_player.color, "red")
+
+    def test_cancel_on_rewind(self):
+        """Test a move computed before a rewind is not delivered afterwards."""
+        self.game.make_move(piece_idx=0, to_pos=(0, 0))
+        self.ponderer.update(self.game)
+        self.ponderer.cancel()
+        self.assertFalse(self.ponderer.thinking)
+        self.game.rewind()
+        self.assertIsNone(self.ponderer.poll(self.game))
+        self.assertIsNone(self.ponderer.update(self.game))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import dataclasses
+import unittest
+from unittest import mock
+from src.game import state
+from src.game.game import Game
+from src.game.position import Position
+from src.game.records import self_play
+
+PLACE_LARGE = state.SUPPLY_BASE + 2
+PLACE_SMALL = state.SUPPLY_BASE
+
+class TestPosition(unittest.TestCase):
+    """Test cases for immutable positions."""
+
+    def test_play_leaves_parent_unchanged(self):
+        """Test playing a move returns a child linked to its unchanged parent."""
+        start = Position()
+        child = start.play(state.encode_move(PLACE_LARGE, 4))
+        self.assertEqual(start, Position())
+        self.assertIs(child.parent, start)
+        self.assertEqual(child.side, 1)
+        self.assertEqual(child.ply, 1)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            child.board = 0
+
+    def test_equality_ignores_history(self):
+        """Test transposed move orders give equal, equally hashed positions."""
+        a, b = state.encode_move(PLACE_LARGE, 0), state.encode_move(PLACE_SMALL, 8)
+        c, d = state.encode_move(PLACE_LARGE, 2), state.encode_move(PLACE_SMALL, 6)
+        one = Position().play(a).play(b).play(c).play(d)
+        two = Position().play(c).play(d).play(a).play(b)
+        self.assertEqual(one, two)
+        self.assertEqual(len({one, two}), 1)
+        self.assertNotEqual(one.path(), two.path())
+
+    def test_branches_share_history(self):
+        """Test every child of a position keeps the same parent object."""
+        start = Position().play(state.encode_move(PLACE_LARGE, 4))
+        children = start.children()
+        self.assertEqual(len(children), len(state.legal_moves(start.board, start.side)))
+        self.assertTrue(all(child.parent is start for _, child in children))
+
+    def test_illegal_move(self):
+        """Test illegal moves and moves after the end raise ValueError."""
+        start = Position().play(state.encode_move(PLACE_LARGE, 4))
+        with self.assertRaises(ValueError):
+            start.play(state.encode_move(PLACE_SMALL, 4))
+        moves = [state.encode_move(PLACE_LARGE, 0), state.encode_move(PLACE_LARGE, 3),
+                 state.encode_move(PLACE_LARGE, 1), state.encode_move(PLACE_LARGE, 4),
+                 state.encode_move(state.SUPPLY_BASE + 1, 2)]
+        end = Position()
+        for move in moves:
+            end = end.play(move)
+        self.assertEqual(end.winner, 1)
+        self.assertEqual(end.legal_moves(), [])
+        with self.assertRaises(ValueError):
+            end.play(state.encode_move(PLACE_SMALL, 8))
+
+    def test_matches_game(self):
+        """Test positions follow Game move for move and convert back and forth."""
+        for moves in self_play(10, seed=11):
+            game = Game()
+            position = Position()
+            for move in moves:
+                game.make_move(**state.move_to_kwargs(game, move))
+                position = position.play(move)
+                self.assertEqual(Position.from_game(game), position)
+            copy = position.to_game()
+            self.assertEqual(state.encode_game(copy), state.encode_game(game))
+            self.assertEqual(copy.winner, game.winner)
+            self.assertEqual(len(copy.moves_history), len(game.moves_history))
+
+    def test_to_game_from_root(self):
+        """Test a game built from a branch rewinds back to the branch's root."""
+        root = Position.from_game(Game()).play(state.encode_move(PLACE_LARGE, 4))
+        root = Position(root.board, root.side)
+        game = root.play(state.encode_move(PLACE_LARGE, 0)).to_game()
+        self.assertEqual(len(game.moves_history), 1)
+        self.assertTrue(game.rewind())
+        self.assertEqual(Position.from_game(game), root)
+        self.assertFalse(game.rewind())
+
+    def test_to_game_rejects_unplayable_path(self):
+        """Test a path Game stops short of, or cannot express, raises ValueError."""
+        position = Position()
+        for move in next(self_play(1, seed=3))[:3]:
+            position = position.play(move)
+        self.assertEqual(len(position.to_game(max_plies=3).moves_history), 3)
+        with self.assertRaises(ValueError):
+            position.to_game(max_plies=1)
+        with mock.patch.object(state, 'move_to_kwargs', return_value=None):
+            with self.assertRaises(ValueError):
+                position.to_game()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from src.game import state
+from src.game.puzzles import Puzzle, generate, read_puzzles, solve, write_puzzles
+
+PLACE_LARGE = state.SUPPLY_BASE + 2
+PLACE_SMALL = state.SUPPLY_BASE
+
+
+def _play(moves):
+    """Packed position after moves from the start."""
+    board, side = 0, 0
+    for move in moves:
+        board, _ = state.apply_move(board, side, move)
+        side = 1 - side
+    return board, side
+
+
+class TestPuzzles(unittest.TestCase):
+    """Test cases for the puzzle miner."""
+
+    def test_rejects_ambiguous_and_faster_wins(self):
+        """Test several winning moves, or a win sooner than N, are not puzzles."""
+        # Red has two large pieces on the top row and can finish it with any size
+        board, side = _play([state.encode_move(PLACE_LARGE, 0), state.encode_move(PLACE_SMALL, 8),
+                             state.encode_move(PLACE_LARGE, 1), state.encode_move(PLACE_SMALL, 7)])
+        self.assertIsNone(solve(board, side, 1))
+        self.assertIsNone(solve(board, side, 2))
+
+    def test_mined_puzzles_are_forced_wins(self):
+        """Test each mined win in 1 wins in Game, and each win in 2 survives every reply."""
+        for puzzle in generate(5, 1, workers=1):
+            game = puzzle.to_game()
+            self.assertTrue(game.make_move(**puzzle.solution_kwargs(game)))
+            self.assertEqual(state.COLOR_CODES[game.winner], puzzle.side + 1)
+
+        for puzzle in generate(3, 2, workers=1, seed=7):
+            board, winner = state.apply_move(puzzle.board, puzzle.side, puzzle.solution)
+            self.assertEqual(winner, 0)
+            for reply in state.legal_moves(board, 1 - puzzle.side):
+                after, winner = state.apply_move(board, 1 - puzzle.side, reply)
+                if not winner:
+                    self.assertIsNotNone(
+                        next((move for move in state.legal_moves(after, puzzle.side)
+                              if state.apply_move(after, puzzle.side, move)[1]
+                              == puzzle.side + 1), None))
+                else:
+                    self.assertEqual(winner, puzzle.side + 1)
+
+    def test_generate_deduplicates_symmetric_positions(self):
+        """Test no two mined puzzles are rotations or reflections of each other."""
+        puzzles = list(generate(30, 1, workers=1))
+        keys = {state.canonical_key(puzzle.board, puzzle.side) for puzzle in puzzles}
+        self.assertEqual(len(keys), 30)
+
+    def test_pool_mines_same_puzzles_in_order(self):
+        """Test a process pool yields what mining in-process does, and counts the batches."""
+        stats = {}
+        pooled = list(generate(12, 1, workers=2, batch=50, stats=stats))
+        self.assertEqual(pooled, list(generate(12, 1, workers=1, batch=50)))
+        self.assertGreater(stats['batches'], 0)
+        self.assertEqual(list(generate(0, 1, workers=1, stats=stats)), [])
+
+    def test_file_round_trip(self):
+        """Test puzzles written to a gzip file read back unchanged."""
+        puzzles = [Puzzle(state.position_key(*_play([state.encode_move(PLACE_LARGE, 4)])), 2, 5),
+                   Puzzle(state.position_key(0, 0), 1, 0)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'puzzles.txt.gz')
+            self.assertEqual(write_puzzles(path, puzzles), 2)
+            self.assertEqual(list(read_puzzles(path)), puzzles)
+
+    def test_to_game(self):
+        """Test a puzzle loads into Game at its position with the solver to move."""
+        board, side = _play([state.encode_move(PLACE_LARGE, 4), state.encode_move(PLACE_SMALL, 0)])
+        game = Puzzle(state.position_key(board, side), 1, 0).to_game()
+        self.assertEqual(state.encode_game(game), (board, side))
+        self.assertFalse(game.game_over)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import queue
+import tempfile
+import threading
+import unittest
+from src.game import state
+from src.game.records import (
+    read_games, write_games, replay, play_out, self_play, stream_moves
+)
+from src.game.search import Searcher
+
+PLACE_LARGE = state.SUPPLY_BASE + 2
+
+class TestRecords(unittest.TestCase):
+    """Test cases for game archives and replay."""
+
+    def test_archive_round_trip(self):
+        """Test games survive writing and reading, plain and gzip-compressed."""
+        games = list(self_play(20, seed=5))
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ('games.txt', 'games.txt.gz'):
+                path = os.path.join(tmp, name)
+                self.assertEqual(write_games(path, games), 20)
+                self.assertEqual(list(read_games(path)), games)
+
+    def test_replay(self):
+        """Test replay reports positions before each move and the final winner."""
+        moves = [
+            state.encode_move(PLACE_LARGE, 0), state.encode_move(PLACE_LARGE, 3),
+            state.encode_move(PLACE_LARGE, 1), state.encode_move(PLACE_LARGE, 4),
+            state.encode_move(state.SUPPLY_BASE + 1, 2),
+        ]
+        steps = list(replay(moves))
+        self.assertEqual(len(steps), 5)
+        self.assertEqual(steps[0][:2], (0, 0))
+        self.assertEqual([side for _, side, _, _ in steps], [0, 1, 0, 1, 0])
+        self.assertEqual(play_out(moves), 1)
+
+    def test_replay_rejects_bad_records(self):
+        """Test illegal moves and moves after the end are reported."""
+        with self.assertRaises(ValueError):
+            list(replay([state.encode_move(0, 1)]))
+        game = next(self_play(1, seed=1))
+        while not play_out(game):
+            game = next(self_play(1, seed=len(game)))
+        with self.assertRaises(ValueError):
+            list(replay(game + game[-1:]))
+
+    def test_self_play(self):
+        """Test self-play games are legal, reproducible and can use a searcher."""
+        games = list(self_play(10, seed=2, max_plies=30))
+        self.assertEqual(games, list(self_play(10, seed=2, max_plies=30)))
+        for moves in games:
+            self.assertLessEqual(len(moves), 30)
+            play_out(moves)
+        searched = next(self_play(1, seed=2, searcher=Searcher(), depth=1, randomness=0.0))
+        self.assertTrue(play_out(searched))
+
+    def test_stream_moves(self):
+        """Test streamed moves form valid games on every board until stopped."""
+        moves = queue.Queue()
+        stop = threading.Event()
+        runner = threading.Thread(target=stream_moves, args=(moves, [3, 5], 1, 0.0, stop))
+        runner.start()
+        received = [moves.get(timeout=5) for _ in range(400)]
+        stop.set()
+        runner.join(timeout=5)
+        self.assertFalse(runner.is_alive())
+
+        games = {3: [], 5: []}
+        finished = 0
+        for board_id, move in received:
+            if move is None:
+                if games[board_id]:
+                    finished += 1
+                    self.assertTrue(play_out(games[board_id]) or len(games[board_id]) == 200)
+                games[board_id] = []
+            else:
+                games[board_id].append(move)
+        for partial in games.values():
+            list(replay(partial))   # Raises if a move is illegal
+        self.assertGreater(finished, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+# pylint: disable=wrong-import-position
+import pygame
+from ui.constants import WHITE, PLAYER1_PIECES_POSITION
+from ui.renderer import Renderer
+# pylint: enable=wrong-import-position
+
+
+class TestRendererHint(unittest.TestCase):
+    """Test cases for the hint overlay."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()   # pylint: disable=no-member
+
+    def setUp(self):
+        """Set up a renderer on a white off-screen surface."""
+        self.screen = pygame.Surface((800, 600))
+        self.screen.fill(WHITE)
+        self.renderer = Renderer(self.screen)
+        self.hint = {'piece_idx': 0, 'to_pos': (1, 1)}
+
+    def test_hint_marks_target_cell(self):
+        """Test the hint tints the target cell and leaves other cells alone."""
+        self.renderer.draw_hint(self.hint, PLAYER1_PIECES_POSITION)
+        view = self.renderer.view
+        self.assertNotEqual(tuple(self.screen.get_at(view.cell_rect(1, 1).topleft))[:3],
+                            WHITE)
+        self.assertEqual(tuple(self.screen.get_at(view.cell_rect(0, 2).center))[:3], WHITE)
+
+    def test_only_current_hint_is_cached(self):
+        """Test the overlay is reused for the same hint and replaced for a new one."""
+        self.renderer.draw_hint(self.hint, PLAYER1_PIECES_POSITION)
+        overlay = self.renderer._hint_overlay[2]
+        self.renderer.draw_hint(dict(self.hint), PLAYER1_PIECES_POSITION)
+        self.assertIs(self.renderer._hint_overlay[2], overlay)
+
+        self.renderer.draw_hint({'from_pos': (1, 1), 'to_pos': (0, 0)},
+                                PLAYER1_PIECES_POSITION)
+        self.assertIsNot(self.renderer._hint_overlay[2], overlay)
+        self.assertEqual(self.renderer._hint_overlay[0], (None, (1, 1), (0, 0),
+                                                          PLAYER1_PIECES_POSITION))
+
+    def test_view_change_rebuilds_overlay(self):
+        """Test the overlay is rebuilt when the view changes."""
+        self.renderer.draw_hint(self.hint, PLAYER1_PIECES_POSITION)
+        overlay = self.renderer._hint_overlay[2]
+        self.renderer.view.rotate(1)
+        self.renderer.draw_hint(self.hint, PLAYER1_PIECES_POSITION)
+        self.assertIsNot(self.renderer._hint_overlay[2], overlay)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import time
+import unittest
+from src.game import state
+from src.game.game import Game
+from src.game.scheduler import BotScheduler, simulate
+
+
+class TestBotScheduler(unittest.TestCase):
+    """Test cases for the bot worker pool."""
+
+    def _collect(self, scheduler, count, timeout=10.0):
+        """Poll until count moves have finished."""
+        moves = []
+        deadline = time.time() + timeout
+        while len(moves) < count and time.time() < deadline:
+            moves.extend(scheduler.poll(timeout=0.05))
+        return moves
+
+    def test_moves_for_many_games(self):
+        """Test every submitted game gets a legal move and the metrics add up."""
+        boards = {}
+        with BotScheduler(workers=2, max_depth=2) as scheduler:
+            for game_id in range(6):
+                game = Game()
+                game.make_move(piece_idx=game_id % 6, to_pos=divmod(game_id, 3))
+                boards[game_id] = state.encode_game(game)
+                scheduler.submit_game(game_id, game, budget=2.0)
+            moves = self._collect(scheduler, 6)
+            metrics = scheduler.metrics()
+        self.assertEqual(sorted(move.game_id for move in moves), list(range(6)))
+        for move in moves:
+            self.assertTrue(state.is_legal(*boards[move.game_id], move.move))
+            self.assertGreaterEqual(move.queue_wait, 0.0)
+        self.assertEqual((metrics['submitted'], metrics['completed'], metrics['waiting']),
+                         (6, 6, 0))
+        self.assertEqual(metrics['queue_wait']['count'], 6)
+
+    def test_earliest_deadline_first(self):
+        """Test a waiting job with a nearer deadline starts before an earlier submission."""
+        with BotScheduler(workers=1, max_depth=20) as scheduler:
+            scheduler.submit('busy', 0, 0, budget=0.3)     # Occupies the only worker
+            scheduler.submit('relaxed', 0, 0, budget=5.0, max_depth=1)
+            scheduler.submit('urgent', 0, 0, budget=1.0, max_depth=1)
+            order = [move.game_id for move in self._collect(scheduler, 3)]
+        self.assertEqual(order, ['busy', 'urgent', 'relaxed'])
+
+    def test_cancel_waiting_and_running_jobs(self):
+        """Test cancelled jobs are never reported and a running search stops early."""
+        with BotScheduler(workers=1, max_depth=30) as scheduler:
+            scheduler.submit('rewound', 0, 0, budget=30.0)
+            scheduler.submit('closed', 0, 0, budget=30.0)
+            self.assertEqual((scheduler.running, scheduler.waiting), (1, 1))
+            self.assertTrue(scheduler.cancel('closed'))
+            self.assertTrue(scheduler.cancel('rewound'))
+            self.assertFalse(scheduler.cancel('rewound'))
+
+            start = time.time()
+            scheduler.submit('next', 0, 0, budget=2.0, max_depth=1)
+            moves = self._collect(scheduler, 1)
+            self.assertLess(time.time() - start, 5.0)
+            self.assertEqual([move.game_id for move in moves], ['next'])
+            self.assertEqual(scheduler.metrics()['cancelled'], 2)
+
+    def test_simulated_host(self):
+        """Test a simulated host plays its games to the end through the pool."""
+        metrics = simulate(4, workers=2, budget=0.5, max_depth=2)
+        self.assertGreater(metrics['completed'], 4)
+        self.assertEqual((metrics['waiting'], metrics['running']), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
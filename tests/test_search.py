@@ -0,0 +1,64 @@
+import threading
+import unittest
+from src.game.game import Game
+from src.game import state
+from src.game.search import Searcher, WIN_SCORE, MATE_BOUND
+
+class TestSearch(unittest.TestCase):
+    """Test cases for the alpha-beta Searcher."""
+
+    def setUp(self):
+        """Set up a fresh searcher before each test."""
+        self.searcher = Searcher()
+
+    def test_finds_immediate_win(self):
+        """Test the searcher completes an open line."""
+        game = Game()
+        game.make_move(piece_idx=0, to_pos=(0, 0))  # Red large
+        game.make_move(piece_idx=0, to_pos=(1, 0))  # Yellow large
+        game.make_move(piece_idx=1, to_pos=(0, 1))  # Red large
+        game.make_move(piece_idx=0, to_pos=(2, 2))  # Yellow medium
+
+        board, side = state.encode_game(game)
+        result = self.searcher.search(board, side, max_depth=3)
+        self.assertEqual(result.score, WIN_SCORE - 1)
+        self.assertTrue(game.make_move(**state.move_to_kwargs(game, result.move)))
+        self.assertEqual(game.winner, "red")
+
+    def test_blocks_opponent_win(self):
+        """Test the searcher blocks a line it cannot beat."""
+        game = Game()
+        game.make_move(piece_idx=4, to_pos=(2, 2))  # Red small
+        game.make_move(piece_idx=0, to_pos=(0, 0))  # Yellow large
+        game.make_move(piece_idx=4, to_pos=(1, 0))  # Red small
+        game.make_move(piece_idx=1, to_pos=(0, 1))  # Yellow large
+
+        board, side = state.encode_game(game)
+        result = self.searcher.search(board, side, max_depth=2)
+        self.assertGreater(result.score, -MATE_BOUND)
+        self.assertEqual(state.decode_move(result.move)[1], 2)
+
+    def test_table_is_reused(self):
+        """Test a repeated search is served from the transposition table."""
+        first = self.searcher.search(0, 0, max_depth=3)
+        second = self.searcher.search(0, 0, max_depth=3)
+        self.assertEqual(first.move, second.move)
+        self.assertLess(second.nodes, first.nodes)
+
+    def test_table_generation(self):
+        """Test each search starts a table generation unless told it continues one."""
+        self.searcher.search(0, 0, max_depth=1)
+        self.assertEqual(self.searcher.table.age, 1)
+        self.searcher.search(0, 0, max_depth=1, new_search=False)
+        self.assertEqual(self.searcher.table.age, 1)
+
+    def test_cancelled_search_still_returns_a_move(self):
+        """Test a search stopped before it starts returns a legal move."""
+        stop = threading.Event()
+        stop.set()
+        result = Searcher().search(0, 0, max_depth=10, stop_event=stop)
+        self.assertIn(result.move, state.legal_moves(0, 0))
+        self.assertLess(result.depth, 10)
+
+if __name__ == '__main__':
+    unittest.main()
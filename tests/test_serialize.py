@@ -0,0 +1,107 @@
+import unittest
+from src.game import state
+from src.game.game import Game
+from src.game.records import self_play
+from src.game.serialize import dumps, dumps_many, loads, loads_many
+
+
+def _play(game, moves):
+    """Play encoded moves on a Game."""
+    for move in moves:
+        if not game.make_move(**state.move_to_kwargs(game, move)):
+            break
+    return game
+
+
+class TestSerialize(unittest.TestCase):
+    """Test cases for binary save and load of games."""
+
+    def _assert_same(self, game, loaded):
+        """Compare everything Game keeps, then rewind both to the start in lockstep."""
+        def summary(game):
+            """Observable state of a game."""
+            supplies = [[piece.size for piece in player.get_available_pieces()]
+                        for player in game.players]
+            on_board = [sorted(piece.size for piece in player.board_pieces)
+                        for player in game.players]
+            return (state.encode_game(game), game.current_player_idx, game.game_over,
+                    game.winner, supplies, on_board, game.position_counts,
+                    game.moves_history.moves(), game.repetition_limit, game.max_plies,
+                    game.moves_history.memory_limit)
+
+        self.assertEqual(summary(loaded), summary(game))
+        while game.rewind():
+            self.assertTrue(loaded.rewind())
+            self.assertEqual(summary(loaded), summary(game))
+        self.assertFalse(loaded.rewind())
+
+    def test_round_trip_self_play(self):
+        """Test games at every stage, won or cut off, round-trip with their history."""
+        for moves in self_play(20, seed=5):
+            for plies in (0, len(moves) // 2, len(moves)):
+                game = _play(Game(), moves[:plies])
+                self._assert_same(game, loads(dumps(game)))
+
+    def test_round_trip_exposure_and_draw(self):
+        """Test an exposure loss and a repetition draw keep their outcome."""
+        game = Game()
+        game.make_move(piece_idx=0, to_pos=(0, 0))          # Red large
+        game.make_move(piece_idx=0, to_pos=(1, 1))          # Yellow large
+        game.make_move(piece_idx=1, to_pos=(0, 2))          # Red medium
+        game.make_move(piece_idx=0, to_pos=(0, 2))          # Yellow large gobbles it
+        game.make_move(piece_idx=0, to_pos=(0, 1))          # Red large
+        game.make_move(from_pos=(0, 2), to_pos=(1, 2))      # Yellow exposes red's row
+        self.assertEqual((game.winner, game.current_player_idx), ('red', 1))
+        self._assert_same(game, loads(dumps(game)))
+
+        game = Game(repetition_limit=3, max_plies=100)
+        game.make_move(piece_idx=0, to_pos=(0, 0))
+        game.make_move(piece_idx=0, to_pos=(2, 2))
+        for _ in range(2):
+            for from_pos, to_pos in (((0, 0), (0, 1)), ((2, 2), (2, 1)),
+                                     ((0, 1), (0, 0)), ((2, 1), (2, 2))):
+                game.make_move(from_pos=from_pos, to_pos=to_pos)
+        self.assertTrue(game.is_draw)
+        loaded = loads(dumps(game))
+        self.assertTrue(loaded.is_draw)
+        self._assert_same(game, loaded)
+
+    def test_round_trip_spilled_history(self):
+        """Test a history partly spilled to disk is saved whole and spilled again."""
+        moves = next(self_play(1, seed=2, max_plies=400))
+        game = _play(Game(history_limit=32), moves)
+        loaded = loads(dumps(game))
+        self.assertEqual(loaded.moves_history.memory_bytes(), game.moves_history.memory_bytes())
+        self._assert_same(game, loaded)
+
+    def test_many_games(self):
+        """Test a thousand live games save and load in one buffer."""
+        games = [_play(Game(), moves[:20]) for moves in self_play(1000, seed=9)]
+        loaded = loads_many(dumps_many(games))
+        self.assertEqual(len(loaded), len(games))
+        for game, copy in zip(games[:50], loaded):
+            self._assert_same(game, copy)
+
+    def test_rejects_bad_data(self):
+        """Test foreign, truncated, future-version and impossible data raise ValueError."""
+        data = dumps(_play(Game(), next(self_play(1, seed=1))))
+        side, flags, board = 4, 5, 6    # Header offsets
+        three_red_large = state.pack([1 << 4] * 3 + [0] * 6)
+        corrupt = (
+            data[:side] + b'\x02' + data[side + 1:],                   # No third player
+            data[:flags] + bytes([3 << 1 | 1]) + data[flags + 1:],     # No third winner
+            data[:board] + (1 << 54).to_bytes(8, 'little') + data[board + 8:],
+            data[:board] + (-1).to_bytes(8, 'little', signed=True) + data[board + 8:],
+            data[:board] + (3 << 4).to_bytes(8, 'little') + data[board + 8:],   # No colour 3
+            data[:board] + three_red_large.to_bytes(8, 'little') + data[board + 8:],
+        )
+        for bad in (b'', b'not a saved game' * 4, data[:-1], data[:3] + b'\x09' + data[4:],
+                    *corrupt):
+            with self.assertRaises(ValueError):
+                loads(bad)
+        with self.assertRaises(ValueError):
+            loads_many(dumps_many([Game()])[:-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
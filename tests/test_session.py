@@ -0,0 +1,128 @@
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+# pylint: disable=wrong-import-position,no-member
+import pygame
+from game import state
+from game.game import Game
+from ui.constants import PLAYER1_PIECES_POSITION, PLAYER2_PIECES_POSITION
+from ui.recording import EventRecorder, read_recording
+from ui.session import GameSession
+from ui.view import supply_slot
+# pylint: enable=wrong-import-position
+
+
+def _event(event_type, **attrs):
+    """A pygame event with the given attributes."""
+    return pygame.event.Event(event_type, attrs)
+
+
+class TestRecordingAndSession(unittest.TestCase):
+    """Test cases for recording input and replaying it through a GameSession."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    def setUp(self):
+        """Set up a scratch recording file."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, 'session.jsonl')
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        self._tmp.cleanup()
+
+    def _session(self):
+        """A session on an off-screen surface."""
+        return GameSession(pygame.Surface((800, 600)), Game())
+
+    def _drag(self, start, end):
+        """One frame per event of a drag from start to end."""
+        return [
+            [_event(pygame.MOUSEBUTTONDOWN, pos=start, button=1)],
+            [_event(pygame.MOUSEMOTION, pos=end)],
+            [_event(pygame.MOUSEBUTTONUP, pos=end, button=1)],
+        ]
+
+    def test_recording_round_trip(self):
+        """Test recorded events read back with the same types and attributes."""
+        frames = [
+            [_event(pygame.KEYDOWN, key=pygame.K_LEFT, mod=0, unicode='')],
+            [],
+            [_event(pygame.MOUSEBUTTONDOWN, pos=(10, 20), button=1),
+             _event(pygame.MOUSEMOTION, pos=(30, 40), rel=(20, 20)),
+             _event(pygame.ACTIVEEVENT, gain=1, state=1)],
+            [_event(pygame.VIDEORESIZE, size=(640, 480), w=640, h=480)],
+        ]
+        recorder = EventRecorder(self.path, (800, 600))
+        for frame in frames:
+            recorder.record_frame(frame)
+        recorder.close()
+
+        header, replayed = read_recording(self.path)
+        self.assertEqual(header['size'], [800, 600])
+        self.assertEqual(recorder.frames, 4)
+        self.assertEqual(
+            [[(event.type, event.dict) for event in frame] for frame in replayed],
+            [[(pygame.KEYDOWN, {'key': pygame.K_LEFT, 'mod': 0})], [],
+             [(pygame.MOUSEBUTTONDOWN, {'pos': (10, 20), 'button': 1}),
+              (pygame.MOUSEMOTION, {'pos': (30, 40)})],
+             [(pygame.VIDEORESIZE, {'size': (640, 480)})]]
+        )
+
+    def test_rejects_other_files(self):
+        """Test a file that is not a recording raises ValueError."""
+        with open(self.path, 'w', encoding='ascii') as out:
+            out.write('{"version": 99}\n')
+        with self.assertRaises(ValueError):
+            read_recording(self.path)
+
+    def test_replay_reproduces_game(self):
+        """Test replaying a recorded drag, drag and rewind leaves the same Game state."""
+        live = self._session()
+        view = live.view
+        frames = (
+            # Red drags its first (large) supply piece to the centre
+            self._drag(view.to_screen(supply_slot(PLAYER1_PIECES_POSITION, 0)),
+                       view.cell_rect(1, 1).center)
+            # Yellow drags its last (small) supply piece to a corner
+            + self._drag(view.to_screen(supply_slot(PLAYER2_PIECES_POSITION, 5)),
+                         view.cell_rect(0, 0).center)
+            # Red rotates the board, then clicks rewind
+            + [[_event(pygame.KEYDOWN, key=pygame.K_RIGHT, mod=0)],
+               [_event(pygame.MOUSEBUTTONDOWN, pos=live.renderer.button_rewind_rect.center,
+                       button=1)],
+               [_event(pygame.MOUSEBUTTONUP, pos=live.renderer.button_rewind_rect.center,
+                       button=1)]]
+        )
+        recorder = EventRecorder(self.path, (800, 600))
+        for frame in frames:
+            for event in frame:
+                self.assertTrue(live.handle_event(event))
+            recorder.record_frame(frame)
+        recorder.close()
+        self.assertEqual(len(live.game.moves_history), 1)
+        self.assertEqual(live.game.current_player_idx, 1)
+        self.assertIsNotNone(live.game.board.grid[1][1])
+
+        replayed = self._session()
+        for frame in read_recording(self.path)[1]:
+            for event in frame:
+                replayed.handle_event(event)
+        self.assertEqual(state.encode_game(replayed.game), state.encode_game(live.game))
+        self.assertEqual(replayed.view.rotation, live.view.rotation)
+
+    def test_quit_ends_session(self):
+        """Test a QUIT event tells the loop to stop."""
+        self.assertFalse(self._session().handle_event(_event(pygame.QUIT)))
+
+
+if __name__ == '__main__':
+    unittest.main()
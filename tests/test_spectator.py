@@ -0,0 +1,101 @@
+import os
+import queue
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+# pylint: disable=wrong-import-position
+import pygame
+from game import state
+from game.records import self_play
+from ui.constants import WHITE, RED, GREEN
+from ui.spectator import SpectatorWall
+# pylint: enable=wrong-import-position
+
+
+def _changed_cell(before, after):
+    """Index of the first cell that differs between two packed boards."""
+    return next(idx for idx, (old, new) in enumerate(zip(state.cells_of(before),
+                                                         state.cells_of(after)))
+                if old != new)
+
+
+def _winner(moves):
+    """Winner code (0 for none) after playing moves from the empty board."""
+    board, side, winner = 0, 0, 0
+    for move in moves:
+        board, winner = state.apply_move(board, side, move)
+        side = 1 - side
+    return winner
+
+
+class TestSpectatorWall(unittest.TestCase):
+    """Test cases for the spectator wall's redraws and move queue."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()   # pylint: disable=no-member
+
+    def setUp(self):
+        """Set up a wall of six boards on a white off-screen surface."""
+        self.screen = pygame.Surface((800, 600))
+        self.screen.fill(WHITE)
+        self.wall = SpectatorWall(self.screen, 6)
+
+    def test_only_changed_boards_are_redrawn(self):
+        """Test draw() returns the rectangles of the boards changed since the last call."""
+        self.assertCountEqual(self.wall.draw(), self.wall.rects)
+        self.assertEqual(self.wall.draw(), [])
+
+        move = state.legal_moves(0, 0)[0]
+        self.wall.apply(2, move)
+        self.assertEqual(self.wall.draw(), [self.wall.rects[2]])
+        self.wall.reset(4)
+        self.assertEqual(self.wall.draw(), [self.wall.rects[4]])
+        self.assertCountEqual(self.wall.draw(full=True), self.wall.rects)
+
+    def test_move_is_drawn_from_renderer_sprites(self):
+        """Test a red piece placed on a board shows in its cell."""
+        board, _ = state.apply_move(0, 0, state.legal_moves(0, 0)[0])
+        idx = _changed_cell(0, board)
+        self.wall.apply(1, state.legal_moves(0, 0)[0])
+        self.wall.draw()
+        row, col = divmod(idx, 3)
+        rect = self.wall.rects[1]
+        centre = (rect.x + col * self.wall.cell + self.wall.cell // 2,
+                  rect.y + row * self.wall.cell + self.wall.cell // 2)
+        self.assertEqual(tuple(self.screen.get_at(centre))[:3], RED)
+
+    def test_finished_game_is_outlined(self):
+        """Test a board whose game was won is framed in green."""
+        game = next(moves for moves in self_play(20, seed=1) if _winner(moves))
+        for move in game:
+            self.wall.apply(0, move)
+        self.wall.draw()
+        self.assertEqual(tuple(self.screen.get_at(self.wall.rects[0].topleft))[:3], GREEN)
+
+    def test_consume_applies_queue_up_to_limit(self):
+        """Test consume() takes at most limit entries and never blocks."""
+        moves = queue.Queue()
+        first = state.legal_moves(0, 0)[0]
+        board, _ = state.apply_move(0, 0, first)
+        moves.put((0, first))
+        moves.put((0, state.legal_moves(board, 1)[0]))
+        moves.put((0, None))
+        self.wall.draw()
+
+        self.assertEqual(self.wall.consume(moves, limit=2), 2)
+        self.assertEqual(self.wall.moves, 2)
+        self.assertEqual(self.wall.positions[0][1], 0)
+        self.assertNotEqual(self.wall.positions[0][0], 0)
+        self.assertEqual(self.wall.consume(moves), 1)
+        self.assertEqual(self.wall.positions[0], (0, 0, 0))
+        self.assertEqual(self.wall.consume(moves), 0)
+        self.assertEqual(self.wall.draw(), [self.wall.rects[0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import copy
+import random
+import unittest
+from src.game.game import Game
+from src.game import state
+
+class TestState(unittest.TestCase):
+    """Test cases for the compact position encoding."""
+
+    def test_initial_position(self):
+        """Test the empty board encodes to zero with full supplies."""
+        board, side = state.encode_game(Game())
+        self.assertEqual(board, 0)
+        self.assertEqual(side, 0)
+        self.assertEqual(state.supply_counts(board, 0), [2, 2, 2])
+        # 3 sizes x 9 cells of placements, nothing to move yet
+        self.assertEqual(len(state.legal_moves(board, side)), 27)
+
+    def test_move_round_trip(self):
+        """Test encoded moves translate to and from Game.make_move arguments."""
+        game = Game()
+        move = state.encode_move(state.SUPPLY_BASE + 1, 4)
+        kwargs = state.move_to_kwargs(game, move)
+        self.assertEqual(kwargs, {'piece_idx': 2, 'to_pos': (1, 1)})
+        self.assertEqual(state.move_from_kwargs(game, **kwargs), move)
+        self.assertEqual(state.move_from_kwargs(game, from_pos=(0, 2), to_pos=(2, 0)),
+                         state.encode_move(2, 6))
+
+    def test_move_notation(self):
+        """Test every move survives move_name and parse_move, and bad text is rejected."""
+        for move in range(state.NUM_MOVES):
+            self.assertEqual(state.parse_move(state.move_name(move)), move)
+            self.assertEqual(state.parse_move(str(move)), move)
+        self.assertEqual(state.move_name(state.encode_move(state.SUPPLY_BASE + 2, 4)), 'L@1,1')
+        for text in ('', '@1,1', 'X@1,1', 'L@3,0', '0,0>', '0,0>2', str(state.NUM_MOVES)):
+            with self.assertRaises(ValueError):
+                state.parse_move(text)
+
+    def test_matches_game_rules(self):
+        """Test legal moves and their results agree with Game on random games."""
+        rng = random.Random(7)
+        for _ in range(30):
+            game = Game()
+            for _ in range(40):
+                board, side = state.encode_game(game)
+                legal = state.legal_moves(board, side)
+                for move in range(state.NUM_MOVES):
+                    self.assertEqual(state.is_legal(board, side, move), move in legal)
+                for move in legal:
+                    trial = copy.deepcopy(game)
+                    self.assertTrue(trial.make_move(**state.move_to_kwargs(trial, move)))
+                    child, winner = state.apply_move(board, side, move)
+                    self.assertEqual(state.encode_game(trial)[0], child)
+                    expected = state.COLOR_CODES[trial.winner] if trial.winner else 0
+                    self.assertEqual(winner, expected)
+                    self.assertEqual(trial.game_over, bool(winner))
+                game.make_move(**state.move_to_kwargs(game, rng.choice(legal)))
+                if game.game_over:
+                    break
+
+if __name__ == '__main__':
+    unittest.main()
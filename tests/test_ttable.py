@@ -0,0 +1,88 @@
+import unittest
+from src.game.ttable import (
+    SharedTranspositionTable, TranspositionTable, pack_entry, unpack_entry
+)
+from src.game.search import Searcher, EXACT, LOWER
+
+class TestTranspositionTable(unittest.TestCase):
+    """Test cases for the bounded transposition table."""
+
+    def setUp(self):
+        """Set up a small table before each test."""
+        self.table = TranspositionTable(capacity=64)
+
+    def test_pack_round_trip(self):
+        """Test entry fields survive packing, including negative scores and no move."""
+        for fields in [(0, 0, 0, 0, 0), (12, -999, 2, 107, 255), (255, 32767, 3, None, 1)]:
+            self.assertEqual(unpack_entry(pack_entry(*fields)), fields)
+
+    def test_store_and_probe(self):
+        """Test a stored entry is found and misses are counted."""
+        self.assertIsNone(self.table.probe(12345))
+        self.table.store(12345, 4, -17, LOWER, 42)
+        self.assertEqual(self.table.probe(12345), (4, -17, LOWER, 42))
+        self.assertEqual((self.table.hits, self.table.misses), (1, 1))
+        self.assertEqual(self.table.hit_rate, 0.5)
+
+    def test_capacity_is_fixed(self):
+        """Test storing far more positions than slots never grows the table."""
+        for key in range(10000):
+            self.table.store(key, key % 7, 0, EXACT, None)
+        self.assertEqual(self.table.capacity, 64)
+        self.assertEqual(len(self.table.keys), 64)
+        self.assertLessEqual(len(self.table), 64)
+        self.assertGreater(self.table.evictions, 0)
+
+    def test_deep_entry_survives_shallow_flood(self):
+        """Test a deep result from the current search is not evicted by shallow ones."""
+        self.table.new_search()
+        self.table.store(7, 9, 5, EXACT, 3)
+        for key in range(8, 5000):
+            self.table.store(key, 1, 0, EXACT, None)
+        self.assertEqual(self.table.probe(7), (9, 5, EXACT, 3))
+
+    def test_old_generation_is_replaced(self):
+        """Test deep entries from an earlier search give way to new results."""
+        table = TranspositionTable(capacity=2)
+        table.store(1, 9, 0, EXACT, None)
+        table.new_search()
+        table.store(2, 1, 0, EXACT, None)
+        table.store(3, 1, 0, EXACT, None)
+        self.assertIsNone(table.probe(1))
+
+    def test_searcher_with_tiny_table(self):
+        """Test search stays correct when the table is far too small."""
+        small = Searcher(table=TranspositionTable(capacity=16)).search(0, 0, max_depth=3)
+        large = Searcher().search(0, 0, max_depth=3)
+        self.assertEqual(small.score, large.score)
+
+    def test_shared_table_is_seen_by_attached_tables(self):
+        """Test a table attached by name sees and overwrites the creator's entries."""
+        table = SharedTranspositionTable(64)
+        other = SharedTranspositionTable(64, name=table.name)
+        try:
+            table.store(12345, 4, -17, LOWER, 42)
+            self.assertEqual(other.probe(12345), (4, -17, LOWER, 42))
+            other.store(12345, 5, 3, EXACT, 7)
+            self.assertEqual(table.probe(12345), (5, 3, EXACT, 7))
+            self.assertEqual(len(table), 1)
+            other.clear()
+            self.assertIsNone(table.probe(12345))
+        finally:
+            other.close()
+            table.close()
+
+    def test_shared_table_rejects_torn_entries(self):
+        """Test a key paired with another store's data reads as a miss."""
+        table = SharedTranspositionTable(64)
+        try:
+            table.store(12345, 4, -17, LOWER, 42)
+            slot = table._slot(12345)   # pylint: disable=protected-access
+            table.data[slot] = pack_entry(9, 100, EXACT, 3, table.age)
+            self.assertIsNone(table.probe(12345))
+        finally:
+            table.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
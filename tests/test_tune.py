@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+from src.game.evaluate import TableEvaluator, features
+from src.game.records import self_play
+from src.game.tune import feature_matrix, fit_least_squares, fit_logistic, load_positions, tune
+
+
+class TestTune(unittest.TestCase):
+    """Test cases for the evaluator tuning pipeline."""
+
+    def setUp(self):
+        """Label the positions of some random games."""
+        self.boards, self.sides, self.wins = load_positions(self_play(300, seed=8))
+
+    def test_feature_matrix_matches_features(self):
+        """Test the vectorized features equal the reference ones row by row."""
+        matrix = feature_matrix(self.boards[:200], self.sides[:200])
+        expected = [features(int(board), int(side))
+                    for board, side in zip(self.boards[:200], self.sides[:200])]
+        np.testing.assert_array_equal(matrix, np.array(expected))
+
+    def test_fits_recover_a_planted_rule(self):
+        """Test both fits find the weight that decides synthetic outcomes."""
+        rng = np.random.default_rng(0)
+        matrix = rng.normal(size=(2000, 4))
+        wins = (matrix[:, 2] > 0).astype(np.float64)
+        for fit in (fit_logistic, fit_least_squares):
+            weights = fit(matrix, wins, 1.0)
+            self.assertEqual(int(np.argmax(np.abs(weights))), 2)
+            self.assertGreater(weights[2], 0)
+
+    def test_tuned_weights_beat_chance(self):
+        """Test tuned weights fit outcomes better than a coin and load into the evaluator."""
+        weights, reports = tune(self.boards, self.sides, self.wins, holdout=0.2)
+        self.assertLess(reports['train']['log_loss'], np.log(2))
+        self.assertGreater(reports['train']['accuracy'], 0.5)
+        evaluator = TableEvaluator(weights)
+        self.assertIsInstance(evaluator(int(self.boards[0]), int(self.sides[0])), int)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import numpy as np
+from src.game import state
+from src.game.vecenv import VectorEnv, ShardedVectorEnv, OBS_PLANES
+
+class TestVectorEnv(unittest.TestCase):
+    """Test cases for the vectorized training environment."""
+
+    def setUp(self):
+        """Set up a small batch of games."""
+        self.env = VectorEnv(16, max_steps=30)
+        self.rng = np.random.default_rng(3)
+
+    def _random_legal(self, mask):
+        """Pick a random legal action per game."""
+        return np.array([self.rng.choice(np.flatnonzero(row)) for row in mask])
+
+    def test_reset(self):
+        """Test reset gives empty boards, full masks for placements only."""
+        obs, info = self.env.reset()
+        self.assertEqual(obs.shape, (16, OBS_PLANES, 3, 3))
+        self.assertFalse(obs.any())
+        self.assertTrue((info['action_mask'].sum(axis=1) == 27).all())
+
+    def test_matches_reference_rules(self):
+        """Test masks, next positions and winners agree with game.state on random play."""
+        _, info = self.env.reset()
+        for _ in range(60):
+            boards = [state.pack(row) for row in self.env.cells.tolist()]
+            sides = self.env.side.tolist()
+            for board, side, mask in zip(boards, sides, info['action_mask']):
+                self.assertEqual(sorted(np.flatnonzero(mask)), sorted(state.legal_moves(board, side)))
+
+            actions = self._random_legal(info['action_mask'])
+            _, rewards, terminated, truncated, info = self.env.step(actions)
+            for i, (board, side) in enumerate(zip(boards, sides)):
+                child, winner = state.apply_move(board, side, int(actions[i]))
+                self.assertEqual(info['winner'][i], winner)
+                self.assertEqual(terminated[i], bool(winner))
+                if winner:
+                    self.assertEqual(rewards[i], 1.0 if winner == side + 1 else -1.0)
+                elif not truncated[i]:
+                    self.assertEqual(state.pack(self.env.cells[i].tolist()), child)
+                    self.assertEqual(self.env.side[i], 1 - side)
+
+    def test_illegal_action_loses_and_resets(self):
+        """Test an illegal action ends that game only, as a loss."""
+        self.env.reset()
+        actions = np.full(16, state.encode_move(state.SUPPLY_BASE + 2, 4))
+        actions[0] = state.encode_move(0, 1)  # nothing to move yet
+        obs, rewards, terminated, _, info = self.env.step(actions)
+        self.assertTrue(info['illegal'][0])
+        self.assertEqual(rewards[0], -1.0)
+        self.assertTrue(terminated[0])
+        self.assertFalse(obs[0].any())  # auto-reset
+        self.assertFalse(terminated[1:].any())
+        self.assertEqual(self.env.side[1], 1)
+
+    def test_truncation(self):
+        """Test looping games are cut off at max_steps."""
+        env = VectorEnv(1, max_steps=4)
+        env.reset()
+        moves = [state.encode_move(state.SUPPLY_BASE + 2, 0), state.encode_move(state.SUPPLY_BASE + 2, 8),
+                 state.encode_move(0, 1), state.encode_move(8, 7)]
+        for move in moves:
+            _, _, terminated, truncated, _ = env.step([move])
+        self.assertFalse(terminated[0])
+        self.assertTrue(truncated[0])
+        self.assertEqual(env.steps[0], 0)
+
+    def test_sharded_matches_single_process(self):
+        """Test the subprocess backend returns the same results as one VectorEnv."""
+        sharded = ShardedVectorEnv(16, num_workers=3, max_steps=30)
+        try:
+            _, info = self.env.reset()
+            _, sharded_info = sharded.reset()
+            for _ in range(20):
+                np.testing.assert_array_equal(info['action_mask'], sharded_info['action_mask'])
+                actions = self._random_legal(info['action_mask'])
+                single = self.env.step(actions)
+                split = sharded.step(actions)
+                for expected, actual in zip(single[:4], split[:4]):
+                    np.testing.assert_array_equal(expected, actual)
+                info, sharded_info = single[4], split[4]
+        finally:
+            sharded.close()
+
+if __name__ == '__main__':
+    unittest.main()
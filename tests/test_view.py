@@ -0,0 +1,113 @@
+import itertools
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+# pylint: disable=wrong-import-position
+from game.piece import Piece, Size
+from ui.constants import PLAYER1_PIECES_POSITION, PLAYER2_PIECES_POSITION
+from ui.view import View, supply_slot
+# pylint: enable=wrong-import-position
+
+SIZES = ((800, 600), (1024, 768), (500, 700), (1600, 500))
+SUPPLY = [Piece(size, 'red') for size in (Size.LARGE, Size.LARGE, Size.MEDIUM, Size.MEDIUM,
+                                          Size.SMALL, Size.SMALL)]
+
+
+def _views():
+    """A view for every combination of window size, rotation, zoom and game size."""
+    for size, rotation, zoom, scale in itertools.product(SIZES, range(4), (-5, 0, 3),
+                                                         (-5, 0, 10)):
+        view = View(size)
+        view.rotate(rotation)
+        view.zoom_by(zoom)
+        view.scale_by(scale)
+        yield view
+
+
+class TestView(unittest.TestCase):
+    """Test cases for the view transform and its inverse hit testing."""
+
+    def test_cell_centers_round_trip(self):
+        """Test the centre of every drawn cell hit-tests back to that cell."""
+        for view in _views():
+            for idx, rect in enumerate(view.cell_rects):
+                with self.subTest(size=view.size, rotation=view.rotation, zoom=view.zoom,
+                                  scale=view.scale, cell=idx):
+                    self.assertEqual(view.cell_at(rect.center), divmod(idx, 3))
+
+    def test_every_drawn_pixel_hits_its_cell(self):
+        """Test hit testing agrees with the rounded cell rectangles up to their edges."""
+        for view in _views():
+            for idx, rect in enumerate(view.cell_rects):
+                corners = (rect.topleft, (rect.right - 1, rect.top),
+                           (rect.left, rect.bottom - 1), (rect.right - 1, rect.bottom - 1))
+                for corner in corners:
+                    self.assertEqual(view.cell_at(corner), divmod(idx, 3))
+
+    def test_rotation_moves_cells_clockwise(self):
+        """Test a quarter turn draws the top-left cell where the top-right one was."""
+        view = View()
+        top_right = view.cell_rect(0, 2)
+        view.rotate(1)
+        self.assertEqual(view.cell_rect(0, 0), top_right)
+        view.rotate(-1)
+        self.assertEqual(view.rotation, 0)
+
+    def test_off_board_is_none(self):
+        """Test positions outside the board hit no cell."""
+        for view in _views():
+            left, top = view.board_rect.topleft
+            self.assertIsNone(view.cell_at((left - 1, top)))
+            right, bottom = view.board_rect.bottomright
+            self.assertIsNone(view.cell_at((right + view.cell_size, bottom)))
+
+    def test_supply_pieces_round_trip(self):
+        """Test the centre of every supply piece hit-tests back to that piece."""
+        for view in _views():
+            for position in (PLAYER1_PIECES_POSITION, PLAYER2_PIECES_POSITION):
+                for idx in range(len(SUPPLY)):
+                    centre = view.to_screen(supply_slot(position, idx))
+                    with self.subTest(size=view.size, scale=view.scale, idx=idx):
+                        self.assertEqual(view.supply_piece_at(centre, position, SUPPLY), idx)
+            self.assertIsNone(view.supply_piece_at((0, 0), PLAYER1_PIECES_POSITION, SUPPLY))
+
+    def test_layout_round_trip(self):
+        """Test screen and layout coordinates convert back within a pixel."""
+        for view in _views():
+            for point in ((0, 0), (400, 300), (800, 600), (123, 456)):
+                back = view.to_layout(view.to_screen(point))
+                self.assertLessEqual(abs(back[0] - point[0]) * view.unit, 0.5 + 1e-9)
+                self.assertLessEqual(abs(back[1] - point[1]) * view.unit, 0.5 + 1e-9)
+
+    def test_changes_bump_version(self):
+        """Test every change bumps the version and resizing refits the layout."""
+        view = View()
+        versions = [view.version]
+        view.resize((1600, 1200))
+        versions.append(view.version)
+        self.assertEqual(view.unit, 2.0)
+        self.assertEqual(view.board_rect.size, (600, 600))
+        view.zoom_by(1)
+        versions.append(view.version)
+        view.scale_by(-1)
+        versions.append(view.version)
+        view.rotate(1)
+        versions.append(view.version)
+        self.assertEqual(len(set(versions)), len(versions))
+        self.assertEqual(versions, sorted(versions))
+
+    def test_zoom_and_scale_are_clamped(self):
+        """Test zoom and game size stay within their ranges."""
+        view = View()
+        view.zoom_by(100)
+        view.scale_by(-100)
+        self.assertEqual((view.zoom, view.scale), (1.3, 0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()